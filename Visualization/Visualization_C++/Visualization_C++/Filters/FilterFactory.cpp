@@ -78,6 +78,39 @@ bool FilterFactory::isFinishProcess() {
 	return isFinish;
 }
 
+size_t FilterFactory::getBytesRead() {
+	return logReader->getBytesRead();
+}
+
+size_t FilterFactory::getBytesToRead() {
+	return logReader->getBytesToRead();
+}
+
+FilterMetrics FilterFactory::getMetrics() {
+	FilterMetrics metrics;
+	metrics.linesRead = logReader->getLinesRead();
+	metrics.linesParsed = logReader->getLinesParsed();
+	metrics.parseFailures = logReader->getParseFailures();
+	metrics.bytesRead = logReader->getBytesRead();
+	metrics.bytesToRead = logReader->getBytesToRead();
+	{
+		std::lock_guard<std::mutex> lock(logMutex);
+		metrics.queuedLogs = filteredLogs.size();
+	}
+	metrics.queueHighWater = queueHighWater;
+	std::chrono::nanoseconds elapsed = isFinish ? std::chrono::nanoseconds(passNanoseconds.load())
+		: std::chrono::steady_clock::now() - passStart;
+	metrics.passSeconds = std::chrono::duration<double>(elapsed).count();
+
+	// The chain is walked from the last filter added back to the reader
+	IViewPtr view = chain;
+	while (auto filter = dynamic_pointer_cast<ILogFilter>(view)) {
+		metrics.stages.insert(metrics.stages.begin(), { filter->getName(), filter->getPassed(), filter->getRejected() });
+		view = filter->getBase();
+	}
+	return metrics;
+}
+
 void FilterFactory::reset() {
 	logReader->openFile();
 
@@ -95,6 +128,9 @@ void FilterFactory::startLogs() {
 	if (filterThread.joinable()) {
 		filterThread.join();
 	}
+	queueHighWater = 0;
+	passNanoseconds = 0;
+	passStart = std::chrono::steady_clock::now();
 	try {
 		filterThread = std::thread([this]() {
 			for (auto log : chain->getNext()) {
@@ -102,10 +138,13 @@ void FilterFactory::startLogs() {
 					{
 						std::lock_guard<std::mutex> lock(logMutex);
 						filteredLogs.push(log);
+						if (filteredLogs.size() > queueHighWater.load(std::memory_order_relaxed))
+							queueHighWater.store(filteredLogs.size(), std::memory_order_relaxed);
 					}
 					logCondition.notify_one();
 				}
 			}
+			passNanoseconds = (std::chrono::steady_clock::now() - passStart).count();
 			isFinish = true;
 			});
 	}
@@ -262,6 +301,32 @@ PYBIND11_MODULE(filter_factory_module, m) {
 		.value("Unit", FilterType::Unit, "Filter based on unit identifier.")
 		.value("Area", FilterType::Area, "Filter based on area identifier.");
 
+	py::enum_<LogLevel>(m, "LogLevel")
+		.value("Info", LogLevel::Info, "Log everything, like the entry and exit of the filter functions.")
+		.value("Warning", LogLevel::Warning, "Log warnings and errors only, the default.")
+		.value("Error", LogLevel::Error, "Log errors only.")
+		.value("Off", LogLevel::Off, "Log nothing to the file.");
+
+	m.def("set_log_level", [](LogLevel level) {
+		Logger::getInstance().setLevel(level);
+		}, py::arg("level"), "Set the lowest level written to the log file of the module.");
+
+	py::class_<StageMetrics>(m, "StageMetrics")
+		.def_readonly("filter", &StageMetrics::filter)
+		.def_readonly("passed", &StageMetrics::passed)
+		.def_readonly("rejected", &StageMetrics::rejected);
+
+	py::class_<FilterMetrics>(m, "FilterMetrics")
+		.def_readonly("lines_read", &FilterMetrics::linesRead)
+		.def_readonly("lines_parsed", &FilterMetrics::linesParsed)
+		.def_readonly("parse_failures", &FilterMetrics::parseFailures)
+		.def_readonly("bytes_read", &FilterMetrics::bytesRead)
+		.def_readonly("bytes_to_read", &FilterMetrics::bytesToRead)
+		.def_readonly("queued_logs", &FilterMetrics::queuedLogs)
+		.def_readonly("queue_high_water", &FilterMetrics::queueHighWater)
+		.def_readonly("pass_seconds", &FilterMetrics::passSeconds)
+		.def_readonly("stages", &FilterMetrics::stages);
+
 	py::class_<FilterFactory>(m, "FilterFactory")
 		.def(py::init<std::string>(), py::arg("logsFileName"), "Initialize FilterFactory with the given log file name.")
 		.def("add_filter_to_chain", [](FilterFactory& self, std::pair<FilterType, Variant> filter) {
@@ -297,6 +362,9 @@ PYBIND11_MODULE(filter_factory_module, m) {
 		.def("get_log", &FilterFactory::getLog, "Get the next filtered log.")
 		.def("has_log", &FilterFactory::hasLog, "Check if there are more filtered logs.")
 		.def("is_finished_process", &FilterFactory::isFinishProcess, "Check if the process has finished")
+		.def("get_bytes_read", &FilterFactory::getBytesRead, "Bytes of the time window read so far by the current process.")
+		.def("get_bytes_to_read", &FilterFactory::getBytesToRead, "Bytes of the time window the current process reads.")
+		.def("get_metrics", &FilterFactory::getMetrics, "Counters and timers of the current process, per stage of the filter chain.")
 		.def("join_thread", &FilterFactory::joinThread, "Join the logs thread after filtering has completed.");
 }
 
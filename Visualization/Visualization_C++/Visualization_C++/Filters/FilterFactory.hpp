@@ -15,6 +15,7 @@
 #include "../Filters/Filters.hpp"
 #include "../Utilities/Logger.hpp"
 #include "../Utilities/CustomExceptions.hpp"
+#include "../Utilities/FilterMetrics.hpp"
 
 using namespace std;
 using namespace Config;
@@ -70,6 +71,19 @@ public:
 	 */
 	bool isFinishProcess();
 
+	/**
+	 * @brief Progress of the current pass, in bytes of the time window read and to read.
+	 */
+	size_t getBytesRead();
+
+	size_t getBytesToRead();
+
+	/**
+	 * @brief Counters and timers of the current pass - lines read and parsed, the logs every filter passed
+	 * and rejected, and the high-water mark of the queue of filtered logs.
+	 */
+	FilterMetrics getMetrics();
+
 	void removeFilter(FilterType);
 
 	void clearFilters();
@@ -90,6 +104,10 @@ private:
 	std::mutex logMutex;						
 	std::condition_variable logCondition;		
 
+	std::atomic<size_t> queueHighWater{ 0 };
+	std::chrono::steady_clock::time_point passStart;
+	std::atomic<long long> passNanoseconds{ 0 };	
+
 	vector<pair<FilterType, Variant>> filtersData; 
 
 	IViewPtr createFilter(FilterType, Variant&);
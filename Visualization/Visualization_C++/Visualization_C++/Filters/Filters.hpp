@@ -74,6 +74,10 @@ public:
 	bool isToTake(const Log& log) const override {
 		return find(threadIds.begin(), threadIds.end(), log.tid) != threadIds.end();
 	}
+
+	string getName() const override {
+		return Config::TID;
+	}
 };
 
 /**
@@ -96,6 +100,10 @@ public:
 	bool isToTake(const Log& log) const override {
 		return log.io == _io;
 	}
+
+	string getName() const override {
+		return Config::IO;
+	}
 };
 
 /**
@@ -121,6 +129,10 @@ public:
 			log.clusterId.die == get<1>(_quad) &&
 			log.clusterId.quad == get<2>(_quad);
 	}
+
+	string getName() const override {
+		return Config::QUAD;
+	}
 };
 
 /**
@@ -142,6 +154,10 @@ public:
 	bool isToTake(const Log& log) const override {
 		return log.unit == _unit;
 	}
+
+	string getName() const override {
+		return Config::UNIT;
+	}
 };
 
 /**
@@ -165,6 +181,10 @@ public:
 	bool isToTake(const Log& log) const override {
 		return log.clusterId == clusterId;
 	}
+
+	string getName() const override {
+		return Config::CLUSTER;
+	}
 };
 
 /**
@@ -186,4 +206,8 @@ public:
 	bool isToTake(const Log& log) const override {
 		return log.area == _area;
 	}
+
+	string getName() const override {
+		return Config::AREA;
+	}
 };
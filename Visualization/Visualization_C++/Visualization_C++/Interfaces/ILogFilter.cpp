@@ -9,10 +9,16 @@
  * @return A generator of filtered logs.
  */
 Generator<Log> ILogFilter::getNext() {
+	passed = rejected = 0;
 	while (base->isOpen())
-		for (auto log : base->getNext())
-			if (isToTake(log))
+		for (auto log : base->getNext()) {
+			bool isTaken = isToTake(log);
+			// A generator starts with an empty log, it is dropped by the factory and not counted
+			if (log.timeStamp > 0)
+				(isTaken ? passed : rejected).fetch_add(1, memory_order_relaxed);
+			if (isTaken)
 				co_yield log;
+		}
 }
 
 /**
@@ -24,4 +30,16 @@ Generator<Log> ILogFilter::getNext() {
 bool ILogFilter::isOpen() {
 	bool isBaseOpen = base->isOpen();
 	return isBaseOpen;
+}
+
+IViewPtr ILogFilter::getBase() const {
+	return base;
+}
+
+size_t ILogFilter::getPassed() const {
+	return passed;
+}
+
+size_t ILogFilter::getRejected() const {
+	return rejected;
 }
\ No newline at end of file
@@ -2,6 +2,7 @@
 #include "../Logging/LogReader.hpp"
 #include "../Utilities/Logger.hpp"
 #include <string>
+#include <atomic>
 
 /**
  * @class ILogFilter
@@ -23,6 +24,11 @@ public:
      */
     virtual bool isToTake(const Log&) const = 0;
 
+    /**
+     * @brief The name of the filter type, as in Config::filterMap.
+     */
+    virtual string getName() const = 0;
+
     /**
      * @brief Retrieves the next log that meets the filtering criteria.
      *
@@ -32,6 +38,18 @@ public:
 
     bool isOpen() override;
 
+    /**
+     * @brief The view this filter reads from, the previous filter of the chain or the reader.
+     */
+    IViewPtr getBase() const;
+
+    /**
+     * @brief Logs passed on and rejected by this filter in the current pass.
+     */
+    size_t getPassed() const;
+
+    size_t getRejected() const;
+
     void banan() {
         cout << "fdsfsd";
     }
@@ -40,4 +58,7 @@ protected:
     Logger& logger;
 
     IViewPtr base; 
+
+    atomic<size_t> passed{ 0 };
+    atomic<size_t> rejected{ 0 };
 };
@@ -17,6 +17,13 @@ Generator<Log> LogReader::getNext() {
 	Log log;
 	time_t start;
 	streampos position = logsFactory.binarySearchTimestamp(startTime);
+	streampos endPosition = logsFactory.binarySearchTimestamp(endTime);
+	if (endPosition == streampos(-1))
+		endPosition = static_cast<streamoff>(getFileSize());
+	bytesRead = 0;
+	linesRead = linesParsed = parseFailures = 0;
+	bytesToRead = endPosition > position ? static_cast<size_t>(endPosition - position) : 0;
+	openFile();
 	fileStream.seekg(position, ios::beg);
 
 	getline(fileStream, line);
@@ -25,9 +32,15 @@ Generator<Log> LogReader::getNext() {
 		co_return;
 
 	while (!line.empty() && start <= endTime) {
+		bytesRead.fetch_add(line.size() + 1, memory_order_relaxed);
+		linesRead.fetch_add(1, memory_order_relaxed);
 		if (parseCSVLine(line, log)) {
+			linesParsed.fetch_add(1, memory_order_relaxed);
 			co_yield log;
 		}
+		else {
+			parseFailures.fetch_add(1, memory_order_relaxed);
+		}
 
 		getline(fileStream, line);
 
@@ -105,6 +118,26 @@ size_t LogReader::getFileSize() {
 	return fileSize;
 }
 
+size_t LogReader::getBytesRead() {
+	return bytesRead;
+}
+
+size_t LogReader::getBytesToRead() {
+	return bytesToRead;
+}
+
+size_t LogReader::getLinesRead() {
+	return linesRead;
+}
+
+size_t LogReader::getLinesParsed() {
+	return linesParsed;
+}
+
+size_t LogReader::getParseFailures() {
+	return parseFailures;
+}
+
 bool LogReader::isOpen() {
 	return fileStream.is_open();
 }
@@ -4,6 +4,7 @@
 #include <iomanip>
 #include <unordered_map>
 #include <queue>
+#include <atomic>
 #include "../Interfaces/IView.hpp"
 #include "../Utilities/CustomExceptions.hpp"
 #include "LogsFactory.hpp"
@@ -44,6 +45,26 @@ public:
 
 	size_t getFileSize();
 
+	/**
+	* @brief Bytes of the time window read so far by the current pass.
+	* Safe to call from another thread while getNext() runs.
+	*/
+	size_t getBytesRead();
+
+	/**
+	* @brief Bytes between the first and the last log of the time window, set when a pass starts.
+	*/
+	size_t getBytesToRead();
+
+	/**
+	* @brief Lines of the time window read by the current pass, the ones parsed to logs and the ones that failed.
+	*/
+	size_t getLinesRead();
+
+	size_t getLinesParsed();
+
+	size_t getParseFailures();
+
 	bool isOpen() override;
 
 	void openFile();
@@ -56,6 +77,11 @@ protected:
 	LogsFactory logsFactory;
 	time_t startTime;       
 	time_t endTime;         
+	atomic<size_t> bytesRead{ 0 };
+	atomic<size_t> bytesToRead{ 0 };
+	atomic<size_t> linesRead{ 0 };
+	atomic<size_t> linesParsed{ 0 };
+	atomic<size_t> parseFailures{ 0 };
 
 	/**
 	* @brief Parses a line from the CSV file and fills a Log object.
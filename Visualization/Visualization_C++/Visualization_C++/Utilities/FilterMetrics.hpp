@@ -0,0 +1,33 @@
+#pragma once
+#include <string>
+#include <vector>
+
+using namespace std;
+
+/**
+ * @struct StageMetrics
+ * @brief The logs a filter of the chain passed on and rejected in the current pass.
+ */
+struct StageMetrics {
+	string filter;
+	size_t passed = 0;
+	size_t rejected = 0;
+};
+
+/**
+ * @struct FilterMetrics
+ * @brief Counters and timers of the current pass of the filter chain, a snapshot taken while it runs or after.
+ *
+ * The stages are in the order the filters were added, the first one sees the parsed lines of the reader.
+ */
+struct FilterMetrics {
+	size_t linesRead = 0;
+	size_t linesParsed = 0;
+	size_t parseFailures = 0;
+	size_t bytesRead = 0;
+	size_t bytesToRead = 0;
+	size_t queuedLogs = 0;
+	size_t queueHighWater = 0;
+	double passSeconds = 0;
+	vector<StageMetrics> stages;
+};
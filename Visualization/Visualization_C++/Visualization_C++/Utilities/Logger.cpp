@@ -20,6 +20,7 @@ Logger::Logger() {
     currentLogFileSize = 0;
     maxLogFileSize = 4000;
     maxLogFiles = 3;
+    minLevel = LogLevel::Warning;
 }
 
 /**
@@ -32,6 +33,18 @@ Logger& Logger::getInstance() {
     return loggerInstance;
 }
 
+void Logger::setLevel(LogLevel level) {
+    minLevel = level;
+}
+
+LogLevel Logger::getLevel() const {
+    return minLevel;
+}
+
+bool Logger::isEnabled(LogLevel level) const {
+    return level >= minLevel.load(std::memory_order_relaxed);
+}
+
 void Logger::logToFile(const std::string& message, const std::string& level, const std::vector<std::string>& params) {
     std::ofstream file(logFilePath, std::ios_base::app);
     if (file.is_open()) {
@@ -50,15 +63,18 @@ void Logger::logToFile(const std::string& message, const std::string& level, con
 }
 
 void Logger::logMessageToFile(const std::string& message, const std::vector<std::string>& params) {
-    logToFile(message, "INFO", params);
+    if (isEnabled(LogLevel::Info))
+        logToFile(message, "INFO", params);
 }
 
 void Logger::logErrorToFile(const std::string& message, const std::vector<std::string>& params) {
-    logToFile(message, "ERROR", params);
+    if (isEnabled(LogLevel::Error))
+        logToFile(message, "ERROR", params);
 }
 
 void Logger::logWarningToFile(const std::string& message, const std::vector<std::string>& params) {
-    logToFile(message, "WARNING", params);
+    if (isEnabled(LogLevel::Warning))
+        logToFile(message, "WARNING", params);
 }
 
 void Logger::logToConsole(const std::string& message, const std::string& level, const std::vector<std::string>& params) {
@@ -8,8 +8,20 @@
 #include <iostream>
 #include <chrono>
 #include <ctime>
+#include <atomic>
 #include "../Utilities/CustomExceptions.hpp"
 
+/**
+ * @enum LogLevel
+ * @brief The levels of the messages, a message below the level of the logger is dropped before it is formatted.
+ */
+enum class LogLevel {
+    Info,
+    Warning,
+    Error,
+    Off
+};
+
 /**
  * @class Logger
  * @brief A singleton class for logging messages to files and the console.
@@ -42,6 +54,16 @@ public:
     * @brief Rotates the log files when the current log file exceeds the size limit.
     */
     void rotateLogFile();
+
+    /**
+    * @brief Sets the lowest level that is logged. Warning by default, so the INFO messages of hot paths
+    * like createFilter and joinThread cost a comparison instead of opening the log file.
+    */
+    void setLevel(LogLevel level);
+
+    LogLevel getLevel() const;
+
+    bool isEnabled(LogLevel level) const;
 private:
 
     Logger();
@@ -78,6 +100,7 @@ private:
     int currentLogFileSize;         ///< Current size of the log file in bytes.
     int maxLogFileSize;             ///< Maximum size of the log file in bytes before rotation.
     int maxLogFiles;                ///< Maximum number of log files to retain.
+    std::atomic<LogLevel> minLevel; ///< Messages below this level are dropped.
 };
 
 #endif
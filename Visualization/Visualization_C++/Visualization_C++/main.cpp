@@ -12,6 +12,8 @@ using namespace LogsGenerator;
 int main(int argc, char** argv)
 {
 	Logger& logger = Logger::getInstance();
+	// The CLI keeps its trace of the run in the log file
+	logger.setLevel(LogLevel::Info);
 	try
 	{
 		logger.logMessageToFile("main is starting");
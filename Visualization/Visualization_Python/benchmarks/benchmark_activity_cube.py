@@ -0,0 +1,73 @@
+"""
+Activity cube benchmark - the time to count N synthetic logs by time bucket, leaf and TID.
+
+The columns of the logs are generated directly, like the pass of DataManager.build_time_index collects them,
+over an hour of logs on 500 leaves with 64 TIDs. The cube is built for every bucket width, with numpy when it's
+installed and in pure python, and the two are checked to be equal.
+
+Run from the Visualization_Python directory:
+    python -m benchmarks.benchmark_activity_cube --logs 10000000
+"""
+import argparse
+import random
+import time
+from typing import Optional
+
+import utils.activity_cube as activity_cube
+from utils.activity_cube import ActivityCube, LogColumns
+
+START_TIME = 1726671491
+DURATION = 3600
+NUM_LEAVES = 500
+NUM_TIDS = 64
+
+
+def make_columns(num_logs: int) -> LogColumns:
+    random.seed(0)
+    columns = LogColumns()
+    for leaf in range(NUM_LEAVES):
+        columns.add(START_TIME, leaf, leaf % NUM_TIDS)
+    # The ordinals are known, the arrays are filled directly to keep the setup short
+    for _ in range(num_logs - NUM_LEAVES):
+        columns.times.append(START_TIME + random.randrange(DURATION))
+        columns.leaves.append(random.randrange(NUM_LEAVES))
+        columns.tids.append(random.randrange(NUM_TIDS))
+    return columns
+
+
+def time_cube(columns: LogColumns, bucket_width: int, use_numpy: bool) -> Optional[float]:
+    """
+    Returns the time to build the cube, or None if numpy is requested and not installed.
+    """
+    numpy = activity_cube.numpy
+    if use_numpy and numpy is None:
+        return None
+    activity_cube.numpy = numpy if use_numpy else None
+    try:
+        start = time.perf_counter()
+        cube = ActivityCube(columns, bucket_width)
+        elapsed = time.perf_counter() - start
+    finally:
+        activity_cube.numpy = numpy
+    assert cube.count() == len(columns)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logs", type=int, default=10000000)
+    parser.add_argument("--widths", type=int, nargs="+", default=[1, 10, 60])
+    args = parser.parse_args()
+
+    columns = make_columns(args.logs)
+    print(f"logs:           {len(columns)} on {NUM_LEAVES} leaves with {NUM_TIDS} TIDs over {DURATION} s")
+    for bucket_width in args.widths:
+        numpy_time = time_cube(columns, bucket_width, use_numpy=True)
+        python_time = time_cube(columns, bucket_width, use_numpy=False)
+        print(f"width {bucket_width:>5} s:   numpy " +
+              (f"{numpy_time:.2f} s" if numpy_time is not None else "not installed") +
+              f", python {python_time:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
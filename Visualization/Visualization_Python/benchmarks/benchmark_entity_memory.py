@@ -0,0 +1,105 @@
+"""
+Memory benchmark of the entity tree on a scaled chip description.
+
+The dies of the chip description are replicated up to the requested number of dies,
+the whole tree is built (every quad and cluster is loaded), then the json is released
+and the memory still held by the tree - including any json it references - is measured.
+
+Run from the Visualization_Python directory:
+    python -m benchmarks.benchmark_entity_memory --dies 16
+"""
+import argparse
+import copy
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from entities.die import Die
+from entities.host_interface import HostInterface
+
+from utils.constants import TOP, DIES, ID, READ
+from utils.paths import CHIP_DATA_JSON
+from utils.type_names import HOST_INTERFACE
+
+
+def scale_chip_data(chip_data: Dict[str, Any], num_dies: int) -> Dict[str, Any]:
+    """
+    Returns a chip description with num_dies dies, copied round robin from the dies of chip_data.
+    """
+    dies = chip_data[TOP][DIES]
+    scaled = copy.deepcopy(chip_data)
+    scaled[TOP][DIES] = []
+    for index in range(num_dies):
+        die_data = copy.deepcopy(dies[index % len(dies)])
+        die_data[ID] = index
+        scaled[TOP][DIES].append(die_data)
+    return scaled
+
+
+def build_tree(chip_data: Dict[str, Any]) -> List[Any]:
+    """
+    Builds the host interface and all the dies, with every quad and cluster loaded.
+    """
+    tree = [HostInterface(chip_data[TOP][HOST_INTERFACE])]
+    for die_data in chip_data[TOP][DIES]:
+        die = Die(die_data.get(ID), die_data)
+        for row in die.quads:
+            for quad in row:
+                if quad:
+                    quad.clusters
+        tree.append(die)
+    return tree
+
+
+def count_objects(tree: List[Any]) -> int:
+    count = 0
+    for node in tree:
+        count += 1
+        if isinstance(node, HostInterface):
+            count += 2 + len(node.get_all_inner_details())
+            continue
+        for row in node.quads:
+            for quad in (quad for quad in row if quad):
+                count += 2  # The quad and its hbm
+                for cluster in (cluster for row in quad.clusters for cluster in row if cluster):
+                    count += 1 + len(cluster.get_all_inner_details())
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dies", type=int, default=16, help="number of dies in the scaled chip")
+    parser.add_argument("--chip-file", default=CHIP_DATA_JSON)
+    args = parser.parse_args()
+
+    # The json is traced too, so the parts of it that the tree keeps alive are counted
+    tracemalloc.start()
+    with open(args.chip_file, READ) as config:
+        chip_data = scale_chip_data(json.load(config), args.dies)
+    gc.collect()
+    json_size, _ = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    tree = build_tree(chip_data)
+    build_time = time.perf_counter() - start
+    with_json, peak = tracemalloc.get_traced_memory()
+
+    del chip_data
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    num_objects = count_objects(tree)
+    print(f"dies:                  {args.dies}")
+    print(f"entity objects:        {num_objects}")
+    print(f"build time:            {build_time * 1000:.1f} ms")
+    print(f"chip json:             {json_size / 1024:.1f} KiB")
+    print(f"tree and json:         {with_json / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)")
+    print(f"retained by the tree:  {retained / 1024:.1f} KiB after releasing the json")
+    print(f"bytes per object:      {retained / num_objects:.1f}")
+
+
+if __name__ == '__main__':
+    main()
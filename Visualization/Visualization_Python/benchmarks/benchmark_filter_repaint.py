@@ -0,0 +1,107 @@
+"""
+Post-filter repaint benchmark - the time from the end of a filter to the main window drawn again.
+
+A system of N chips with M dies is built like in the scaling benchmark, and synthetic logs are linked to it.
+Each run links again the logs of a random part of the TIDs, like a TID filter, and measures the update of the
+navbar and of the view shown - a die view, the chip canvas and no view - drawn offscreen. The link pass itself
+is left out, it is measured by the scaling benchmark. Requires PyQt5.
+
+Run from the Visualization_Python directory:
+    python -m benchmarks.benchmark_filter_repaint --chips 2 --dies 4 --logs 100000 --runs 10
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import List, Optional
+
+from benchmarks.benchmark_scaled_chip import scale_system, get_all_cluster_ids, make_logs, time_load
+from utils.data_manager import DataManager
+from utils.topology import Topology
+from utils.paths import CHIP_DATA_JSON
+from utils.constants import TOP, DIES, ENABLED_CLUSTERS, READ
+
+NUM_TIDS = 64
+
+
+def link_tids(data_manager: DataManager, logs: list, tids: set) -> None:
+    data_manager.clean_the_prev_logs_from_leaf_objects()
+    for log in logs:
+        if log.tid in tids:
+            data_manager.link_the_log_to_leaf_object(log, keep_log=False)
+    data_manager.topology.rollup()
+
+
+def time_repaint(data_manager: DataManager, logs: list, runs: int) -> Optional[dict]:
+    """
+    Returns the times of the repaint after a filter by the view shown, or None if PyQt5 is not installed.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from gui.main_window import MainWindow
+    except ImportError:
+        return None
+    app = QApplication.instance() or QApplication([])
+    window = MainWindow(data_manager)
+    window.resize(1200, 900)
+    window.show()
+    app.processEvents()
+
+    views = {"navbar": window.clear_content, "die view": lambda: window.show_die(0),
+             "chip canvas": window.show_chip_canvas}
+    random.seed(0)
+    times = {}
+    for view, show_view in views.items():
+        show_view()
+        app.processEvents()
+        view_times: List[float] = []
+        for _ in range(runs):
+            link_tids(data_manager, logs, set(random.sample(range(1, NUM_TIDS + 1), NUM_TIDS // 4)))
+            start = time.perf_counter()
+            window.on_action_finished()
+            window.grab()
+            app.processEvents()
+            view_times.append(time.perf_counter() - start)
+        times[view] = view_times
+    window.close()
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chips", type=int, default=2)
+    parser.add_argument("--dies", type=int, default=4, help="number of dies of each chip")
+    parser.add_argument("--logs", type=int, default=100000, help="number of synthetic logs to link")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with open(CHIP_DATA_JSON, READ) as config:
+        chip_data = scale_system(json.load(config), args.chips, args.dies)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        chip_file = os.path.join(temp_dir, "chip_data.json")
+        sl_file = os.path.join(temp_dir, "sl.json")
+        with open(chip_file, 'w') as file:
+            json.dump(chip_data, file)
+        with open(sl_file, 'w') as file:
+            json.dump({ENABLED_CLUSTERS: get_all_cluster_ids(Topology(chip_data[TOP][DIES]))}, file)
+
+        data_manager, _ = time_load(chip_file, sl_file)
+        logs = make_logs(data_manager, args.logs)
+        link_tids(data_manager, logs, set(range(1, NUM_TIDS + 1)))
+        times = time_repaint(data_manager, logs, args.runs)
+
+    if times is None:
+        print("repaint:        skipped, PyQt5 is not installed")
+        return
+    print(f"dies:           {data_manager.dimensions.num_dies}, {len(logs)} logs, {args.runs} filters per view")
+    for view, view_times in times.items():
+        print(f"{view + ':':<16}median {statistics.median(view_times) * 1000:.1f} ms, "
+              f"max {max(view_times) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+Scaling benchmark - load, link and render time of a system of N chips with M dies each.
+
+The dies of chip_data.json are replicated to every die of every chip, and an sl file that enables every
+cluster is written next to it. Load is the DataManager creation and the loading of all the dies. Link is
+the link pass of synthetic logs spread evenly over the clusters and hbms of all the dies, which exercises
+the routing by (chip, die) and the rollup. Render is the die view of every die, drawn offscreen when
+PyQt5 is installed.
+
+Run from the Visualization_Python directory:
+    python -m benchmarks.benchmark_scaled_chip --chips 4 --dies 8 --logs 200000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from benchmarks.benchmark_entity_memory import scale_chip_data
+from utils.data_manager import DataManager
+from utils.topology import Topology, CLUSTER_NODE
+from utils.topology_cache import get_cache_dir, get_cache_path, get_content_key
+from utils.paths import CHIP_DATA_JSON, LOGS_CSV
+from utils.constants import TOP, DIES, ID, CHIP, ENABLED_CLUSTERS, DID, ROW, COL, READ
+from utils.type_names import QUAD, HBM, EQ, ECORE, IQR, IQD, FCB0, LCB1, MEP0, MCU_GATE_0, MEM_0, ECORE_REQ_CIP
+
+# Areas of the die and units of their leaves the synthetic logs are picked from
+LOG_AREAS = [(MCU_GATE_0, [IQR, IQD, f"{EQ};1"]), (MEM_0, [FCB0, LCB1, MEP0]), (ECORE_REQ_CIP, [f"{ECORE};2"]),
+             (HBM, [HBM])]
+
+
+def scale_system(chip_data: Dict[str, Any], num_chips: int, dies_per_chip: int) -> Dict[str, Any]:
+    """
+    Returns a description of num_chips chips with dies_per_chip dies each, copied from the dies of chip_data.
+    """
+    scaled = scale_chip_data(chip_data, num_chips * dies_per_chip)
+    for index, die_data in enumerate(scaled[TOP][DIES]):
+        die_data[CHIP], die_data[ID] = divmod(index, dies_per_chip)
+    return scaled
+
+
+def get_all_cluster_ids(topology: Topology) -> List[Dict[str, Any]]:
+    """
+    Returns the ids of all the clusters in the format of the enabled_clusters of sl.json
+    """
+    cluster_ids = []
+    for node in range(len(topology)):
+        if topology.node_type[node] == CLUSTER_NODE:
+            die, quad, row, col = topology.get_address(node)
+            chip, die_id = topology.dimensions.die_addresses[die]
+            cluster_ids.append({ID: {CHIP: chip, DID: die_id, QUAD: quad, ROW: row, COL: col}})
+    return cluster_ids
+
+
+def make_logs(data_manager: DataManager, num_logs: int) -> List[SimpleNamespace]:
+    """
+    Returns logs spread evenly over the clusters of all the dies, addressed by chip and die like the log file.
+    """
+    topology = data_manager.topology
+    clusters = [node for node in range(len(topology)) if topology.node_type[node] == CLUSTER_NODE]
+    random.seed(0)
+    logs = []
+    for _ in range(num_logs):
+        die, quad, row, col = topology.get_address(random.choice(clusters))
+        chip, die_id = data_manager.dimensions.die_addresses[die]
+        area, units = random.choice(LOG_AREAS)
+        cluster_id = SimpleNamespace(chip=chip, die=die_id, quad=quad, row=row, col=col)
+        logs.append(SimpleNamespace(area=area, unit=random.choice(units), tid=random.randint(1, 64),
+                                    clusterId=cluster_id))
+    return logs
+
+
+def time_load(chip_file: str, sl_file: str) -> Any:
+    start = time.perf_counter()
+    data_manager = DataManager(chip_file, sl_file, LOGS_CSV)
+    # The link pass of the log file is left out, the synthetic logs are linked on their own
+    data_manager.link_the_logs_to_leaf_objects = lambda: None
+    for die_index in range(data_manager.topology.num_dies):
+        data_manager.load_die(die_index)
+    return data_manager, time.perf_counter() - start
+
+
+def time_link(data_manager: DataManager, logs: List[SimpleNamespace]) -> float:
+    start = time.perf_counter()
+    data_manager.clean_the_prev_logs_from_leaf_objects()
+    for log in logs:
+        data_manager.link_the_log_to_leaf_object(log, keep_log=False)
+    data_manager.topology.rollup()
+    return time.perf_counter() - start
+
+
+def time_render(data_manager: DataManager) -> Any:
+    """
+    Returns the time to draw the die view of every die, or None if PyQt5 is not installed.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from gui.die_widget import DieWidget
+    except ImportError:
+        return None
+    app = QApplication.instance() or QApplication([])
+    die_widget = DieWidget(data_manager, data_manager.die_objects, None)
+    die_widget.resize(1200, 900)
+    start = time.perf_counter()
+    for die_index in data_manager.die_objects:
+        die_widget.show_quads(die_index)
+        die_widget.grab()
+        app.processEvents()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chips", type=int, default=4)
+    parser.add_argument("--dies", type=int, default=8, help="number of dies of each chip")
+    parser.add_argument("--logs", type=int, default=200000, help="number of synthetic logs to link")
+    parser.add_argument("--no-render", action="store_true", help="skip the render time")
+    args = parser.parse_args()
+
+    with open(CHIP_DATA_JSON, READ) as config:
+        chip_data = scale_system(json.load(config), args.chips, args.dies)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        chip_file = os.path.join(temp_dir, "chip_data.json")
+        sl_file = os.path.join(temp_dir, "sl.json")
+        with open(chip_file, 'w') as file:
+            json.dump(chip_data, file)
+
+        with open(sl_file, 'w') as file:
+            json.dump({ENABLED_CLUSTERS: get_all_cluster_ids(Topology(chip_data[TOP][DIES]))}, file)
+
+        # The load is measured without the topology cache
+        cache_path = get_cache_path(get_content_key(chip_file, sl_file), get_cache_dir(chip_file))
+        try:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            data_manager, load_time = time_load(chip_file, sl_file)
+        finally:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+        logs = make_logs(data_manager, args.logs)
+        link_time = time_link(data_manager, logs)
+        render_time = None if args.no_render else time_render(data_manager)
+
+    dimensions = data_manager.dimensions
+    die_nodes = [data_manager.topology.get_die_node(die) for die in range(dimensions.num_dies)]
+    linked = sum(data_manager.topology.counts[node] for node in die_nodes)
+    print(f"chips x dies:   {dimensions.num_chips} x {args.dies} ({dimensions.num_dies} dies, "
+          f"{len(data_manager.topology)} nodes)")
+    print(f"load:           {load_time * 1000:.1f} ms")
+    print(f"link:           {link_time * 1000:.1f} ms for {len(logs)} logs, {linked} counted in the dies "
+          f"({len(logs) / link_time:.0f} logs/s)")
+    print("render:         " + (f"{render_time * 1000:.1f} ms for {dimensions.num_dies} die views"
+                                if render_time is not None else "skipped"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Startup benchmark - cold start (no topology cache) against warm start (cache of the same json files).
+
+Each run creates a DataManager and loads all the dies, which links the logs. The topology time is the
+DataManager creation and the loading of the dies without the link pass, which is measured on its own.
+
+Run from the Visualization_Python directory:
+    python -m benchmarks.benchmark_startup --dies 16 --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.benchmark_entity_memory import scale_chip_data
+from utils.data_manager import DataManager
+from utils.paths import CHIP_DATA_JSON, SL_JSON, LOGS_CSV
+from utils.constants import READ
+from utils.topology_cache import get_cache_dir, get_cache_path, get_content_key
+
+
+def time_startup(chip_file: str, sl_file: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    data_manager = DataManager(chip_file, sl_file, LOGS_CSV)
+    link_pass = data_manager.link_the_logs_to_leaf_objects
+    link_time = []
+
+    def timed_link_pass() -> None:
+        link_start = time.perf_counter()
+        link_pass()
+        link_time.append(time.perf_counter() - link_start)
+
+    data_manager.link_the_logs_to_leaf_objects = timed_link_pass
+    for die_index in range(data_manager.topology.num_dies):
+        data_manager.load_die(die_index)
+    total = time.perf_counter() - start
+    return {"topology": total - sum(link_time), "link": sum(link_time), "total": total}
+
+
+def report(name: str, runs: List[Dict[str, float]]) -> None:
+    columns = " ".join(f"{key} {statistics.median(run[key] for run in runs) * 1000:8.1f} ms" for key in runs[0])
+    print(f"{name:<11} {columns}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dies", type=int, default=2, help="number of dies in the scaled chip")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(CHIP_DATA_JSON, READ) as config:
+        chip_data = scale_chip_data(json.load(config), args.dies)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        chip_file = os.path.join(temp_dir, "chip_data.json")
+        with open(chip_file, 'w') as file:
+            json.dump(chip_data, file)
+        cache_path = get_cache_path(get_content_key(chip_file, SL_JSON), get_cache_dir(chip_file))
+
+        cold_runs, warm_runs = [], []
+        try:
+            for _ in range(args.runs):
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+                cold_runs.append(time_startup(chip_file, SL_JSON))
+                warm_runs.append(time_startup(chip_file, SL_JSON))
+        finally:
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+
+    print(f"dies: {args.dies}, median of {args.runs} runs")
+    report("cold start", cold_runs)
+    report("warm start", warm_runs)
+
+
+if __name__ == '__main__':
+    main()
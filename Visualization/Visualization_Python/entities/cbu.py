@@ -7,10 +7,11 @@ from utils.type_names import SUBUNITS, MCU
 
 
 class Cbu(Cluster):
+    __slots__ = ('subunits',)
+
     def __init__(self, cluster: List[Union[int, str]], data: Dict[str, Any]):
         mcu_data = data[MCU]
         super().__init__(cluster, mcu_data)
-        self.data = data
         self.subunits: Dict[str, Component] = {
             subunit_type: Component(type_name=subunit_type) for subunit_type in SUBUNITS
         }
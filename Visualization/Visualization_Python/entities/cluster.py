@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, Iterator
 
 from entities.component import Component
 from entities.mcu import Mcu
@@ -8,16 +8,21 @@ from utils.type_names import MCU, LNB
 
 
 class Cluster(Component):
+    __slots__ = ('row', 'col', 'is_enable', 'mcu', 'lnb')
+
     def __init__(self, cluster: List[Union[int, str]], mcu_data: Dict[str, Any]):
         row, col, id, type_name = cluster
         super().__init__(id, type_name)
         self.row = row
         self.col = col
-        self.color = OBJECT_COLORS[type_name]
         self.is_enable = False
         self.mcu = Mcu(None, MCU, mcu_data)
         self.lnb = Component(None, LNB)
 
+    @property
+    def color(self) -> str:
+        return OBJECT_COLORS[self.type_name]
+
     def get_details(self) -> List[Component]:
         return [self.mcu, self.lnb]
 
@@ -30,3 +35,8 @@ class Cluster(Component):
             attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
         return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for inner_obj in self.get_details():
+            yield from inner_obj.iter_active_logs()
+        yield from super().iter_active_logs()
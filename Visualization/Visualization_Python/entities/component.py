@@ -1,9 +1,16 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Callable, Iterator, Tuple
 
 from utils.error_messages import ErrorMessages
+from utils.node_summary import NodeSummary
+
+# Called with the address of an object inside its parent, and the object, when a lazily built object is loaded
+LoadCallback = Callable[[Tuple[int, ...], 'Component'], None]
 
 
 class Component:
+    # The entities use slots - a chip holds many thousands of them. The type name is shared between
+    # all the objects of a type, and the metadata of a type (e.g. its color) is looked up by it.
+    __slots__ = ('id', 'type_name', 'active_logs', '_summary')
     _id_counter = 0  # Static variable to keep track of IDs
 
     def __init__(self, id: Optional[int] = None, type_name: Optional[str] = None):
@@ -14,6 +21,34 @@ class Component:
             self.id = id
         self.type_name = type_name
         self.active_logs: List[Any] = []  # List to hold active logs
+        self._summary: Optional[NodeSummary] = None  # Created on first use, most components see no logs
+
+    @property
+    def summary(self) -> NodeSummary:
+        """
+        Log count and TIDs of this component and its inner layers.
+        """
+        if self._summary is None:
+            self._summary = NodeSummary()
+        return self._summary
+
+    @summary.setter
+    def summary(self, summary: NodeSummary) -> None:
+        self._summary = summary
+
+    def clear_activity(self) -> None:
+        """
+        Removes the logs and the summary linked to the component.
+        """
+        self.active_logs = []
+        if self._summary is not None:
+            self._summary.clear()
+
+    def clear_logs(self) -> None:
+        """
+        Removes the logs linked to the component, its summary is kept.
+        """
+        self.active_logs = []
 
     def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
         """
@@ -30,3 +65,10 @@ class Component:
             print(ErrorMessages.FAILED_TO_RETIEVE_ATTRIBUTE.value.format(attribute=attribute, error=str(e)))
             return []
         return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        """
+        Yields the active logs of the component and its inner layers, in the order of
+        get_attribute_from_active_logs, so the first logs can be used before the inner layers are all visited.
+        """
+        return iter(self.active_logs)
@@ -1,32 +1,73 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Callable, Union
 
-from entities.component import Component
+from entities.component import Component, LoadCallback
 from entities.quad import Quad
 
-from utils.constants import GRID, QUADS, NAME, ID, NUM_QUADS_PER_SIDE
+from utils.constants import GRID, QUADS, NAME, ID, NUM_QUADS_PER_SIDE, NUM_CLUSTERS_PER_SIDE
 from utils.type_names import DIE
 
 
 class Die(Component):
+    __slots__ = ('_quads', 'on_load', '_data', '_pending_quads', 'is_enable', 'clusters_per_side')
 
-    def __init__(self, id: int, data: Dict[str, Any]):
+    def __init__(self, id: int, data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+                 on_load: Optional[LoadCallback] = None, quads_per_side: int = NUM_QUADS_PER_SIDE,
+                 clusters_per_side: int = NUM_CLUSTERS_PER_SIDE):
         super().__init__(id, DIE)
-        self.quads: List[List[Quad]] = [[None for _ in range(NUM_QUADS_PER_SIDE)] for _ in
-                                        range(NUM_QUADS_PER_SIDE)]
-        self.data = data
-        self.init_quads()
+        self._quads: List[List[Optional[Quad]]] = [[None for _ in range(quads_per_side)] for _ in
+                                                   range(quads_per_side)]
+        self.clusters_per_side = clusters_per_side
+        self.on_load = on_load
+        self._data = data  # The json of the die, or a function that loads it, read once the quads are needed
+        self._pending_quads: Optional[Dict[int, Dict[str, Any]]] = None
         self.is_enable = False
 
+    @property
+    def pending_quads(self) -> Dict[int, Dict[str, Any]]:
+        """
+        The json of the quads that were not built yet, by their index
+        """
+        if self._pending_quads is None:
+            data = self._data() if callable(self._data) else self._data
+            quads_data = data.get(GRID, {}).get(QUADS, [])[:len(self._quads) * len(self._quads)]
+            self._pending_quads = dict(enumerate(quads_data))
+            self._data = None
+        return self._pending_quads
+
+    @property
+    def quads(self) -> List[List[Quad]]:
+        """
+        The quads of the die by their position, the quads that were not loaded yet are loaded.
+        """
+        self.init_quads()
+        return self._quads
+
     def init_quads(self) -> None:
-        quads = self.data.get(GRID, {}).get(QUADS, [])
-        positions = [(row, col) for row in range(NUM_QUADS_PER_SIDE) for col in range(NUM_QUADS_PER_SIDE)]
+        for index in list(self.pending_quads):
+            self.get_quad(index)
 
-        for index, quad_data in enumerate(quads):
-            pos = positions[index % len(positions)]
-            row, col = pos
+    def get_quad(self, index: int) -> Optional[Quad]:
+        """
+        Returns the quad by its index in the die, the quad is built the first time it's requested.
+        """
+        row, col = divmod(index, len(self._quads))
+        if not 0 <= row < len(self._quads):
+            return None
+        if self._quads[row][col] is None:
+            if index not in self.pending_quads:
+                return None
+            quad_data = self.pending_quads.pop(index)
+            on_load = None
+            if self.on_load:
+                on_load = lambda address, node: self.on_load((index, *address), node)
+            new_quad = Quad(quad_data.get(ID), quad_data.get(NAME), quad_data, on_load, self.clusters_per_side)
+            self._quads[row][col] = new_quad
+            if self.on_load:
+                self.on_load((index,), new_quad)
+        return self._quads[row][col]
 
-            new_quad = Quad(quad_data.get(ID), quad_data.get(NAME), quad_data)
-            self.quads[row][col] = new_quad
+    def get_loaded_quads(self) -> List[Quad]:
+        return [quad for row in self._quads for quad in row if quad]
 
     def get_attribute_from_active_logs(self, attribute: str) -> List[Any]:
         attributes = []
@@ -35,3 +76,11 @@ class Die(Component):
                 attributes.extend(quad.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
         return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for row in self.quads:
+            for quad in row:
+                if quad is None:
+                    continue
+                yield from quad.iter_active_logs()
+        yield from super().iter_active_logs()
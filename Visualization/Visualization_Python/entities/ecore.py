@@ -8,10 +8,11 @@ from utils.type_names import MCU, BMT, CBUS_INJ, CBUS_CLT, NFI_INJ, NFI_CLT, ECO
 
 
 class Ecore(Cluster):
+    __slots__ = ('bmt', 'cbus_inj', 'cbus_clt', 'nfi_inj', 'nfi_clt', 'ecores')
+
     def __init__(self, cluster: List[Union[int, str]], data: Dict[str, Any]):
         mcu_data = data.get(MCU, [])
         super().__init__(cluster, mcu_data)
-        self.data = data
 
         self.bmt = Component(None, BMT)
         self.cbus_inj = Component(None, CBUS_INJ)
@@ -20,10 +21,10 @@ class Ecore(Cluster):
         self.nfi_clt = Component(None, NFI_CLT)
         self.ecores = []
 
-        self.init_ecores()
+        self.init_ecores(data)
 
-    def init_ecores(self) -> None:
-        for ecore in self.data.get(ECORES, []):
+    def init_ecores(self, data: Dict[str, Any]) -> None:
+        for ecore in data.get(ECORES, []):
             ecore_obj = Component(None, ECORE)
             self.ecores.append(ecore_obj)
 
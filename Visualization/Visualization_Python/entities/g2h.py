@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator
 
 from entities.component import Component
 
@@ -7,16 +7,17 @@ from utils.type_names import EQ, IRQA
 
 
 class G2h(Component):
+    __slots__ = ('g2h_irqa', 'eqs')
+
     def __init__(self, id: int, type: str, data: Dict[str, Any]):
         super().__init__(id, type)
-        self.data = data
         self.g2h_irqa = Component(None, IRQA)
         self.eqs = []
 
-        self.init_eqs()
+        self.init_eqs(data)
 
-    def init_eqs(self) -> None:
-        for eq in self.data.get(EQS, []):
+    def init_eqs(self, data: Dict[str, Any]) -> None:
+        for eq in data.get(EQS, []):
             eq = Component(eq[ID], EQ)
             self.eqs.append(eq)
 
@@ -29,3 +30,8 @@ class G2h(Component):
             attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
         return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for inner_obj in self.get_details():
+            yield from inner_obj.iter_active_logs()
+        yield from super().iter_active_logs()
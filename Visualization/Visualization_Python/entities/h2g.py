@@ -1,4 +1,4 @@
-from typing import List, Any
+from typing import List, Any, Iterator
 
 from entities.component import Component
 
@@ -6,6 +6,8 @@ from utils.type_names import CBUS_INJ, CBUS_CLT, NFI_INJ, NFI_CLT, IRQA
 
 
 class H2g(Component):
+    __slots__ = ('cbus_inj', 'cbus_clt', 'nfi_inj', 'nfi_clt', 'h2g_irqa')
+
     def __init__(self, id: int, type: str):
         super().__init__(id, type)
         self.cbus_inj = Component(None, CBUS_INJ)
@@ -22,4 +24,9 @@ class H2g(Component):
         for inner_obj in self.get_details():
             attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
\ No newline at end of file
+        return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for inner_obj in self.get_details():
+            yield from inner_obj.iter_active_logs()
+        yield from super().iter_active_logs()
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator
 
 from entities.component import Component
 from entities.h2g import H2g
@@ -8,6 +8,8 @@ from utils.type_names import HOST_INTERFACE, BMT, H2G, G2H, PCIE
 
 
 class HostInterface(Component):
+    __slots__ = ('bmt', 'h2g', 'g2h', 'pcie')
+
     def __init__(self, data: Dict[str, Any]):
         super().__init__(None, HOST_INTERFACE)
         self.bmt = Component(None, BMT)
@@ -27,3 +29,8 @@ class HostInterface(Component):
             attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
         return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for inner_obj in self.get_details():
+            yield from inner_obj.iter_active_logs()
+        yield from super().iter_active_logs()
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator
 
 from entities.component import Component
 
@@ -7,19 +7,20 @@ from utils.type_names import IRQA, IQR, IQD, BIN, EQ
 
 
 class Mcu(Component):
+    __slots__ = ('mcu_irqa', 'iqr', 'iqd', 'bin', 'eqs')
+
     def __init__(self, id: int, type: str, data: Dict[str, Any]):
         super().__init__(id, type)
         self.mcu_irqa = Component(None, IRQA)
         self.iqr = Component(None, IQR)
         self.iqd = Component(None, IQD)
         self.bin = Component(None, BIN)
-        self.data = data
         self.eqs = []
 
-        self.init_eqs()
+        self.init_eqs(data)
 
-    def init_eqs(self) -> None:
-        for eq in self.data.get(EQS, []):
+    def init_eqs(self, data: Dict[str, Any]) -> None:
+        for eq in data.get(EQS, []):
             eq = Component(eq[ID], EQ)
             self.eqs.append(eq)
 
@@ -31,4 +32,9 @@ class Mcu(Component):
         for inner_obj in self.get_details():
             attributes.extend(inner_obj.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
-        return attributes
\ No newline at end of file
+        return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for inner_obj in self.get_details():
+            yield from inner_obj.iter_active_logs()
+        yield from super().iter_active_logs()
@@ -1,6 +1,7 @@
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, Iterator, List, Union, Optional, Tuple
 
-from entities.component import Component
+from entities.component import Component, LoadCallback
+from entities.cluster import Cluster
 from entities.ecore import Ecore
 from entities.cbu import Cbu
 from entities.tcu import Tcu
@@ -9,49 +10,73 @@ from utils.constants import CBUS, TCUS, ROW, COL, CLUSTER_ID, NUM_CLUSTERS_PER_S
 from utils.type_names import QUAD, HBM, ECORE, CBU, TCU
 from utils.error_messages import WarningMessages
 
+CLUSTER_CLASSES = {ECORE: Ecore, CBU: Cbu, TCU: Tcu}
+
+
+def iter_clusters_data(quad_data: Dict[str, Any]) -> Iterator[Tuple[int, int, str, Dict[str, Any]]]:
+    """
+    Yields the row, col, type and json of every cluster in the json of a quad.
+    """
+    ecore_json = quad_data.get(ECORE)
+    if not ecore_json:
+        raise ValueError(WarningMessages.WARNING_MISSING_DATA.value.format(component=ECORE))
+    yield int(ecore_json.get(ROW)), int(ecore_json.get(COL)), ECORE, ecore_json
+    for cluster_type, clusters_key in ((CBU, CBUS), (TCU, TCUS)):
+        for cluster_json in quad_data.get(clusters_key, []):
+            if not isinstance(cluster_json, dict):
+                raise ValueError(WarningMessages.INVALID_DATA.value.format(component=cluster_type, data=cluster_json))
+            yield int(cluster_json.get(ROW)), int(cluster_json.get(COL)), cluster_type, cluster_json
+
 
 class Quad(Component):
+    __slots__ = ('name', 'on_load', '_clusters', 'pending_clusters', 'is_enable', 'hbm')
 
-    def __init__(self, id: int, name: str, data: Dict[str, Any]):
+    def __init__(self, id: int, name: str, data: Dict[str, Any], on_load: Optional[LoadCallback] = None,
+                 clusters_per_side: int = NUM_CLUSTERS_PER_SIDE):
         super().__init__(id, QUAD)
         self.name = name
-        self.data = data
-        self.clusters = [[None for _ in range(NUM_CLUSTERS_PER_SIDE)] for _ in range(NUM_CLUSTERS_PER_SIDE)]
+        self.on_load = on_load
+        self._clusters = [[None for _ in range(clusters_per_side)] for _ in range(clusters_per_side)]
+        # The type and json of the clusters that were not built yet, by their (row, col)
+        self.pending_clusters: Dict[Tuple[int, int], Tuple[str, Dict[str, Any]]] = {}
         self.is_enable = False
         self.hbm = Component(None, HBM)
 
+        self.init_clusters_data(data)
+
+    @property
+    def clusters(self) -> List[List[Optional[Cluster]]]:
+        """
+        The clusters of the quad by their position, the clusters that were not loaded yet are loaded.
+        """
         self.init_clusters()
+        return self._clusters
+
+    def init_clusters_data(self, data: Dict[str, Any]) -> None:
+        """
+        Indexes the json of each cluster by its position, the clusters themselves are built on demand.
+        """
+        for row, col, type, cluster_json in iter_clusters_data(data):
+            self.pending_clusters[(row, col)] = (type, cluster_json)
 
     def init_clusters(self) -> None:
-        self.init_ecore()
-        self.init_cbus()
-        self.init_tcus()
-
-    def init_ecore(self) -> None:
-        ecore_json = self.data.get(ECORE)
-        if not ecore_json:
-            raise ValueError(WarningMessages.WARNING_MISSING_DATA.value.format(component=ECORE))
-        cluster = self.init_cluster(ecore_json, ECORE)
-        ecore = Ecore(cluster, ecore_json)
-        self.clusters[ecore.row][ecore.col] = ecore
-
-    def init_cbus(self) -> None:
-        cbus = self.data.get(CBUS, [])
-        for cbu_json in cbus:
-            if not isinstance(cbu_json, dict):
-                raise ValueError(WarningMessages.INVALID_DATA.value.format(component=CBU, data=cbu_json))
-            cluster = self.init_cluster(cbu_json, CBU)
-            cbu = Cbu(cluster, cbu_json)
-            self.clusters[cbu.row][cbu.col] = cbu
-
-    def init_tcus(self) -> None:
-        tcus = self.data.get(TCUS, [])
-        for tcu_json in tcus:
-            if not isinstance(tcu_json, dict):
-                raise ValueError(WarningMessages.INVALID_DATA.value.format(component=TCU, data=tcu_json))
-            cluster = self.init_cluster(tcu_json, TCU)
-            tcu = Tcu(cluster, tcu_json)
-            self.clusters[tcu.row][tcu.col] = tcu
+        for row, col in list(self.pending_clusters):
+            self.get_cluster(row, col)
+
+    def get_cluster(self, row: int, col: int) -> Optional[Cluster]:
+        """
+        Returns the cluster in the given position, the cluster is built the first time it's requested.
+        """
+        if self._clusters[row][col] is None and (row, col) in self.pending_clusters:
+            type, cluster_json = self.pending_clusters.pop((row, col))
+            cluster = CLUSTER_CLASSES[type](self.init_cluster(cluster_json, type), cluster_json)
+            self._clusters[row][col] = cluster
+            if self.on_load:
+                self.on_load((row, col), cluster)
+        return self._clusters[row][col]
+
+    def get_loaded_clusters(self) -> List[Cluster]:
+        return [cluster for row in self._clusters for cluster in row if cluster]
 
     def init_cluster(self, cluster_json: Dict[str, Any], type: str) -> List[Union[int, str]]:
         cluster = [
@@ -71,3 +96,11 @@ class Quad(Component):
                 attributes.extend(cluster.get_attribute_from_active_logs(attribute))
         attributes.extend(super().get_attribute_from_active_logs(attribute))
         return attributes
+
+    def iter_active_logs(self) -> Iterator[Any]:
+        for row in self.clusters:
+            for cluster in row:
+                if cluster is None:
+                    continue
+                yield from cluster.iter_active_logs()
+        yield from super().iter_active_logs()
@@ -7,10 +7,11 @@ from utils.type_names import MCU
 
 
 class Tcu(Cluster):
+    __slots__ = ()
+
     def __init__(self, cluster: List[Union[int, str]], data: Dict[str, Any]):
         mcu_data = data.get(MCU)
         super().__init__(cluster, mcu_data)
-        self.data = data
 
     def get_details(self) -> List[Component]:
         return super().get_details()
@@ -0,0 +1,310 @@
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPen, QMouseEvent, QWheelEvent, QPaintEvent, QResizeEvent
+from PyQt5.QtWidgets import QWidget, QMessageBox
+
+from entities.component import Component
+
+from gui.log_colors_dialog import LogColorDialog
+from gui.packets_colors import get_color_by_tid, get_node_color
+
+from utils.chip_layout import ChipLayout, Rect, QUAD_DETAIL, UNIT_DETAIL
+from utils.constants import BLACK, WHITE, LIGHTGRAY, GREEN, COMPONENT_LOGS, HOST_INTERFACE_Logs, DIE2DIE_LOGS, \
+    HBM_LOGS, QUAD_LOGS
+from utils.data_manager import DataManager
+from utils.error_messages import ErrorMessages
+from utils.node_summary import get_dominant_tid
+from utils.topology import NO_NODE, DIE_NODE, QUAD_NODE, HBM_NODE
+from utils.type_names import DIE, HBM, CLUSTER, HOST_INTERFACE, D2D
+
+MIN_SCALE = 0.05
+MAX_SCALE = 40.0
+ZOOM_STEP = 1.25
+FIT_MARGIN = 10  # Pixels around the system when it is fitted to the canvas
+LABEL_PIXELS = 14  # Smaller parts are drawn without their labels
+MAX_DIRTY_NODES = 256  # More changed nodes repaint the whole canvas
+
+
+class ChipCanvas(QWidget):
+    """
+    The whole system - the host interface, every die of every chip and the die2die - painted on a single widget.
+
+    The parts are drawn as rectangles at the positions of the chip layout, colored from the activity that the
+    link pass rolled up in the topology table, so no object is created per cluster. Only the visible parts are
+    painted, and the zoom sets the level of detail: quads, clusters, or the units of every cluster.
+    Scroll to zoom, drag to move, double click a quad to zoom to it and right click any part to see its logs.
+    """
+
+    def __init__(self, data_manager: DataManager, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.topology = data_manager.topology
+        self.layout_plan = ChipLayout(data_manager.dimensions)
+        self.scale = 1.0
+        self.offset = QPointF(0, 0)  # The point of the layout at the top left corner of the canvas
+        self.drag_start: Optional[QPointF] = None
+        self.is_fitted = False
+        self.node_colors: List[Optional[str]] = []  # The color of every node of the topology table, None if idle
+        self.setMouseTracking(True)
+        self.setMinimumSize(400, 300)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Colors the nodes from the activity of the topology table, after the logs were linked again
+        """
+        self.node_colors = [get_color_by_tid(tid, None) for tid in self.topology.dominant_tids]
+        self.update()
+
+    def apply_changes(self, nodes: List[int]) -> None:
+        """
+        Colors again the nodes whose activity changed after a filter and repaints only where they are drawn
+        """
+        if not self.isVisible():
+            return
+        if len(nodes) > MAX_DIRTY_NODES:
+            self.refresh()
+            return
+        detail = self.layout_plan.get_level_of_detail(self.scale)
+        for node in nodes:
+            self.node_colors[node] = get_color_by_tid(self.topology.dominant_tids[node], None)
+            rect = self.get_node_rect(node, detail)
+            if rect is not None:
+                self.update(self.to_screen(rect).toAlignedRect())
+        # The host interface and the die2die are not in the topology table, they may change with any filter
+        self.update(self.to_screen(self.layout_plan.host_interface_rect).toAlignedRect())
+        self.update(self.to_screen(self.layout_plan.d2d_rect).toAlignedRect())
+
+    def get_node_rect(self, node: int, detail: int) -> Optional[Rect]:
+        """
+        Returns where the color of a node is drawn at the level of detail, or None if it is not drawn
+        """
+        node_type = self.topology.node_type[node]
+        address = self.topology.get_address(node)
+        if node_type == DIE_NODE:
+            return None  # Only the outline of a die is drawn, it does not change with the activity
+        if node_type == HBM_NODE:
+            return self.layout_plan.hbm_rect(*address)
+        if node_type == QUAD_NODE:
+            # Past the quad detail its clusters are drawn in its place
+            return self.layout_plan.quad_rect(*address) if detail == QUAD_DETAIL else None
+        if detail == QUAD_DETAIL:
+            return None
+        return self.layout_plan.cluster_rect(*address)
+
+    def apply_playback(self, tids: Dict[object, Optional[int]]) -> None:
+        """
+        Colors the nodes by the dominant TIDs of a playback frame that changed
+        """
+        for node, tid in tids.items():
+            if isinstance(node, int):
+                self.node_colors[node] = get_color_by_tid(tid, None)
+        self.update()
+
+    def fit_to_view(self) -> None:
+        _, _, width, height = self.layout_plan.bounds
+        self.scale = max(min((self.width() - 2 * FIT_MARGIN) / width, (self.height() - 2 * FIT_MARGIN) / height),
+                         MIN_SCALE)
+        self.offset = QPointF(-FIT_MARGIN / self.scale, -FIT_MARGIN / self.scale)
+        self.update()
+
+    def zoom_to(self, rect: Rect) -> None:
+        x, y, width, height = rect
+        self.scale = min(max(min(self.width() / width, self.height() / height), MIN_SCALE), MAX_SCALE)
+        self.offset = QPointF(x + width / 2 - self.width() / 2 / self.scale,
+                              y + height / 2 - self.height() / 2 / self.scale)
+        self.update()
+
+    def to_screen(self, rect: Rect) -> QRectF:
+        x, y, width, height = rect
+        return QRectF((x - self.offset.x()) * self.scale, (y - self.offset.y()) * self.scale,
+                      width * self.scale, height * self.scale)
+
+    def to_layout(self, point: QPointF) -> Tuple[float, float]:
+        return point.x() / self.scale + self.offset.x(), point.y() / self.scale + self.offset.y()
+
+    def get_view(self, screen_rect: Optional[QRectF] = None) -> Rect:
+        """
+        Returns the part of the layout in a rectangle of the canvas, the whole canvas by default
+        """
+        if screen_rect is None:
+            return self.offset.x(), self.offset.y(), self.width() / self.scale, self.height() / self.scale
+        x, y = self.to_layout(QPointF(screen_rect.topLeft()))
+        return x, y, screen_rect.width() / self.scale, screen_rect.height() / self.scale
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        # Only the parts in the region to repaint are drawn, after a filter it is the parts that changed
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), QColor(WHITE))
+        view = self.get_view(QRectF(event.rect()))
+        detail = self.layout_plan.get_level_of_detail(self.scale)
+
+        self.draw_part(painter, self.layout_plan.host_interface_rect, self.get_component_color(
+            self.data_manager.host_interface), HOST_INTERFACE)
+        self.draw_part(painter, self.layout_plan.d2d_rect, self.get_component_color(self.data_manager.die2die), D2D)
+        for die in range(self.topology.num_dies):
+            die_rect = self.to_screen(self.layout_plan.die_rect(die))
+            painter.setPen(QPen(QColor(BLACK), 1))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(die_rect)
+            if die_rect.height() > LABEL_PIXELS * 4:
+                painter.drawText(die_rect.adjusted(0, -LABEL_PIXELS - 2, 0, 0), Qt.AlignLeft | Qt.AlignTop,
+                                 self.get_die_label(die))
+
+        enabled_mask = self.data_manager.enabled_mask
+        for die, quad in self.layout_plan.iter_visible_quads(view):
+            quad_node = self.topology.get_quad_node(die, quad)
+            if quad_node == NO_NODE:
+                continue
+            hbm_node = self.topology.get_hbm_node(die, quad)
+            self.draw_part(painter, self.layout_plan.hbm_rect(die, quad), self.node_colors[hbm_node], HBM)
+            border = GREEN if enabled_mask.is_quad_enabled(die, quad) else LIGHTGRAY
+            if detail == QUAD_DETAIL:
+                self.draw_part(painter, self.layout_plan.quad_rect(die, quad), self.node_colors[quad_node], None,
+                               border)
+                continue
+            for row, col in self.layout_plan.iter_visible_clusters(die, quad, view):
+                cluster_node = self.topology.get_cluster_node(die, quad, row, col)
+                if cluster_node == NO_NODE:
+                    continue
+                cluster_rect = self.layout_plan.cluster_rect(die, quad, row, col)
+                cluster_border = BLACK if enabled_mask.is_enabled(die, quad, row, col) else LIGHTGRAY
+                self.draw_part(painter, cluster_rect, self.node_colors[cluster_node], None, cluster_border)
+                if detail == UNIT_DETAIL:
+                    self.draw_units(painter, cluster_rect, cluster_node)
+            painter.setPen(QPen(QColor(border), 2))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self.to_screen(self.layout_plan.quad_rect(die, quad)))
+
+    def draw_part(self, painter: QPainter, rect: Rect, color: Optional[str], label: Optional[str],
+                  border: str = BLACK) -> None:
+        screen_rect = self.to_screen(rect)
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor(color or LIGHTGRAY))
+        painter.drawRect(screen_rect)
+        if label and min(screen_rect.width(), screen_rect.height()) > LABEL_PIXELS:
+            painter.setPen(QColor(BLACK))
+            painter.drawText(screen_rect, Qt.AlignCenter | Qt.TextWordWrap, label)
+
+    def draw_units(self, painter: QPainter, rect: Rect, cluster_node: int) -> None:
+        """
+        Draws the active units of a cluster as rows inside it. A cluster that was not loaded yet shows the units
+        that wait for it in the topology table, so zooming in does not build the cluster.
+        """
+        units = self.get_active_units(cluster_node)
+        if not units:
+            return
+        x, y, width, height = rect
+        row_height = height / len(units)
+        for index, (name, tid) in enumerate(units):
+            self.draw_part(painter, (x, y + index * row_height, width, row_height), get_color_by_tid(tid, None), name)
+
+    def get_active_units(self, cluster_node: int) -> List[Tuple[str, Optional[int]]]:
+        """
+        Returns the name and dominant TID of every active unit of a cluster
+        """
+        cluster = self.topology.loaded[cluster_node]
+        if cluster is not None:
+            return [(unit.type_name, unit.summary.dominant_tid) for unit in cluster.get_all_inner_details()
+                    if unit.summary.has_activity]
+        units: Dict[str, Counter] = defaultdict(Counter)
+        for (area, unit, tid), count in self.topology.pending_units.get(cluster_node, {}).items():
+            units[f"{area} {unit}"][tid] += count
+        return [(name, get_dominant_tid(tids)) for name, tids in units.items()]
+
+    def get_component_color(self, component: Component) -> Optional[str]:
+        return get_node_color(component.summary, None)
+
+    def get_die_label(self, die: int) -> str:
+        chip, die_id = self.data_manager.dimensions.die_addresses[die]
+        if self.data_manager.dimensions.num_chips > 1:
+            return f"CHIP {chip} DIE {die_id}"
+        return f"DIE {die_id}"
+
+    def get_component_at(self, x: float, y: float) -> Optional[Tuple[Component, str]]:
+        """
+        Returns the object at a point of the layout and the title of its logs, the quad or cluster is loaded
+        """
+        hit = self.layout_plan.hit_test(x, y)
+        if hit is None:
+            return None
+        part, address = hit
+        if part == HOST_INTERFACE:
+            return self.data_manager.host_interface, HOST_INTERFACE_Logs
+        if part == D2D:
+            return self.data_manager.die2die, DIE2DIE_LOGS
+        die = self.data_manager.load_die(address[0])
+        if part == DIE:
+            return die, f"{self.get_die_label(address[0])} Logs and Colors"
+        quad = die.get_quad(address[1])
+        if quad is None:
+            return None
+        if part == HBM:
+            return quad.hbm, HBM_LOGS
+        cluster = quad.get_cluster(address[2], address[3])
+        if cluster is None:
+            return quad, QUAD_LOGS
+        return cluster, COMPONENT_LOGS.format(component=cluster.type_name or CLUSTER)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+        if not self.is_fitted:
+            self.fit_to_view()
+            self.is_fitted = True
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        # Zoom around the point under the cursor
+        point = QPointF(event.pos())
+        x, y = self.to_layout(point)
+        factor = ZOOM_STEP if event.angleDelta().y() > 0 else 1 / ZOOM_STEP
+        self.scale = min(max(self.scale * factor, MIN_SCALE), MAX_SCALE)
+        self.offset = QPointF(x - point.x() / self.scale, y - point.y() / self.scale)
+        self.update()
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.LeftButton:
+            self.drag_start = QPointF(event.pos())
+        elif event.button() == Qt.RightButton:
+            self.show_logs(*self.to_layout(QPointF(event.pos())))
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self.drag_start is not None and event.buttons() & Qt.LeftButton:
+            delta = QPointF(event.pos()) - self.drag_start
+            self.offset -= delta / self.scale
+            self.drag_start = QPointF(event.pos())
+            self.update()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self.drag_start = None
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        hit = self.layout_plan.hit_test(*self.to_layout(QPointF(event.pos())))
+        if hit is None:
+            self.fit_to_view()
+        elif hit[0] in (CLUSTER, HBM):
+            die, quad = hit[1][:2]
+            self.zoom_to(self.layout_plan.quad_rect(die, quad))
+        elif hit[0] == DIE:
+            self.zoom_to(self.layout_plan.die_rect(hit[1][0]))
+
+    def show_logs(self, x: float, y: float) -> None:
+        try:
+            found = self.get_component_at(x, y)
+            if found is None or not found[0].summary.has_activity:
+                return
+            component, title = found
+            dialog = LogColorDialog(component, title, self, self.data_manager)
+            dialog.exec_()
+        except Exception as e:
+            self.show_error_dialog(ErrorMessages.ERROR.value, ErrorMessages.ERROR_OCCURRED.value.format(error=str(e)))
+
+    def show_error_dialog(self, title: str, message: str) -> None:
+        """Show an error dialog with the specified title and message."""
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Critical)
+        msg_box.setText(message)
+        msg_box.setWindowTitle(title)
+        msg_box.setStandardButtons(QMessageBox.Ok)
+        msg_box.exec_()
@@ -3,7 +3,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
                              QGridLayout, QScrollArea, QLayout, QMessageBox)
 from PyQt5.QtCore import Qt
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 from entities.cluster import Cluster
 from entities.component import Component
@@ -12,12 +12,14 @@ from entities.mcu import Mcu
 from gui.component_widget import ComponentWidget
 from gui.log_colors_dialog import LogColorDialog
 from gui.mcu_widget import McuInfoWidget
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_node_color
 
 
-from utils.constants import TID, OBJECT_COLORS, LIGHTGRAY, WHITE, X_BUTTON, COMPONENT_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, RED
+from utils.constants import OBJECT_COLORS, LIGHTGRAY, WHITE, X_BUTTON, COMPONENT_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, RED
 from utils.type_names import MCU, LNB
 from utils.error_messages import ErrorMessages, WarningMessages
+from utils.tracing import traced
+from utils.data_manager import DataManager
 
 
 class ClusterInfoWidget(QWidget):
@@ -25,10 +27,15 @@ class ClusterInfoWidget(QWidget):
     SCROLL_AREA_NAME = "scroll_area"
     CLUSTER_TITLE = "Cluster ID: {cluster_id}"
 
-    def __init__(self, cluster: Cluster, parent: Optional[QWidget] = None) -> None:
+    @traced()
+    def __init__(self, cluster: Cluster, parent: Optional[QWidget] = None,
+                 data_manager: Optional[DataManager] = None) -> None:
         try:
             super().__init__(parent)
             self.cluster = cluster
+            self.data_manager = data_manager
+            self.component_widgets: List[ComponentWidget] = []
+            self.mcu_info_widgets: Dict[Mcu, McuInfoWidget] = {}  # The MCUs opened, shown again when reopened
             self.initUI()
         except Exception as e:
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
@@ -67,13 +74,9 @@ class ClusterInfoWidget(QWidget):
 
             components = self.cluster.get_details()
             for index_component, component in enumerate(components):
-                component_widget = ComponentWidget(component, component.type_name)
-                component_tids = component.get_attribute_from_active_logs(TID)
-                colors = list(get_colors_by_tids(component_tids))
-                back_color = colors[0] if colors else LIGHTGRAY
-                color = OBJECT_COLORS.get(component_widget.type_name, WHITE)
-                component_widget.setStyleSheet(
-                    f'background-color: {back_color}; border: 1px solid {color}; padding: 0px; border-radius: 5px;')
+                component_widget = ComponentWidget(component, component.type_name, data_manager=self.data_manager)
+                self.update_component_style(component_widget)
+                self.component_widgets.append(component_widget)
 
                 # Adjust sizes based on component type
                 if component.type_name in [MCU, LNB]:
@@ -118,11 +121,25 @@ class ClusterInfoWidget(QWidget):
         except Exception as e:
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
 
+    def update_component_style(self, component_widget: ComponentWidget) -> None:
+        back_color = get_node_color(component_widget.component.summary, LIGHTGRAY)
+        color = OBJECT_COLORS.get(component_widget.type_name, WHITE)
+        component_widget.setStyleSheet(
+            f'background-color: {back_color}; border: 1px solid {color}; padding: 0px; border-radius: 5px;')
+
+    def refresh(self) -> None:
+        # Restyles the components and the MCUs opened from the activity of a new snapshot
+        for component_widget in self.component_widgets:
+            component_widget.refresh()
+            self.update_component_style(component_widget)
+        for mcu_info_widget in self.mcu_info_widgets.values():
+            mcu_info_widget.refresh()
+
     def handle_mouse_event(self, event: QContextMenuEvent, component: Component) -> None:
         try:
             if event.button() == Qt.LeftButton and component.type_name == MCU:
                 # Check if the component has logs
-                if not component.get_attribute_from_active_logs(TID):
+                if not component.summary.has_activity:
                     return  # Do nothing if there are no logs
 
                 self.show_mcu_info(component)
@@ -132,16 +149,18 @@ class ClusterInfoWidget(QWidget):
     def show_mcu_info(self, mcu: Mcu) -> None:
         try:
             self.previous_layout = self.layout()
-            self.mcu_info_widget = McuInfoWidget(mcu, self)
             self.build_mcu(mcu)
         except Exception as e:
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
 
     def build_mcu(self, mcu: Mcu) -> None:
         try:
-            self.mcu_info_widget = McuInfoWidget(mcu, self)
-            self.mcu_info_widget.setObjectName(MCU)
-            self.layout().addWidget(self.mcu_info_widget)
+            self.mcu_info_widget = self.mcu_info_widgets.get(mcu)
+            if self.mcu_info_widget is None:
+                self.mcu_info_widget = self.mcu_info_widgets[mcu] = McuInfoWidget(mcu, self, self.data_manager)
+                self.mcu_info_widget.setObjectName(MCU)
+                self.layout().addWidget(self.mcu_info_widget)
+            self.mcu_info_widget.show()
 
             self.widget_to_remove = self.findChild(QWidget, name=self.SCROLL_AREA_NAME)
             self.widget_to_remove2 = self.findChild(QWidget, name=self.CLOSE_BUTTON_NAME)
@@ -153,7 +172,8 @@ class ClusterInfoWidget(QWidget):
     def show_logs(self, component) -> None:
         try:
             if component:
-                dialog = LogColorDialog(component, COMPONENT_LOGS.format(component=component.type_name), self)
+                dialog = LogColorDialog(component, COMPONENT_LOGS.format(component=component.type_name), self,
+                                        self.data_manager)
                 dialog.exec_()
         except Exception as e:
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
@@ -1,24 +1,22 @@
 from typing import Optional
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QEvent
 from PyQt5.QtGui import QColor, QMouseEvent
 
-from utils.constants import TID, PACKET, LIGHTGRAY, POINTING_CURSOR, COMPONENT_LOGS
+from utils.constants import LIGHTGRAY, POINTING_CURSOR, COMPONENT_LOGS
 from entities.cluster import Cluster
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_color_by_tid, get_node_color
+from gui.window_count import handle_tooltip_event
 from utils.error_messages import ErrorMessages
+from utils.data_manager import DataManager
 
 class ClusterWidget(QWidget):
-    def __init__(self, cluster: Cluster, parent: Optional[QWidget] = None) -> None:
+    def __init__(self, cluster: Cluster, parent: Optional[QWidget] = None,
+                 data_manager: Optional[DataManager] = None) -> None:
         super().__init__(parent)
         self.cluster = cluster
-        self.cluster_tids = self.cluster.get_attribute_from_active_logs(TID)
-        self.colors = list(get_colors_by_tids(self.cluster_tids))  # Convert set to list
-        self.packet_messages = self.cluster.get_attribute_from_active_logs(PACKET)  # Fetch packet messages
-        self.is_enable = False
-        if self.cluster.is_enable and self.colors:
-            self.is_enable = True
+        self.data_manager = data_manager
         self.initUI()
 
     def initUI(self) -> None:
@@ -27,30 +25,35 @@ class ClusterWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)  # No margins
         self.setLayout(layout)
 
-        color = QColor(self.cluster.color)
-        text_color = color.name()
         self.label = QLabel(f'{self.cluster.type_name}\nCluster {self.cluster.id}', self)
         self.label.setAlignment(Qt.AlignCenter)
-        text_color = text_color if self.is_enable else LIGHTGRAY
-        self.label.setStyleSheet(f'color: {text_color}; font-size: 12px;')
-
         layout.addWidget(self.label)
 
-        back_color = LIGHTGRAY
-        if self.colors:
-            back_color = self.colors[0]
+        self.setCursor(POINTING_CURSOR)
+        self.mousePressEvent = self.show_log_messages
+        self.refresh()
 
-        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {text_color};')
+    def refresh(self) -> None:
+        # Restyles the cluster from its activity and is_enable, after the logs were linked again
+        self.is_enable = self.cluster.is_enable and self.cluster.summary.has_activity
 
-        self.setCursor(POINTING_CURSOR)
+        color = QColor(self.cluster.color)
+        text_color = color.name() if self.is_enable else LIGHTGRAY
+        self.label.setStyleSheet(f'color: {text_color}; font-size: 12px;')
 
+        back_color = get_node_color(self.cluster.summary, LIGHTGRAY)
+        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {text_color};')
         self.setEnabled(self.is_enable)
-        self.mousePressEvent = self.show_log_messages
+
+    def event(self, event: QEvent) -> bool:
+        handle_tooltip_event(self, self.data_manager, self.cluster, event)
+        return super().event(event)
 
     def show_log_messages(self, event: QMouseEvent) -> None:
         if event.button() == Qt.RightButton:
             try:
-                dialog = LogColorDialog(self.cluster, COMPONENT_LOGS.format(component=self.cluster.type_name), self)
+                dialog = LogColorDialog(self.cluster, COMPONENT_LOGS.format(component=self.cluster.type_name),
+                                        self, self.data_manager)
                 dialog.exec_()
             except Exception as e:
                 self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
@@ -69,16 +72,19 @@ class ClusterWidget(QWidget):
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
 
     def update_display(self) -> None:
-        # Update display with new colors and packet messages
+        # Update display with new colors
         try:
-            self.colors = list(get_colors_by_tids(self.cluster.get_attribute_from_active_logs(TID)))
-            self.packet_messages = self.get_messages_by_packet()
-            back_color = self.colors[0] if self.colors else LIGHTGRAY
+            back_color = get_node_color(self.cluster.summary, LIGHTGRAY)
             self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {self.cluster.color};')
             self.label.setText(f'{self.cluster.type_name}\nCluster {self.cluster.id}')
         except Exception as e:
             self.show_error_message(ErrorMessages.ERROR_OCCURRED.value.format(error=e))
 
+    def set_activity_tid(self, tid: Optional[int]) -> None:
+        # Colors the cluster by the TID of a playback frame, without the logs
+        border_color = QColor(self.cluster.color).name() if self.is_enable else LIGHTGRAY
+        self.setStyleSheet(f'background-color: {get_color_by_tid(tid, LIGHTGRAY)}; border: 2px dashed {border_color};')
+
     def show_error_message(self, message: str) -> None:
         """Display an error message to the user in a popup."""
         error_box = QMessageBox()
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QEvent
 from PyQt5.QtGui import QMouseEvent
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox
 
@@ -7,23 +7,25 @@ from typing import Optional
 from entities.component import Component
 
 from utils.error_messages import ErrorMessages
-from utils.constants import OBJECT_COLORS, TID, BLACK, WHITE, LIGHTGRAY, COMPONENT_LOGS, FORBIDDEN_CURSOR, ARROW_CURSOR
+from utils.data_manager import DataManager
+from utils.constants import OBJECT_COLORS, BLACK, WHITE, LIGHTGRAY, COMPONENT_LOGS, FORBIDDEN_CURSOR, ARROW_CURSOR
 
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_node_color
+from gui.window_count import handle_tooltip_event
 
 
 
 class ComponentWidget(QWidget):
     def __init__(self, component: Component, type_name: str,
-                 parent: Optional[QWidget] = None) -> None:
+                 parent: Optional[QWidget] = None, data_manager: Optional[DataManager] = None) -> None:
         super().__init__(parent)
         self.type_name = type_name
+        self.data_manager = data_manager  # Links the logs for the logs dialog
 
         try:
             self.component = component
-            self.comp_tids = self.component.get_attribute_from_active_logs(TID)
-            self.colors = get_colors_by_tids(self.comp_tids)  # Fetch colors based on TIDs
+            self.color = get_node_color(self.component.summary, None)  # The color of its dominant TID
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR.value,
                                    ErrorMessages.ERROR_OCCURRED.format(error=str(e)))
@@ -32,16 +34,27 @@ class ComponentWidget(QWidget):
         self.initUI()
 
     def initUI(self) -> None:
-        if not self.comp_tids:
+        layout = QVBoxLayout()
+        self.label = QLabel(self.type_name)
+        self.label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.label)
+        self.setLayout(layout)
+        self.update_style()
+
+    def refresh(self) -> None:
+        # Restyles the widget from the activity of a new snapshot
+        self.color = get_node_color(self.component.summary, None)
+        self.update_style()
+
+    def update_style(self) -> None:
+        if self.color is None:
             background_color = LIGHTGRAY
             text_color = WHITE
             self.setCursor(ARROW_CURSOR)  # Normal cursor, indicating no interaction
         else:
             # If logs are present, set the normal colors and cursor
-            background_color = WHITE
+            background_color = self.color
             text_color = BLACK
-            if self.colors:
-                background_color = self.colors[0]
 
             self.setCursor(FORBIDDEN_CURSOR)  # Cursor indicating restricted interaction
 
@@ -49,21 +62,20 @@ class ComponentWidget(QWidget):
             f'background-color: {background_color}; border: 1px solid {WHITE}; '
             f'padding: 0px; border-radius: 5px;'
         )
+        self.label.setStyleSheet(f'color: {text_color};')
 
-        layout = QVBoxLayout()
-        label = QLabel(self.type_name)
-        label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet(f'color: {text_color};')
-        layout.addWidget(label)
-        self.setLayout(layout)
+    def event(self, event: QEvent) -> bool:
+        handle_tooltip_event(self, self.data_manager, self.component, event)
+        return super().event(event)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
-        if self.comp_tids and event.button() == Qt.RightButton:
+        if self.color is not None and event.button() == Qt.RightButton:
             self.show_logs()
 
     def show_logs(self) -> None:
         try:
-            dialog = LogColorDialog(self.component, COMPONENT_LOGS.format(component=self.component.type_name), self)
+            dialog = LogColorDialog(self.component, COMPONENT_LOGS.format(component=self.component.type_name), self,
+                                    self.data_manager)
             dialog.exec_()
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR.value,
@@ -4,14 +4,15 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QMessageBox
 
 
-from typing import Dict, Optional
+from typing import Dict, Hashable, List, Optional
 
 from entities.die import Die
 
 from gui.quad_widget import QuadWidget
+from gui.widget_cache import WidgetCache
 
 from utils.data_manager import DataManager
-from utils.constants import BLACK, NUM_QUADS_PER_SIDE, EMPTY, QUADS, FORBIDDEN_CURSOR, POINTING_CURSOR
+from utils.constants import BLACK, EMPTY, QUADS, FORBIDDEN_CURSOR, POINTING_CURSOR
 from utils.error_messages import ErrorMessages
 from utils.type_names import DIE
 
@@ -21,6 +22,10 @@ class DieWidget(QWidget):
         self.data_manager = data_manager
         self.main_window = main_window
         self.dies = dies
+        self.die_index = None  # The die shown
+        self.quad_widgets: List[QuadWidget] = []
+        # The quads of every die shown and their clusters, restyled when their activity changed
+        self.widget_cache = WidgetCache(self.get_widget_generation)
         self.initUI()
 
     def initUI(self) -> None:
@@ -42,25 +47,33 @@ class DieWidget(QWidget):
             if die is None:
                 raise ValueError(ErrorMessages.ERROR.value, ErrorMessages.OBJECT_IS_NONE.value.format(object=DIE))
 
-            # Clear previous widgets from the quad layout
-            self.clear_layout(self.quad_layout)
+            # Take the quads of the previous die out of the layout, they are kept in the widget cache
+            self.release_layout(self.quad_layout)
+            is_same_die = die_index == self.die_index  # Drawn again after a filter, the quads opened stay open
+            self.die_index = die_index
+            self.quad_widgets = []
 
-            # Display new matrix of the quads
-            for row in range(NUM_QUADS_PER_SIDE):
-                for column in range(NUM_QUADS_PER_SIDE):
+            # Display new matrix of the quads, its size is the quad grid of the chip
+            quads_per_side = len(die.quads)
+            for row in range(quads_per_side):
+                for column in range(quads_per_side):
                     quad = die.quads[row][column]
                     if quad:
-                        quad_widget = QuadWidget(quad, column == 1, self)  # Pass position (row, column)
-                        if quad.is_enable:
-                            quad_widget.setCursor(POINTING_CURSOR)
-                        else:
-                            quad_widget.setCursor(FORBIDDEN_CURSOR)
+                        quad_widget = self.widget_cache.get(
+                            (QuadWidget, quad),
+                            lambda: QuadWidget(quad, column >= quads_per_side // 2, self, self.widget_cache,
+                                               self.data_manager))
+                        self.quad_widgets.append(quad_widget)
+                        if not is_same_die:
+                            quad_widget.show_quad()
+                        self.update_quad_cursor(quad_widget)
                     else:
                         quad_widget = QLabel(EMPTY, self)
                         quad_widget.setAlignment(Qt.AlignCenter)
                         quad_widget.setStyleSheet(
                             f'border: 1px dashed {BLACK}; min-width: 150px; min-height: 150px; background-color: red;')
                     self.quad_layout.addWidget(quad_widget, row, column, alignment=Qt.AlignCenter)
+                    quad_widget.show()
 
             self.adjust_quad_sizes()
             self.quad_container.setVisible(True)
@@ -79,12 +92,24 @@ class DieWidget(QWidget):
                 self.clear_layout(item.layout())
         layout.update()
 
+    def release_layout(self, layout: QGridLayout) -> None:
+        # Removes the widgets from the layout, the cached quads are hidden and the others deleted
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget is None:
+                continue
+            if isinstance(widget, QuadWidget):
+                widget.hide()
+            else:
+                widget.deleteLater()
+
     def adjust_quad_sizes(self) -> None:
         try:
-            div_size, add_px_size = 3, 150
+            quads_per_side = self.quad_layout.rowCount()
+            div_size, add_px_size = quads_per_side + 1, 150
             size = self.size().width() // div_size + add_px_size
-            for row in range(NUM_QUADS_PER_SIDE):
-                for column in range(NUM_QUADS_PER_SIDE):
+            for row in range(quads_per_side):
+                for column in range(self.quad_layout.columnCount()):
                     item = self.quad_layout.itemAtPosition(row, column)
                     if item:
                         widget = item.widget()
@@ -93,6 +118,36 @@ class DieWidget(QWidget):
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR.value, str(e))
 
+    def get_widget_generation(self, key: Hashable) -> int:
+        # A quad widget shows its quad and its hbm, the other widgets show a single cluster
+        kind, component = key
+        if kind is QuadWidget:
+            return max(self.data_manager.get_generation(component), self.data_manager.get_generation(component.hbm))
+        return self.data_manager.get_generation(component)
+
+    def apply_changes(self, nodes: List[int]) -> None:
+        """
+        Restyles the quads and clusters shown whose nodes changed after a filter, the others are left as they are
+        """
+        topology = self.data_manager.topology
+        if not self.isVisible() or not any(topology.die[node] == self.die_index for node in nodes):
+            return
+        self.widget_cache.refresh([(QuadWidget, quad_widget.quad) for quad_widget in self.quad_widgets])
+        for quad_widget in self.quad_widgets:
+            quad_widget.refresh_clusters()
+            self.update_quad_cursor(quad_widget)
+
+    def update_quad_cursor(self, quad_widget: QuadWidget) -> None:
+        if quad_widget.quad.is_enable:
+            quad_widget.setCursor(POINTING_CURSOR)
+        else:
+            quad_widget.setCursor(FORBIDDEN_CURSOR)
+
+    def apply_playback(self, tids: Dict[object, Optional[int]]) -> None:
+        """Color the quads of the die shown by the dominant TIDs of a playback frame that changed."""
+        for quad_widget in self.quad_widgets:
+            quad_widget.apply_playback(tids, self.data_manager.get_index_node)
+
     def show_error_dialog(self, title: str, message: str) -> None:
         """Show an error dialog with the specified title and message."""
         msg_box = QMessageBox(self)
@@ -2,13 +2,17 @@ import os
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QMessageBox
 from PyQt5.QtCore import Qt
 
-from utils.constants import CLOSE, SIMULATOR_INSTRUCTIONS, READ
+from utils.constants import CLOSE, SIMULATOR_INSTRUCTIONS
+from gui.stylesheets import get_stylesheet
+
 from utils.paths import INFO_WIDGET_CSS
 from utils.error_messages import WarningMessages ,ErrorMessages
+from utils.tracing import traced
 
 
 
 class InfoDialog(QDialog):
+    @traced()
     def __init__(self, parent=None):
         try:
             super().__init__(parent)
@@ -61,9 +65,7 @@ class InfoDialog(QDialog):
         """Load a stylesheet from a file and set it to the dialog."""
         try:
             if os.path.exists(filename):
-                with open(filename, READ) as file:
-                    stylesheet = file.read()
-                    self.setStyleSheet(stylesheet)
+                self.setStyleSheet(get_stylesheet(filename))
             else:
                 raise FileNotFoundError(f"Stylesheet file not found: {filename}")
         except FileNotFoundError as fnf_error:
@@ -4,21 +4,27 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
                              QComboBox, QFormLayout, QMessageBox, QWidget, QScrollArea)
 from PyQt5.QtCore import Qt
 
-from utils.type_names import AREAS, UNITS, DIE1, DIE2, DIE
+from gui.stylesheets import get_stylesheet
+
+from utils.type_names import AREAS, UNITS, DIE
+from utils.chip_dimensions import ChipDimensions
 from utils.filter_types import FILTER_TYPES_NAMES, CLUSTER, QUAD, THREADID, IO, AREA, UNIT
-from utils.constants import WHITE ,X_BUTTON, RED,ROW, COLUMN, READ
+from utils.constants import WHITE ,X_BUTTON, RED,ROW, COLUMN
 from utils.paths import DIALOG_FILTAR_CSS
 from utils.error_messages import WarningMessages
+from utils.tracing import traced
 
 
 class FilterInputDialogWidget(QDialog):
 
-    def __init__(self, filter_type: str, ThreadId_array=None, parent=None) -> None:
+    @traced()
+    def __init__(self, filter_type: str, ThreadId_array=None, parent=None, dimensions: ChipDimensions = None) -> None:
         """Initialize the dialog with a filter name."""
         super().__init__(parent)
         self.filter_type = filter_type  # Store the filter name to customize the dialog
         self.parent = parent  # Reference to the parent widget
         self.ThreadId_array = ThreadId_array or []  # Initialize ThreadId_array
+        self.dimensions = dimensions or ChipDimensions()  # The chips, dies, quads and clusters to choose from
         self.initUI()
 
     def initUI(self) -> None:
@@ -46,30 +52,21 @@ class FilterInputDialogWidget(QDialog):
 
         try:
             if self.filter_type == FILTER_TYPES_NAMES[CLUSTER]:
-                self.chip_input = QComboBox(self)
-                self.chip_input.addItems(['0'])  # Currently only 0 available
-                self.form_layout.addRow('Chip:', self.chip_input)
-                self.die_input = QComboBox(self)
-                self.die_input.addItems([DIE1, DIE2])
-                self.form_layout.addRow(f'{DIE}:', self.die_input)
+                self.add_chip_and_die_inputs()
                 self.quad_input = QComboBox(self)
-                self.quad_input.addItems(['NW', 'NE', 'SW', 'SE'])  # Human-readable options
+                self.quad_input.addItems(self.get_quad_names(['NW', 'NE', 'SW', 'SE']))  # Human-readable options
                 self.form_layout.addRow(f'{QUAD}:', self.quad_input)
+                clusters_per_side = self.dimensions.clusters_per_side
                 self.row_input = QComboBox(self)
-                self.row_input.addItems([str(row) for row in range(8)])  # 0-7 for row
+                self.row_input.addItems([str(row) for row in range(clusters_per_side)])
                 self.form_layout.addRow(f'{ROW}:', self.row_input)
                 self.column_input = QComboBox(self)
-                self.column_input.addItems([str(col) for col in range(8)])  # 0-7 for column
+                self.column_input.addItems([str(col) for col in range(clusters_per_side)])
                 self.form_layout.addRow(f'{COLUMN}:', self.column_input)
             elif self.filter_type == FILTER_TYPES_NAMES[QUAD]:
-                self.chip_input = QComboBox(self)
-                self.chip_input.addItems(['0'])  # Currently only 0 available
-                self.form_layout.addRow('Chip:', self.chip_input)
-                self.die_input = QComboBox(self)
-                self.die_input.addItems([DIE1, DIE2])
-                self.form_layout.addRow(f'{DIE}:', self.die_input)
+                self.add_chip_and_die_inputs()
                 self.quad_input = QComboBox(self)
-                self.quad_input.addItems(['HW', 'NE', 'SW', 'SE'])  # Human-readable options for quad
+                self.quad_input.addItems(self.get_quad_names(['HW', 'NE', 'SW', 'SE']))  # Human-readable options for quad
                 self.form_layout.addRow(f'{QUAD}:', self.quad_input)
             elif self.filter_type == FILTER_TYPES_NAMES[THREADID]:
                 full_width_layout = QVBoxLayout()
@@ -213,6 +210,29 @@ class FilterInputDialogWidget(QDialog):
                 self.error_label.setText("Please enter a valid number.")
                 self.error_label.show()
 
+    def add_chip_and_die_inputs(self) -> None:
+        """Add the chip input and the die input, which lists the dies of the chosen chip."""
+        self.chip_input = QComboBox(self)
+        self.chip_input.addItems([str(chip) for chip in sorted({chip for chip, _ in self.dimensions.die_addresses})])
+        self.form_layout.addRow('Chip:', self.chip_input)
+        self.die_input = QComboBox(self)
+        self.form_layout.addRow(f'{DIE}:', self.die_input)
+        self.chip_input.currentIndexChanged.connect(self.update_die_input)
+        self.update_die_input()
+
+    def update_die_input(self) -> None:
+        """List the dies of the chosen chip, by their id."""
+        chip = int(self.chip_input.currentText() or 0)
+        self.die_ids = [self.dimensions.die_addresses[index][1] for index in self.dimensions.get_dies_of_chip(chip)]
+        self.die_input.clear()
+        self.die_input.addItems([f'{DIE.upper()} {die_id + 1}' for die_id in self.die_ids])
+
+    def get_quad_names(self, names: list) -> list:
+        """The human-readable names of a 2x2 quad grid, or the quad numbers of a larger grid."""
+        if self.dimensions.quads_per_die == len(names):
+            return names
+        return [str(quad) for quad in range(self.dimensions.quads_per_die)]
+
     def setup_buttons(self) -> None:
         """Create and add buttons to the dialog."""
         button_layout = QVBoxLayout()
@@ -239,12 +259,12 @@ class FilterInputDialogWidget(QDialog):
         try:
             if self.filter_type == FILTER_TYPES_NAMES[CLUSTER]:
                 chip_value = (self.chip_input.currentText())  # Convert chip value to integer
-                die_value = (self.die_input.currentIndex())  # Index corresponds to Die 1 => 0, Die 2 => 1
+                die_value = self.die_ids[self.die_input.currentIndex()]  # The id of the die, Die 1 => 0, Die 2 => 1
                 quad_value = (self.quad_input.currentIndex())  # Index corresponds to HW => 0, NE => 1, SW => 2, SE => 3
 
                 # Reverse the quad value if Die 2 is selected
                 if die_value == 1:  # This corresponds to Die 2
-                    quad_value = 3 - quad_value  # Reverse: 0 -> 3, 1 -> 2, 2 -> 1, 3 -> 0
+                    quad_value = self.dimensions.quads_per_die - 1 - quad_value  # Reverse: 0 -> 3, 1 -> 2, 2 -> 1, 3 -> 0
 
                 row_value = (self.row_input.currentText())  # Row as integer
                 column_value = (self.column_input.currentText())  # Column as integer
@@ -253,12 +273,12 @@ class FilterInputDialogWidget(QDialog):
 
             elif self.filter_type == FILTER_TYPES_NAMES[QUAD]:
                 chip_value = int(self.chip_input.currentText())  # Convert chip value to integer
-                die_value = int(self.die_input.currentIndex())
+                die_value = self.die_ids[self.die_input.currentIndex()]
                 quad_value = int(self.quad_input.currentIndex())
 
                 # Reverse the quad value if Die 2 is selected
                 if die_value == 1:  # Die 2 selected
-                    quad_value = 3 - quad_value  # Reverse the quad selection
+                    quad_value = self.dimensions.quads_per_die - 1 - quad_value  # Reverse the quad selection
 
                 values = (chip_value, die_value, quad_value)
 
@@ -295,8 +315,6 @@ class FilterInputDialogWidget(QDialog):
     def load_stylesheet(self, filename):
         """Load a stylesheet from a file and set it to the dialog."""
         if os.path.exists(filename):
-            with open(filename, READ) as file:
-                stylesheet = file.read()
-                self.setStyleSheet(stylesheet)
+            self.setStyleSheet(get_stylesheet(filename))
         else:
             print(WarningMessages.STYLE_SHEET_FILE_NOT_FOUND.value.format(filename=filename))
@@ -138,7 +138,8 @@ class FilterMenuWidget(QMenu):
 
     def show_input_dialog(self, filter_type: str) -> None:
         """Show the input dialog for the selected filter."""
-        dialog = FilterInputDialogWidget(filter_type, self.ThreadId_array, self)
+        dimensions = self.parent.data_manager.dimensions if self.parent is not None else None
+        dialog = FilterInputDialogWidget(filter_type, self.ThreadId_array, self, dimensions)
         dialog.exec_()
 
     from typing import Literal
@@ -7,23 +7,24 @@ from entities.component import Component
 from entities.g2h import G2h
 
 from utils.error_messages import ErrorMessages
-from utils.constants import OBJECT_COLORS, TID, PACKET, UNKNOWN, CLOSE, BLACK, WHITE, VIEW_LOGS, COMPONENT_LOGS, POINTING_CURSOR
+from utils.data_manager import DataManager
+from utils.constants import OBJECT_COLORS, UNKNOWN, CLOSE, BLACK, WHITE, VIEW_LOGS, COMPONENT_LOGS, POINTING_CURSOR
 from utils.type_names import G2H
 
 from gui.component_widget import ComponentWidget
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_node_color
 
 
 
 class G2hWidget(QWidget):
-    def __init__(self, g2h: G2h, parent: Optional[QWidget] = None):
+    def __init__(self, g2h: G2h, parent: Optional[QWidget] = None, data_manager: Optional[DataManager] = None):
         super().__init__(parent)
         self.g2h = g2h
+        self.data_manager = data_manager
+        self.component_widgets = []
         try:
-            self.g2h_tids = self.g2h.get_attribute_from_active_logs(TID)
-            self.colors = get_colors_by_tids(self.g2h_tids)  # Fetch colors
-            self.packet_messages = self.g2h.get_attribute_from_active_logs(PACKET)  # Fetch packet messages
+            self.color = get_node_color(self.g2h.summary, WHITE)  # The color of its dominant TID
         except Exception as e:
             self.show_error_dialog(
                 ErrorMessages.ERROR.value + ErrorMessages.FAILED_TO_RETIEVE_ATTRIBUTE.value.format(attribute="G2H attributes", error=str(e))
@@ -46,16 +47,19 @@ class G2hWidget(QWidget):
 
         # Add g2h_irqa first
         if self.g2h.g2h_irqa:
-            component_widget = ComponentWidget(self.g2h.g2h_irqa, self.g2h.g2h_irqa.type_name)
+            component_widget = ComponentWidget(self.g2h.g2h_irqa, self.g2h.g2h_irqa.type_name,
+                                               data_manager=self.data_manager)
             row, column = 0, 0
             self.components_layout.addWidget(component_widget, row, column)
+            self.component_widgets.append(component_widget)
 
         # Add EQS components
         row = 1
         col = 0
         for eq in self.g2h.eqs:
-            component_widget = ComponentWidget(eq, eq.type_name)
+            component_widget = ComponentWidget(eq, eq.type_name, data_manager=self.data_manager)
             self.components_layout.addWidget(component_widget, row, col)
+            self.component_widgets.append(component_widget)
             col += 1
             limit_col = 7
             if col >= limit_col:
@@ -75,13 +79,19 @@ class G2hWidget(QWidget):
         self.setLayout(self.layout)
         self.setVisible(False)
 
+    def refresh(self) -> None:
+        # Restyles the components from the activity of a new snapshot
+        self.color = get_node_color(self.g2h.summary, WHITE)
+        for component_widget in self.component_widgets:
+            component_widget.refresh()
+
     def create_component_button(self, component: Component, row: Optional[int] = None,
                                 col: Optional[int] = None) -> None:
         if component is None:
             return
 
         color = OBJECT_COLORS.get(component.type_name, WHITE)
-        first_color = self.colors[0] if self.colors else WHITE
+        first_color = self.color
 
         button = QPushButton(component.type_name or UNKNOWN, self)
         button.setFixedSize(150, 50)
@@ -104,7 +114,8 @@ class G2hWidget(QWidget):
         context_menu.exec_(global_pos)
 
     def show_logs(self, component: Component) -> None:
-        dialog = LogColorDialog(self.g2h, COMPONENT_LOGS.format(component=component.type_name), self)
+        dialog = LogColorDialog(self.g2h, COMPONENT_LOGS.format(component=component.type_name), self,
+                                self.data_manager)
         dialog.exec_()
 
     def show_error_dialog(self, title: str, message: str) -> None:
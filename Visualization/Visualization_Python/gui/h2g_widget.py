@@ -6,22 +6,21 @@ from PyQt5.QtCore import Qt, QSize, QPoint
 from entities.component import Component
 from entities.h2g import H2g
 
-from utils.constants import OBJECT_COLORS, TID, PACKET, CLOSE, BLACK, WHITE, VIEW_LOGS,POINTING_CURSOR,COMPONENT_LOGS
+from utils.constants import OBJECT_COLORS, CLOSE, BLACK, WHITE, VIEW_LOGS,POINTING_CURSOR,COMPONENT_LOGS
 from utils.type_names import H2G
 from utils.error_messages import ErrorMessages
+from utils.data_manager import DataManager
 
-from gui.packets_colors import get_colors_by_tids
 from gui.component_widget import ComponentWidget
 from gui.log_colors_dialog import LogColorDialog
 
 class H2gWidget(QWidget):
 
-    def __init__(self, h2g: H2g, parent: Optional[QWidget] = None) -> None:
+    def __init__(self, h2g: H2g, parent: Optional[QWidget] = None, data_manager: Optional[DataManager] = None) -> None:
         super().__init__(parent)
         self.h2g = h2g
-        self.h2g_tids = self.h2g.get_attribute_from_active_logs(TID)  # Fetch TID attributes from logs
-        self.colors = get_colors_by_tids(self.h2g_tids)  # Fetch colors for TIDs
-        self.packet_messages = self.h2g.get_attribute_from_active_logs(PACKET)  # Fetch packet messages
+        self.data_manager = data_manager
+        self.component_widgets = []
         self.initUI()
 
     def initUI(self) -> None:
@@ -66,8 +65,14 @@ class H2gWidget(QWidget):
 
     def add_component_widget(self, component: Component) -> None:
         if component:
-            component_widget = ComponentWidget(component, component.type_name)
+            component_widget = ComponentWidget(component, component.type_name, data_manager=self.data_manager)
             self.components_layout.addWidget(component_widget)
+            self.component_widgets.append(component_widget)
+
+    def refresh(self) -> None:
+        # Restyles the components from the activity of a new snapshot
+        for component_widget in self.component_widgets:
+            component_widget.refresh()
 
     def show_context_menu_area(self, global_pos: QPoint) -> None:
         """ Show a context menu when right-clicked. """
@@ -77,7 +82,7 @@ class H2gWidget(QWidget):
         context_menu.exec_(global_pos)
 
     def show_logs(self) -> None:
-        dialog = LogColorDialog(self.h2g, COMPONENT_LOGS.format(component=self.h2g.type_name), self)
+        dialog = LogColorDialog(self.h2g, COMPONENT_LOGS.format(component=self.h2g.type_name), self, self.data_manager)
         dialog.exec_()
 
     def show_components(self) -> None:
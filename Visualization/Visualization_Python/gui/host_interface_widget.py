@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from PyQt5.QtWidgets import (QPushButton, QVBoxLayout, QLabel, QWidget, QHBoxLayout, QFrame, QMenu, QAction, QMessageBox)
 from PyQt5.QtCore import Qt, QPoint
@@ -9,26 +9,22 @@ from entities.host_interface import HostInterface
 from gui.g2h_widget import G2hWidget
 from gui.h2g_widget import H2gWidget
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_node_color
 
-from utils.constants import OBJECT_COLORS, TID, PACKET, LIGHTGRAY, WHITE, BLACK, COMPONENT_LOGS, VIEW_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR
+from utils.constants import OBJECT_COLORS, LIGHTGRAY, WHITE, BLACK, COMPONENT_LOGS, VIEW_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR
 from utils.type_names import HOST_INTERFACE, H2G, G2H, BMT, PCIE
 from utils.error_messages import ErrorMessages
+from utils.data_manager import DataManager
 
 
 class HostInterfaceWidget(QWidget):
-    def __init__(self, host_interface: HostInterface, parent: Optional[QWidget] = None) -> None:
+    def __init__(self, host_interface: HostInterface, parent: Optional[QWidget] = None,
+                 data_manager: Optional[DataManager] = None) -> None:
         super().__init__(parent)
         self.host_interface = host_interface
-        self.host_interface_tids = self.host_interface.get_attribute_from_active_logs(TID)
-        self.colors = list(get_colors_by_tids(self.host_interface_tids))
-        self.colors_bmt = list(self.get_colors(self.host_interface.bmt))
-        self.colors_H2G = list(self.get_colors(self.host_interface.h2g))
-        self.colors_G2H = list(self.get_colors(self.host_interface.g2h))
-        self.colors_pcie = list(self.get_colors(self.host_interface.pcie))
-        self.packet_messages = self.host_interface.get_attribute_from_active_logs(PACKET)
-
-        self.color_map = self.create_color_map()
+        self.data_manager = data_manager
+        self.component_buttons: Dict[str, Tuple[QPushButton, Component, bool]] = {}  # By the component type
+        self.update_colors()
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_host_interface_logs)
         self.initUI()
@@ -40,18 +36,9 @@ class HostInterfaceWidget(QWidget):
         self.outer_frame.setFrameShape(QFrame.StyledPanel)
         self.outer_frame.setFrameShadow(QFrame.Raised)
 
-        # Ensure color lists are not empty before accessing their elements
-        self.title_color = self.colors[0] if self.colors else WHITE
-        self.title_color_bmt = self.colors_bmt[0] if self.colors_bmt else WHITE
-        self.title_color_H2G = self.colors_H2G[0] if self.colors_H2G else WHITE
-        self.title_color_G2H = self.colors_G2H[0] if self.colors_G2H else WHITE
-        self.title_color_pcie = self.colors_pcie[0] if self.colors_pcie else WHITE
-
         self.title_label = QLabel(HOST_INTERFACE)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet(
-            f'border-bottom: 2px solid {BLACK}; padding-bottom: 5px; margin-bottom: 10px; background-color: {self.title_color}; font-weight: bold;'
-        )
+        self.update_title_style()
 
         self.title_label.setCursor(POINTING_CURSOR)
 
@@ -71,8 +58,10 @@ class HostInterfaceWidget(QWidget):
         self.main_layout.addWidget(self.outer_frame)
         self.setLayout(self.main_layout)
 
-        self.h2g_widget = H2gWidget(self.host_interface.h2g) if self.host_interface.h2g else None
-        self.g2h_widget = G2hWidget(self.host_interface.g2h) if self.host_interface.g2h else None
+        self.h2g_widget = H2gWidget(self.host_interface.h2g, data_manager=self.data_manager) \
+            if self.host_interface.h2g else None
+        self.g2h_widget = G2hWidget(self.host_interface.g2h, data_manager=self.data_manager) \
+            if self.host_interface.g2h else None
 
         self.details_widget = QWidget()
         self.details_layout = QVBoxLayout()
@@ -83,23 +72,34 @@ class HostInterfaceWidget(QWidget):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
+    def update_colors(self) -> None:
+        # The colors of the dominant TIDs, white for the parts without logs
+        self.title_color = self.get_color(self.host_interface)
+        self.title_color_bmt = self.get_color(self.host_interface.bmt)
+        self.title_color_H2G = self.get_color(self.host_interface.h2g)
+        self.title_color_G2H = self.get_color(self.host_interface.g2h)
+        self.title_color_pcie = self.get_color(self.host_interface.pcie)
+
+    def update_title_style(self) -> None:
+        self.title_label.setStyleSheet(
+            f'border-bottom: 2px solid {BLACK}; padding-bottom: 5px; margin-bottom: 10px; background-color: {self.title_color}; font-weight: bold;'
+        )
+
+    def refresh(self) -> None:
+        # Restyles the title, the component buttons and the details from the activity of a new snapshot
+        self.update_colors()
+        self.update_title_style()
+        for button, component, clickable in self.component_buttons.values():
+            self.update_component_button(button, component, clickable)
+        for details_widget in (self.h2g_widget, self.g2h_widget):
+            if details_widget:
+                details_widget.refresh()
+
     def toggle_content(self, event) -> None:
         is_visible = self.component_buttons_layout.isVisible()
         self.component_buttons_layout.setVisible(not is_visible)
         self.details_widget.setVisible(False)
 
-    def create_color_map(self) -> Dict[str, str]:
-        """
-        Create a mapping of TID to colors.
-        """
-        color_map = {}
-        for idx, tid in enumerate(self.host_interface_tids):
-            if idx < len(self.colors):
-                color_map[tid] = self.colors[idx]
-            else:
-                color_map[tid] = WHITE
-        return color_map
-
     def show_context_menu_for_component(self, point: QPoint, component: Component) -> None:
         """Show a context menu for the given component."""
         context_menu = QMenu(self)
@@ -114,9 +114,8 @@ class HostInterfaceWidget(QWidget):
         context_menu = QMenu(self)
         context_menu.exec_(self.mapToGlobal(point))
 
-    def get_colors(self, data) -> list:
-        data_tids = data.get_attribute_from_active_logs(TID)
-        return list(get_colors_by_tids(data_tids))
+    def get_color(self, data) -> str:
+        return get_node_color(data.summary, WHITE) if data else WHITE
 
     def show_error_dialog(self, title: str, message: str) -> None:
         """Show an error dialog with the specified title and message."""
@@ -133,7 +132,19 @@ class HostInterfaceWidget(QWidget):
 
         button = QPushButton(component.type_name, self)
         button.setFixedSize(200, 70)
+        if clickable:
+            # Components without logs are not opened, the activity is checked on the click as it changes by filters
+            button.clicked.connect(
+                lambda: self.show_details(component.type_name) if component.summary.has_activity else None)
+        button.setContextMenuPolicy(Qt.CustomContextMenu)
+        button.customContextMenuRequested.connect(
+            lambda point: self.show_colors_and_logs(component, COMPONENT_LOGS.format(component=component.type_name)))
+        self.component_buttons[component.type_name] = (button, component, clickable)
+        self.update_component_button(button, component, clickable)
 
+        self.component_buttons_layout.layout().addWidget(button)
+
+    def update_component_button(self, button: QPushButton, component: Component, clickable: bool) -> None:
         # Set the background color based on the component type
         if component.type_name == BMT:
             background_color = self.title_color_bmt
@@ -146,25 +157,17 @@ class HostInterfaceWidget(QWidget):
         else:
             background_color = LIGHTGRAY  # Default color if type_name is unrecognized
 
-        if not component.get_attribute_from_active_logs(TID):
+        if not component.summary.has_activity:
             background_color = LIGHTGRAY
             clickable = False
 
-        button.setStyleSheet(
-            f'background-color: {background_color}; border: 2.5px solid  {LIGHTGRAY}; border-radius: 7px; padding: 10px; margin: 10px;')
-
+        style = f'background-color: {background_color}; border: 2.5px solid  {LIGHTGRAY}; border-radius: 7px; padding: 10px; margin: 10px;'
         if clickable:
             button.setCursor(POINTING_CURSOR)
-            button.clicked.connect(lambda: self.show_details(component.type_name))
         else:
             button.setCursor(FORBIDDEN_CURSOR)
-            button.setStyleSheet(button.styleSheet() + f'color: {WHITE};')
-
-        button.setContextMenuPolicy(Qt.CustomContextMenu)
-        button.customContextMenuRequested.connect(
-            lambda point: self.show_colors_and_logs(component, COMPONENT_LOGS.format(component=component.type_name)))
-
-        self.component_buttons_layout.layout().addWidget(button)
+            style += f'color: {WHITE};'
+        button.setStyleSheet(style)
 
     def show_details(self, section_name: str) -> None:
         """Show details for the selected section (H2G or G2H)."""
@@ -196,14 +199,15 @@ class HostInterfaceWidget(QWidget):
             if component is None:
                 raise ValueError(ErrorMessages.COMPONENT_NOT_FOUND.value.format(component=title))
 
-            dialog = LogColorDialog(component, title, self)
+            dialog = LogColorDialog(component, title, self, self.data_manager)
             dialog.exec_()
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR_OCCURRED.value.format(error=str(e)))
 
     def show_host_interface_logs(self, point: QPoint) -> None:
         try:
-            dialog = LogColorDialog(self.host_interface, COMPONENT_LOGS.format(component=HOST_INTERFACE), self)
+            dialog = LogColorDialog(self.host_interface, COMPONENT_LOGS.format(component=HOST_INTERFACE), self,
+                                    self.data_manager)
             dialog.exec_()
         except Exception as e:
             self.show_error_dialog(ErrorMessages.ERROR_OCCURRED.value.format(error=str(e)))
@@ -0,0 +1,98 @@
+import os
+import time
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from gui.range_slider import RangeSlider
+
+from utils.latency import LatencyReport, StallWatchdog, STALL_THRESHOLD_MS, BEAT_INTERVAL_MS
+
+# The watchdog is off unless the report file is given, the stall threshold is optional
+LATENCY_REPORT_ENV = "VISUALIZATION_LATENCY_REPORT"
+STALL_THRESHOLD_ENV = "VISUALIZATION_STALL_MS"
+
+# The interactions measured, from the input to the next paint
+CLICK = "click_to_paint"
+SLIDER_RELEASE = "slider_release_to_paint"
+LINK_PASS = "link_pass_to_paint"  # A filter or a time window linked on the worker
+
+monitor: Optional['LatencyMonitor'] = None
+
+
+class LatencyMonitor(QObject):
+    """
+    Watches the event loop of the GUI thread for stalls and measures the latency of the interactions.
+
+    A click is measured from the input to the next paint of any widget, after the handlers of the input ran.
+    The passes that link the logs on a worker are measured from begin to the paint that follows finish, and so is
+    a release of the timeline slider, from the input to the paint that follows the pass of its time window. The report is saved to the file when the application quits.
+    """
+
+    def __init__(self, app: QApplication, path: str, threshold_ms: float = STALL_THRESHOLD_MS) -> None:
+        super().__init__()
+        self.path = path
+        self.report = LatencyReport()
+        self.watchdog = StallWatchdog(self.report, threshold_ms, BEAT_INTERVAL_MS)
+        self.started: Dict[str, float] = {}  # Interactions waiting for their action to finish
+        self.pending: Dict[str, float] = {}  # Interactions waiting for the next paint
+        self.beat_timer = QTimer(self)
+        self.beat_timer.timeout.connect(self.watchdog.beat)
+        app.installEventFilter(self)
+        app.aboutToQuit.connect(self.save)
+        self.beat_timer.start(BEAT_INTERVAL_MS)
+        self.watchdog.start()
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        event_type = event.type()
+        if event_type == QEvent.Paint:
+            if self.pending:
+                self.record_pending()
+        elif event_type == QEvent.MouseButtonRelease:
+            # A release is seen by the window and by every widget it propagates to, the first one is the input
+            if isinstance(obj, RangeSlider):
+                # The next paint is only the preview, the window is drawn when its pass finishes
+                self.started.setdefault(SLIDER_RELEASE, time.perf_counter())
+            else:
+                self.pending.setdefault(CLICK, time.perf_counter())
+        return False
+
+    def record_pending(self) -> None:
+        now = time.perf_counter()
+        for name, start in self.pending.items():
+            self.report.record(name, (now - start) * 1000)
+        self.pending.clear()
+
+    def begin(self, name: str) -> None:
+        self.started[name] = time.perf_counter()
+
+    def finish(self, name: str) -> None:
+        start = self.started.pop(name, None)
+        if start is not None:
+            self.pending[name] = start
+
+    def save(self) -> None:
+        self.watchdog.stop()
+        self.report.save(self.path)
+
+
+def install_latency_monitor(app: QApplication) -> Optional[LatencyMonitor]:
+    """
+    Starts the monitor if the report file is set in the environment
+    """
+    global monitor
+    path = os.environ.get(LATENCY_REPORT_ENV)
+    if path:
+        monitor = LatencyMonitor(app, path, float(os.environ.get(STALL_THRESHOLD_ENV, STALL_THRESHOLD_MS)))
+    return monitor
+
+
+def begin_interaction(name: str) -> None:
+    if monitor is not None:
+        monitor.begin(name)
+
+
+def finish_interaction(name: str) -> None:
+    if monitor is not None:
+        monitor.finish(name)
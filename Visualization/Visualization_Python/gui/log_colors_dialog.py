@@ -1,39 +1,59 @@
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QWidget, QTextEdit, QScrollArea, QGridLayout, QPushButton, QLineEdit, QLabel
+    QDialog, QVBoxLayout, QWidget, QTextEdit, QScrollArea, QGridLayout, QPushButton, QLineEdit, QLabel, QMessageBox
 )
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from gui.log_rows_worker import LogRowsWorker
 from gui.packets_colors import get_colors_by_tids
 
-from utils.constants import TID, PACKET, BLACK, WHITE, LIGHTGRAY,POINTING_CURSOR
+from utils.constants import BLACK, WHITE, LIGHTGRAY,POINTING_CURSOR
 from utils.paths import SEARCH_ICON_IMAGE
+from utils.data_manager import DataManager
+from utils.error_messages import ErrorMessages
+from utils.tracing import traced
+
+MAX_COLUMNS = 4  # Of the TID buttons
 
 
 class LogColorDialog(QDialog):
-    def __init__(self, data, title: str, parent=None) -> None:
+    @traced()
+    def __init__(self, data, title: str, parent=None, data_manager: Optional[DataManager] = None) -> None:
         super().__init__(parent)
         self.data = data
+        self.data_manager = data_manager  # Links the logs first if only the summaries were loaded
         self.title = title
         self.is_dark_mode = False
         self.current_animation = None
+        self.tids = []
         self.all_packets = []
         self.all_colors = []
+        self.color_tid_map: Dict[str, Set[Any]] = {}  # The TIDs of every color, by the order the colors were seen
+        self.color_buttons: Dict[str, QPushButton] = {}
+        self.row_filter: Optional[Callable[[int], bool]] = None  # Which rows are shown, by their index
+        self.is_loading = True  # Until the worker has sent every row
         self.displayed_packets = []
         self.displayed_colors = []
         self.current_index = 0
         self.batch_size = 20
         self.initUI()
+        self.load_logs()
+
+    def load_logs(self) -> None:
+        # The rows are collected on a worker and added as they come, the logs are linked on demand by it if
+        # until now only the summaries of the nodes were loaded
+        self.worker = LogRowsWorker(self.data, self.data_manager)
+        self.worker.rows_ready.connect(self.add_rows)
+        self.worker.failed.connect(self.show_load_error)
+        self.worker.finished.connect(self.on_logs_loaded)
+        self.worker.start()
+
+    def show_load_error(self, error: str) -> None:
+        QMessageBox.critical(self, "Error", ErrorMessages.ERROR_OCCURRED.value.format(error=error))
 
     def initUI(self) -> None:
         try:
-            self.tids = self.data.get_attribute_from_active_logs(TID)
-            self.all_packets = self.data.get_attribute_from_active_logs(PACKET)
-            self.all_colors = list(get_colors_by_tids(self.tids))
             self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-            color_tid_map = {color: set() for color in self.all_colors}
-            for tid, color in zip(self.tids, self.all_colors):
-                color_tid_map[color].add(tid)
 
             self.setWindowTitle(self.title)
             dialog_layout = QVBoxLayout(self)
@@ -66,38 +86,9 @@ class LogColorDialog(QDialog):
             self.search_bar.textChanged.connect(self.filter_logs)
             dialog_layout.addWidget(self.search_bar)
 
-            # Header for TID buttons
+            # Header for TID buttons, a button is added for every color as the rows come
             self.header_widget = QWidget()
-            header_layout = QGridLayout(self.header_widget)
-            row, col = 0, 0
-            max_columns = 4
-
-            for color, tids in color_tid_map.items():
-                tids_text = str(tids)
-                color_button = QPushButton(f" Thread Id: {tids_text} ")
-                color_button.setToolTip(f"Filter logs for TIDs: {tids_text}")
-                color_button.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {color};
-                        color: {BLACK};
-                        padding: 10px 10px;
-                        margin: 15px;
-                        border-radius: 10px;
-                        font-size: 14px;
-                        border: none;
-                    }}
-                    QPushButton:hover {{
-                        background-color: gray;
-                        color: {BLACK};
-                    }}
-                """)
-                color_button.clicked.connect(lambda _, tids=self.tids: self.handle_tid_selection(tids))
-                color_button.setCursor(POINTING_CURSOR)
-                header_layout.addWidget(color_button, row, col)
-                col += 1
-                if col >= max_columns:
-                    col = 0
-                    row += 1
+            self.header_layout = QGridLayout(self.header_widget)
 
             self.header_widget.setStyleSheet(f"background-color: {WHITE}; padding: 10px; border: none;")
             header_scroll_area = QScrollArea()
@@ -147,23 +138,87 @@ class LogColorDialog(QDialog):
             self.setLayout(dialog_layout)
             self.setStyleSheet(f"background-color: {WHITE}; color: {BLACK};")
 
-            # Initialize with all logs
-            self.update_content(self.all_packets, self.all_colors)
+            self.current_animation = QTimer(self)
+            self.current_animation.timeout.connect(self.load_next_batch)
+
+            # A placeholder until the first rows come
+            self.update_content([], [])
 
         except Exception as e:
             print(f"Error initializing UI: {e}")
 
-    def handle_tid_selection(self, tids: set) -> None:
+    def add_color_button(self, color: str) -> None:
+        color_button = QPushButton()
+        color_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {color};
+                color: {BLACK};
+                padding: 10px 10px;
+                margin: 15px;
+                border-radius: 10px;
+                font-size: 14px;
+                border: none;
+            }}
+            QPushButton:hover {{
+                background-color: gray;
+                color: {BLACK};
+            }}
+        """)
+        color_button.clicked.connect(lambda _, tids=self.color_tid_map[color]: self.handle_tid_selection(tids))
+        color_button.setCursor(POINTING_CURSOR)
+        row, col = divmod(len(self.color_buttons), MAX_COLUMNS)
+        self.header_layout.addWidget(color_button, row, col)
+        self.color_buttons[color] = color_button
+
+    def update_color_button(self, color: str) -> None:
+        tids_text = str(self.color_tid_map[color])
+        self.color_buttons[color].setText(f" Thread Id: {tids_text} ")
+        self.color_buttons[color].setToolTip(f"Filter logs for TIDs: {tids_text}")
+
+    def add_rows(self, rows: List[Tuple[Any, str]]) -> None:
+        # A batch of rows from the worker, the rows that pass the filter shown are added to the logs shown
+        first = len(self.all_packets)
+        tids = [tid for tid, _ in rows]
+        colors = list(get_colors_by_tids(tids))
+        self.tids.extend(tids)
+        self.all_packets.extend(packet for _, packet in rows)
+        self.all_colors.extend(colors)
+
+        changed_colors = set()
+        for tid, color in zip(tids, colors):
+            if color not in self.color_tid_map:
+                self.color_tid_map[color] = set()
+                self.add_color_button(color)
+            if tid not in self.color_tid_map[color]:
+                self.color_tid_map[color].add(tid)
+                changed_colors.add(color)
+        for color in changed_colors:
+            self.update_color_button(color)
+
+        indices = [index for index in range(first, len(self.all_packets))
+                   if self.row_filter is None or self.row_filter(index)]
+        self.append_content([self.all_packets[index] for index in indices],
+                            [self.all_colors[index] for index in indices])
+
+    def on_logs_loaded(self) -> None:
+        self.is_loading = False
+        if not self.displayed_packets:
+            self.update_content([], [])  # The placeholder is replaced by the message that there are no logs
+
+    def show_rows(self, row_filter: Optional[Callable[[int], bool]]) -> None:
+        # Shows the rows that pass the filter, and the rows that pass it as they come
         if self.current_animation:
             self.current_animation.stop()
+        self.row_filter = row_filter
+        indices = [index for index in range(len(self.all_packets)) if row_filter is None or row_filter(index)]
+        self.update_content([self.all_packets[index] for index in indices],
+                            [self.all_colors[index] for index in indices])
 
-        filtered_packets = [pkt for idx, pkt in enumerate(self.all_packets) if self.tids[idx] in tids]
-        filtered_colors = [color for idx, color in enumerate(self.all_colors) if self.tids[idx] in tids]
-
-        self.update_content(filtered_packets, filtered_colors)
+    def handle_tid_selection(self, tids: set) -> None:
+        self.show_rows(lambda index: self.tids[index] in tids)
 
     def show_all_logs(self) -> None:
-        self.update_content(self.all_packets, self.all_colors)
+        self.show_rows(None)
 
     def update_content(self, packets: List[str], colors: List[str]) -> None:
         try:
@@ -172,26 +227,43 @@ class LogColorDialog(QDialog):
             self.displayed_colors = colors
             self.current_index = 0
 
-            # Check if there are no logs available
+            # Check if there are no logs available, or none came yet
             if not packets:
-                no_logs_message = QLabel("No logs available")
-                no_logs_message.setAlignment(Qt.AlignCenter)  # Center the text
-                no_logs_message.setStyleSheet("""
+                message = QLabel("Loading logs..." if self.is_loading else "No logs available")
+                message.setAlignment(Qt.AlignCenter)  # Center the text
+                message.setStyleSheet(f"""
                     font-size: 24px;  /* Larger font size */
                     font-weight: bold;  /* Bold text */
-                    color: red;  /* Change the text color if needed */
+                    color: {'gray' if self.is_loading else 'red'};  /* Change the text color if needed */
                 """)
-                self.content_layout.addWidget(no_logs_message)
+                self.content_layout.addWidget(message)
                 return  # Exit the method since there are no logs to display
 
             self.load_next_batch()
 
             # Start a timer to load more logs
-            self.current_animation = QTimer()
-            self.current_animation.timeout.connect(self.load_next_batch)
             self.current_animation.start(100)  # Load a new batch every 100ms
         except Exception as e:
             print(f"Error updating content: {e}")
+
+    def append_content(self, packets: List[str], colors: List[str]) -> None:
+        # Adds rows to the logs shown, they are loaded by the timer after the rows before them
+        if not packets:
+            return
+        if not self.displayed_packets:
+            self.update_content(packets, colors)
+            return
+        self.displayed_packets.extend(packets)
+        self.displayed_colors.extend(colors)
+        if not self.current_animation.isActive():
+            self.current_animation.start(100)
+
+    def done(self, result: int) -> None:
+        # The worker stops collecting rows once the dialog is closed
+        self.current_animation.stop()
+        self.worker.requestInterruption()
+        super().done(result)
+
     def clear_content(self):
         while self.content_layout.count():
             child = self.content_layout.takeAt(0)
@@ -213,9 +285,8 @@ class LogColorDialog(QDialog):
             self.current_animation.stop()
 
     def filter_logs(self, text: str) -> None:
-        filtered_packets = [pkt for pkt in self.all_packets if text.lower() in pkt.lower()]
-        filtered_colors = [self.all_colors[i] for i, pkt in enumerate(self.all_packets) if text.lower() in pkt.lower()]
-        self.update_content(filtered_packets, filtered_colors)
+        text = text.lower()
+        self.show_rows(lambda index: text in self.all_packets[index].lower())
 
     def toggle_dark_and_light_mode(self) -> None:
         self.is_dark_mode = not self.is_dark_mode
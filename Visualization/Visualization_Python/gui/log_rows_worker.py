@@ -0,0 +1,59 @@
+from typing import Any, Optional, Set
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from entities.component import Component
+
+from utils.constants import TID, PACKET
+from utils.data_manager import DataManager
+
+ROWS_PER_BATCH = 200
+
+running_workers: Set['LogRowsWorker'] = set()  # Kept until they finish, a dialog may be closed before
+
+
+class LogRowsWorker(QThread):
+    """
+    Collects the TID and the packet of every active log of an object off the GUI thread, for the logs dialog.
+    The logs are linked first if only the summaries were loaded. The rows are sent in batches as they are
+    collected, so the dialog shows the first logs while the others are still read.
+
+    The worker holds the pass lock of the data manager while it links and collects, so a filter pass on the
+    main worker waits for it and the other way around, and the logs of a dialog opened again are linked once.
+    Closing the dialog interrupts it, also while the logs are linked.
+    """
+    rows_ready = pyqtSignal(list)  # A batch of (TID, packet) rows
+    failed = pyqtSignal(str)
+
+    def __init__(self, component: Component, data_manager: Optional[DataManager] = None) -> None:
+        super().__init__()
+        self.component = component
+        self.data_manager = data_manager
+        self.finished.connect(lambda: running_workers.discard(self))
+
+    def start(self, *args: Any) -> None:
+        running_workers.add(self)
+        super().start(*args)
+
+    def run(self) -> None:
+        try:
+            if self.data_manager is None:
+                self.collect_rows()
+                return
+            with self.data_manager.pass_lock:
+                if self.data_manager.ensure_logs_loaded(self.isInterruptionRequested):
+                    self.collect_rows()
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def collect_rows(self) -> None:
+        rows = []
+        for log in self.component.iter_active_logs():
+            if self.isInterruptionRequested():
+                return
+            rows.append((getattr(log, TID), getattr(log, PACKET)))
+            if len(rows) >= ROWS_PER_BATCH:
+                self.rows_ready.emit(rows)
+                rows = []
+        if rows:
+            self.rows_ready.emit(rows)
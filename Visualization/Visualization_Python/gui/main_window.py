@@ -1,44 +1,61 @@
 import os
+from typing import Optional
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QScrollArea, QApplication, QMainWindow, QAction, QLabel, QDialog, QTextEdit, QMenu,
-    QPushButton, QToolBar, QComboBox, QFrame, QProgressDialog, QStyle, QSizePolicy
+    QWidget, QVBoxLayout, QScrollArea, QMainWindow, QAction, QLabel, QDialog, QTextEdit, QMenu,
+    QPushButton, QToolBar, QComboBox, QFrame, QProgressDialog, QProgressBar, QStyle, QSizePolicy, QMessageBox
 )
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QColor, QIcon
 from PyQt5.QtCore import QPropertyAnimation
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QMovie
+from PyQt5.QtCore import QTimer, QFileSystemWatcher, pyqtSignal
 
 
+from gui.chip_canvas import ChipCanvas
 from gui.die_widget import DieWidget
 from gui.host_interface_widget import HostInterfaceWidget
+from gui.latency_monitor import LINK_PASS, SLIDER_RELEASE, begin_interaction, finish_interaction
 from gui.log_colors_dialog import LogColorDialog
 from gui.timeline_widget import TimelineWidget
 from gui.filter_menu_widget import FilterMenuWidget
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_node_color
+from gui.stylesheets import get_stylesheet
 from gui.file_dialogs.info_widget import InfoDialog
+from gui.widget_cache import WidgetCache
 from gui.worker_thread import WorkerThread
 
 from utils.data_manager import DataManager
-from utils.paths import APP_ICON_IMAGE, INSTRUCTIONS_ICON_IMAGE ,LOADING_ICON_IMAGE
-from utils.type_names import HOST_INTERFACE, DIE1, DIE2, DIE2DIE
-from utils.constants import TID, PACKET, LIGHTGRAY, WHITE, BLACK, FORBIDDEN_CURSOR, SIMULATOR, MAIN_TOOLBAR, DIE2DIE_LOGS, \
-    HOST_INTERFACE_Logs, FILTER, GRAY ,READ
+from utils.progress import ProgressReporter, ScanProgress, format_progress
+from utils.tracing import traced
+from utils.paths import APP_ICON_IMAGE, INSTRUCTIONS_ICON_IMAGE, MAIN_WINDOW_CSS
+from utils.type_names import HOST_INTERFACE, DIE, DIE2DIE
+from utils.constants import LIGHTGRAY, WHITE, BLACK, FORBIDDEN_CURSOR, SIMULATOR, MAIN_TOOLBAR, DIE2DIE_LOGS, \
+    HOST_INTERFACE_Logs, FILTER, GRAY, CHIP
 
+PROGRESS_BAR_WIDTH = 320
+PROGRESS_STEPS = 1000
+SL_RELOAD_RETRY_MS = 200  # The sl file is applied again after this delay while a pass holds the lock
 
 
 
 
 class MainWindow(QMainWindow):
+    activity_changed = pyqtSignal(list)  # The nodes of the topology table that changed since the last update
+
     def __init__(self, data_manager: DataManager):
         super().__init__()
         self.die_widget = None
+        self.chip_canvas = None
         self.data_manager = data_manager
         self.is_closing = False
         self.host_interface_widget = None
         self.dies = {}
+        self.index_thread = None
+        self.is_index_building = False
         self.load_dies()
         self.initUI()
+        self.watch_sl_file()
+        self.build_time_index()
         self.fade_in()
 
     def initUI(self) -> None:
@@ -57,9 +74,18 @@ class MainWindow(QMainWindow):
         self.create_timeline_widget()
         self.create_navbar()
 
-        self.host_interface_widget = HostInterfaceWidget(self.data_manager.host_interface)
+        # The host interface is built once and restyled when it is shown after new logs were linked
+        self.widget_cache = WidgetCache(lambda key: self.data_manager.get_generation(key[1]))
+        self.shown_generation = self.data_manager.topology.generation  # The snapshot the views were updated to
+        self.host_interface_widget = self.get_host_interface_widget()
         self.die_widget = DieWidget(self.data_manager, self.dies, self)
         self.die_widget.setVisible(False)
+        self.timeline_widget.playback_frame.connect(self.die_widget.apply_playback)
+        self.chip_canvas = ChipCanvas(self.data_manager, self)
+        self.chip_canvas.setVisible(False)
+        self.timeline_widget.playback_frame.connect(self.chip_canvas.apply_playback)
+        self.activity_changed.connect(self.die_widget.apply_changes)
+        self.activity_changed.connect(self.chip_canvas.apply_changes)
         self.apply_stylesheet()
 
     def fade_in(self):
@@ -89,54 +115,36 @@ class MainWindow(QMainWindow):
         )
         self.top_layout.addWidget(self.timeline_widget)
 
+    @traced()
     def create_navbar(self) -> None:
-        # Create the navigation bar for the main window
-        if hasattr(self, 'toolBar') and self.toolBar:
-            self.removeToolBar(self.toolBar)
-            self.toolBar = None
-
+        # Create the navigation bar for the main window, once - the filters only update it
         self.toolBar = QToolBar(MAIN_TOOLBAR)
         self.toolBar.setStyleSheet(f"background-color: {LIGHTGRAY}; width: 220px; height: 60px;")
         self.addToolBar(self.toolBar)
 
-
         # Host Interface Button
-        host_interface_colors = self.get_data_colors(self.data_manager.host_interface)
         self.host_interface_button = QPushButton(f'{HOST_INTERFACE} 🖥')
-        if host_interface_colors and self.has_active_logs(self.data_manager.host_interface):
-            self.host_interface_button.setStyleSheet(
-                f"background-color: {host_interface_colors[0]}; color: {BLACK}; padding: 10px;"
-            )
-        else:
-            self.host_interface_button.setEnabled(False)  # Disable the button if there are no active logs
         self.host_interface_button.clicked.connect(self.show_host_interface)
         self.host_interface_button.setContextMenuPolicy(Qt.CustomContextMenu)
         self.host_interface_button.customContextMenuRequested.connect(self.show_host_interface_logs_and_colors)
         self.toolBar.addWidget(self.host_interface_button)
 
-        # DIE1 Button
-        die1_colors = self.get_data_colors(
-            self.dies.get(0))  # Ensure this method exists and returns a color or a list of colors
-        self.die1_button = self.create_toolbar_button(f'{DIE1} 🔲', self.show_die1, index=0)
-        if not self.is_die1_enable():
-            self.die1_button.setEnabled(False)
-        self.toolBar.addWidget(self.die1_button)
-
-        # DIE2 Button
-        self.die2_button = self.create_toolbar_button(f'{DIE2} 🔲', self.show_die2, index=1)
-        if not self.is_die2_enable():
-            self.die2_button.setEnabled(False)
-            self.die2_button.setStyleSheet(f"background-color: {LIGHTGRAY}; color: {GRAY}; padding: 10px;")
-        self.toolBar.addWidget(self.die2_button)
-
-        die2die_colors = self.get_data_colors(self.data_manager.die2die)
+        # A button for every die of every chip
+        self.die_buttons = []
+        for die_index in sorted(self.dies):
+            die_button = self.create_toolbar_button(f'{self.get_die_label(die_index)} 🔲',
+                                                    lambda checked=False, index=die_index: self.show_die(index),
+                                                    index=die_index)
+            self.toolBar.addWidget(die_button)
+            self.die_buttons.append(die_button)
+
+        # The whole system on a single canvas
+        self.chip_button = QPushButton(f'{CHIP.upper()} 🔍')
+        self.chip_button.setStyleSheet(f"background-color: #6e6e6e; color: {WHITE}; padding: 10px;")
+        self.chip_button.clicked.connect(self.show_chip_canvas)
+        self.toolBar.addWidget(self.chip_button)
+
         self.die2die_button = QPushButton(f'{DIE2DIE} 🔲 ↔️ 🔲')
-        if die2die_colors:
-            self.die2die_button.setStyleSheet(
-                f"padding: 10px; background-color: {die2die_colors[0]}; color: {BLACK};"
-            )
-        else:
-            self.die2die_button.setStyleSheet(f"padding: 10px; background-color: #6e6e6e; color: {WHITE};")
         self.die2die_button.clicked.connect(self.clear_content)
         self.die2die_button.setContextMenuPolicy(Qt.CustomContextMenu)
         self.die2die_button.customContextMenuRequested.connect(self.show_die2die_logs)
@@ -163,31 +171,65 @@ class MainWindow(QMainWindow):
         self.info_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.info_button.clicked.connect(self.show_info_dialog)
         self.toolBar.addWidget(self.info_button)
-        with open("gui/styles.css", READ, encoding='utf-8') as f:
-            self.setStyleSheet(f.read())
+        self.update_navbar()
+
+    @traced()
+    def update_navbar(self) -> None:
+        # Color and enable the buttons from the activity of the logs, after the logs were linked again
+        host_interface_color = get_node_color(self.data_manager.host_interface.summary, None)
+        if host_interface_color and self.has_active_logs(self.data_manager.host_interface):
+            self.set_button_style(self.host_interface_button, True,
+                                  f"background-color: {host_interface_color}; color: {BLACK}; padding: 10px;")
+        else:
+            # Disable the button if there are no active logs
+            self.set_button_style(self.host_interface_button, False, "")
+
+        for die_index, die_button in zip(sorted(self.dies), self.die_buttons):
+            if not self.is_die_enable(die_index):
+                self.set_button_style(die_button, False,
+                                      f"background-color: {LIGHTGRAY}; color: {GRAY}; padding: 10px;")
+            else:
+                self.set_button_style(die_button, True,
+                                      f"background-color: {self.get_die_color(die_index)}; color: {BLACK}; padding: 10px;")
+
+        die2die_color = get_node_color(self.data_manager.die2die.summary, None)
+        if die2die_color:
+            self.set_button_style(self.die2die_button, True,
+                                  f"padding: 10px; background-color: {die2die_color}; color: {BLACK};")
+        else:
+            self.set_button_style(self.die2die_button, True,
+                                  f"padding: 10px; background-color: #6e6e6e; color: {WHITE};")
+
+    @staticmethod
+    def set_button_style(button: QPushButton, enabled: bool, style: str) -> None:
+        # Qt polishes the button again on every setStyleSheet, even for the same style
+        if button.isEnabled() != enabled:
+            button.setEnabled(enabled)
+        if button.styleSheet() != style:
+            button.setStyleSheet(style)
 
     def show_info_dialog(self) -> None:
         info_dialog = InfoDialog(self)
         info_dialog.exec_()
 
-    def is_die1_enable(self) -> bool:
-        # Check if DIE1 is enabled
-        return self.data_manager.die_objects[0].is_enable and self.get_colors_for_index(0)
+    def is_die_enable(self, die_index: int) -> bool:
+        # Check if the die is enabled
+        return self.data_manager.die_objects[die_index].is_enable and self.get_die_color(die_index) is not None
 
-    def is_die2_enable(self) -> bool:
-        # Check if DIE2 is enabled
-        return self.data_manager.die_objects[1].is_enable and self.get_colors_for_index(1)
+    def get_die_label(self, die_index: int) -> str:
+        # DIE 1, DIE 2... of a single chip, CHIP 0 DIE 1... of a system of several chips
+        dimensions = self.data_manager.dimensions
+        chip, die_id = dimensions.die_addresses[die_index]
+        die_label = f"{DIE.upper()} {die_id + 1}"
+        return die_label if dimensions.num_chips == 1 else f"{CHIP.upper()} {chip} {die_label}"
 
     def has_active_logs(self, data) -> bool:
         # Check if there are active logs in the given data
-        return bool(data.get_attribute_from_active_logs(TID))  # Adjust the method as necessary
+        return data.summary.has_activity
 
     def create_toolbar_button(self, text: str, click_action, index: int = None) -> QPushButton:
-        # Create a toolbar button with optional colors and actions
+        # Create a toolbar button with its actions, colored by update_navbar
         button = QPushButton(text)
-        colors = self.get_colors_for_index(index)
-        if colors:
-            button.setStyleSheet(f"background-color: {colors[0]}; color: {BLACK}; padding: 10px;")
         button.clicked.connect(click_action)
         button.setContextMenuPolicy(Qt.CustomContextMenu)
         button.customContextMenuRequested.connect(
@@ -195,30 +237,21 @@ class MainWindow(QMainWindow):
         )
         return button
 
-    def get_colors_for_index(self, index: int) -> list:
-        # Get colors for the given die index
-        if index is None:
-            return []
+    def get_die_color(self, index: int) -> Optional[str]:
+        # The color of the dominant TID of the die, None if it has no logs
         die_data = self.dies.get(index)
         if die_data:
-            tids = die_data.get_attribute_from_active_logs(TID)
-            return list(get_colors_by_tids(tids))
-        return []
-
-    def get_data_colors(self, data) -> list:
-        # Get colors for the host interface
-        tids = data.get_attribute_from_active_logs(TID)
-        return list(get_colors_by_tids(tids))
+            return get_node_color(die_data.summary, None)
+        return None
 
     def load_dies(self) -> None:
-        # Load DIE1 and DIE2 from the data manager
-        self.dies[0] = self.data_manager.load_die(0)
-        self.dies[1] = self.data_manager.load_die(1)
+        # Load all the dies of all the chips from the data manager
+        for die_index in range(self.data_manager.topology.num_dies):
+            self.dies[die_index] = self.data_manager.load_die(die_index)
 
-    def apply_stylesheet(self) -> str:
+    def apply_stylesheet(self) -> None:
         # Apply stylesheet from external CSS file
-        with open("gui/styles.css", 'r', encoding='utf-8') as f:
-            self.setStyleSheet(f.read())
+        self.setStyleSheet(get_stylesheet(MAIN_WINDOW_CSS))
 
     def clear_content(self) -> None:
         # Clear the content in the scroll area
@@ -244,24 +277,33 @@ class MainWindow(QMainWindow):
         self.die_widget.show_quads(die_index)
 
 
+    def show_chip_canvas(self) -> None:
+        # Display every die of every chip, zoomable down to the units of a cluster
+        self.clear_content()
+        self.chip_canvas.setVisible(True)
+        self.scroll_content_layout.addWidget(self.chip_canvas)
+        self.chip_canvas.refresh()
+
     def show_host_interface(self) -> None:
         self.clear_content()
-        self.host_interface_widget = HostInterfaceWidget(self.data_manager.host_interface)
+        self.host_interface_widget = self.get_host_interface_widget()
+        self.host_interface_widget.setVisible(True)
         self.scroll_content_layout.addWidget(self.host_interface_widget)
 
     def show_host_interface_logs_and_colors(self, pos) -> None:
-        dialog = LogColorDialog(self.data_manager.host_interface, HOST_INTERFACE_Logs, self)
+        dialog = LogColorDialog(self.data_manager.host_interface, HOST_INTERFACE_Logs, self, self.data_manager)
         dialog.exec_()
 
     def show_die_colors_and_logs(self, index) -> None:
         die_data = self.dies.get(index)
         if die_data:
-            dialog = LogColorDialog(die_data, f"DIE{index + 1} Logs and Colors", self)
+            dialog = LogColorDialog(die_data, f"{self.get_die_label(index)} Logs and Colors", self,
+                                    self.data_manager)
             dialog.exec_()
 
     def show_die2die_logs(self, pos):
 
-        dialog = LogColorDialog(self.data_manager.die2die, DIE2DIE_LOGS, self)
+        dialog = LogColorDialog(self.data_manager.die2die, DIE2DIE_LOGS, self, self.data_manager)
         dialog.exec_()
 
     def show_filter_menu(self) -> None:
@@ -284,40 +326,128 @@ class MainWindow(QMainWindow):
         self.overlay.setStyleSheet("background-color: transparent;")
         self.overlay.setWindowFlags(Qt.WindowStaysOnTopHint)
 
-        self.gif_label = QLabel(self.overlay)
-        self.gif_label.setAlignment(Qt.AlignCenter)
-        gif_path = os.path.join(os.getcwd(), LOADING_ICON_IMAGE)
-        self.movie = QMovie(gif_path)
-        self.movie.setScaledSize(QSize(200, 200))
-        self.gif_label.setMovie(self.movie)
-
-        self.gif_label.setGeometry(self.overlay.rect())
+        # The progress of the pass replaces the spinner, it is busy until the worker reports the size of the window
+        layout = QVBoxLayout(self.overlay)
+        layout.setAlignment(Qt.AlignCenter)
+        self.progress_label = QLabel(message, self.overlay)
+        self.progress_label.setAlignment(Qt.AlignCenter)
+        self.progress_bar = QProgressBar(self.overlay)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setFixedWidth(PROGRESS_BAR_WIDTH)
+        layout.addWidget(self.progress_label)
+        layout.addWidget(self.progress_bar)
 
         self.overlay.show()
-        self.movie.start()
         self.overlay.raise_()
-        self.gif_label.raise_()
-        QApplication.processEvents()
+
+    def show_progress(self, progress: ScanProgress) -> None:
+        if not hasattr(self, 'overlay'):
+            return
+        fraction = progress.fraction
+        if fraction is not None:
+            self.progress_bar.setRange(0, PROGRESS_STEPS)
+            self.progress_bar.setValue(int(fraction * PROGRESS_STEPS))
+        self.progress_label.setText(format_progress(progress))
 
     def hide_wait_message(self):
         if hasattr(self, 'overlay'):
-            self.movie.stop()
             self.overlay.hide()
             self.overlay.deleteLater()
             del self.overlay
             self.setWindowOpacity(1.0)
 
     def perform_action_with_wait(self, action, *args):
+        begin_interaction(LINK_PASS)
         self.show_wait_message("Please wait, processing...")
 
-        self.worker_thread = WorkerThread(action, args)
+        # The pass waits for a logs dialog that links the logs on its own worker
+        self.worker_thread = WorkerThread(action, args, self.data_manager.pass_lock)
         self.worker_thread.finished.connect(self.on_action_finished)
+        self.worker_thread.failed.connect(self.on_action_failed)
+        # The pass reports its progress and the activity linked so far, drawn like the frames of a playback
+        self.worker_thread.progress.connect(self.show_progress)
+        self.worker_thread.partial_frame.connect(self.die_widget.apply_playback)
+        self.worker_thread.partial_frame.connect(self.chip_canvas.apply_playback)
+        self.data_manager.progress_reporter = ProgressReporter(self.worker_thread.progress.emit,
+                                                               self.worker_thread.partial_frame.emit)
         self.worker_thread.start()
 
     def on_action_finished(self):
+        self.data_manager.progress_reporter = None
         self.hide_wait_message()
-        self.clear_content()
-        self.create_navbar()
+        finish_interaction(LINK_PASS)
+        finish_interaction(SLIDER_RELEASE)
+        self.update_navbar()
+        # Only the parts of the view shown whose activity changed are drawn again, the other views when they are shown
+        self.emit_activity_changes()
+        if self.host_interface_widget.isVisible():
+            self.get_host_interface_widget()
+        elif not self.chip_canvas.isVisible() and not self.die_widget.isVisible():
+            self.clear_content()
+        # The playback is not filtered, it is disabled while filters are applied
+        self.timeline_widget.update_playback_buttons()
+        # A pass that changes the enabled clusters with drop_disabled_logs drops the time index
+        if self.data_manager.time_index is None and not self.is_index_building:
+            self.timeline_widget.on_time_index_changed()
+            self.build_time_index()
+
+    def build_time_index(self) -> None:
+        # The time index is a pass over the whole log file, it is built on a worker and the timeline is empty until then
+        if self.is_index_building:
+            return
+        self.is_index_building = True
+        self.index_thread = WorkerThread(self.data_manager.build_time_index, (), self.data_manager.pass_lock)
+        self.index_thread.finished.connect(self.on_time_index_built)
+        self.index_thread.failed.connect(self.on_action_failed)
+        self.index_thread.start()
+
+    def on_time_index_built(self) -> None:
+        self.is_index_building = False
+        self.timeline_widget.on_time_index_changed()
+
+    def on_action_failed(self, error: str) -> None:
+        QMessageBox.warning(self, "Warning", error)
+
+    def emit_activity_changes(self) -> None:
+        topology = self.data_manager.topology
+        self.activity_changed.emit(topology.get_changed_nodes(self.shown_generation))
+        self.shown_generation = topology.generation
+
+    def watch_sl_file(self) -> None:
+        # The sl file is applied again whenever it changes, the logs are not reloaded
+        self.sl_watcher = QFileSystemWatcher([self.data_manager.sl_file], self)
+        self.sl_watcher.fileChanged.connect(self.reload_sl)
+
+    def get_host_interface_widget(self) -> HostInterfaceWidget:
+        host_interface = self.data_manager.host_interface
+        return self.widget_cache.get((HostInterfaceWidget, host_interface),
+                                     lambda: HostInterfaceWidget(host_interface, data_manager=self.data_manager))
+
+    def reload_sl(self, path: str) -> None:
+        # Editors may replace the file on save, which removes it from the watcher
+        if path not in self.sl_watcher.files() and os.path.exists(path):
+            self.sl_watcher.addPath(path)
+        if self.data_manager.drop_disabled_logs:
+            # The logs are linked again when the enabled clusters change, which is a pass like a filter change
+            self.perform_action_with_wait(self.data_manager.reload_sl, path)
+            return
+        # The reload changes the enabled clusters and rolls up the topology like a pass does, under the lock of the
+        # passes. While a worker holds it the reload is tried again later, the GUI does not wait for the pass.
+        if not self.data_manager.pass_lock.acquire(blocking=False):
+            QTimer.singleShot(SL_RELOAD_RETRY_MS, lambda: self.reload_sl(path))
+            return
+        try:
+            changed = self.data_manager.reload_sl(path)
+        except (OSError, KeyError, IndexError, ValueError) as e:
+            QMessageBox.warning(self, "Warning", str(e))
+            return
+        finally:
+            self.data_manager.pass_lock.release()
+        if not changed:
+            return
+        # Only the navbar and the dies, quads and clusters that changed are drawn again
+        self.update_navbar()
+        self.emit_activity_changes()
 
     def change_filter(self, filter_type: str, values: list) -> None:
         self.perform_action_with_wait(self.data_manager.change_filter, filter_type, values)
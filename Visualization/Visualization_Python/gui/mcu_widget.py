@@ -7,15 +7,18 @@ from entities.mcu import Mcu
 from utils.constants import POINTING_CURSOR, X_BUTTON, WHITE, RED
 from utils.type_names import MCU
 from utils.error_messages import ErrorMessages  # Import ErrorMessages
+from utils.data_manager import DataManager
 
 MAX_COLS = 4
 
 class McuInfoWidget(QWidget):
     mcu_closed = pyqtSignal()  # Signal to indicate that MCU is closed
 
-    def __init__(self, mcu: Mcu, parent: Optional[QWidget] = None):
+    def __init__(self, mcu: Mcu, parent: Optional[QWidget] = None, data_manager: Optional[DataManager] = None):
         super().__init__(parent)
         self.mcu = mcu
+        self.data_manager = data_manager
+        self.component_widgets = []
         self.initUI()
 
     def initUI(self) -> None:
@@ -42,10 +45,11 @@ class McuInfoWidget(QWidget):
                 from gui.cluster_info_widget import ComponentWidget
 
                 # Create and add component widgets to the grid
-                component_widget = ComponentWidget(component, component.type_name)
+                component_widget = ComponentWidget(component, component.type_name, data_manager=self.data_manager)
                 row = index_component // MAX_COLS
                 col = index_component % MAX_COLS
                 grid_layout.addWidget(component_widget, row, col)
+                self.component_widgets.append(component_widget)
 
         except Exception as e:
             self.show_error_dialog(ErrorMessages.FAILED_TO_RETIEVE_ATTRIBUTE.value.format(attribute="MCU details", error=str(e)))
@@ -57,6 +61,11 @@ class McuInfoWidget(QWidget):
         self.setLayout(layout)
         self.setWindowTitle(f"{MCU} Details: {self.mcu.id}")
 
+    def refresh(self) -> None:
+        # Restyles the components from the activity of a new snapshot
+        for component_widget in self.component_widgets:
+            component_widget.refresh()
+
     def show_error_dialog(self, message: str) -> None:
         """Show an error dialog with the specified message."""
         msg_box = QMessageBox(self)
@@ -1,4 +1,5 @@
-import random
+import zlib
+from typing import Any, List, Optional
 
 # Updated list of bright and colorful colors in RGB format
 colors = [
@@ -11,40 +12,37 @@ colors = [
     '#8080ff', '#80bfff', '#80ffff', '#80ffbf', '#80ff80', '#bfff80', '#ffff80', '#ffbf80',
     '#ff8080', '#ff80a0', '#ff80d4', '#d480ff', '#a080ff', '#80a0ff', '#80d4ff', '#80ffd4'
 ]
+PALETTE = list(dict.fromkeys(colors))  # Without repeated colors
 
-process_tids_colors = {}
-used_colors = set()  # Set to keep track of used colors
+HASH_MULTIPLIER = 0x9E3779B1  # 2^32 / golden ratio, consecutive TIDs get far apart colors
+HASH_BITS = 32
 
 
-def get_random_color() -> str:
-    """Return a random color from the color list that has not been used."""
-    available_colors = [color for color in colors if color not in used_colors]
+def get_palette_index(tid: Any) -> int:
+    """
+    Returns the position of the TID's color in the palette. The position is a hash of the TID itself, so a TID has
+    the same color in every run and process, and nothing is kept per TID. TIDs that are not numbers are hashed
+    by their text.
+    """
+    key = tid if isinstance(tid, int) else zlib.crc32(str(tid).encode())
+    return ((key * HASH_MULTIPLIER) & ((1 << HASH_BITS) - 1)) * len(PALETTE) >> HASH_BITS
 
-    if available_colors:
-        chosen_color = random.choice(available_colors)
-        used_colors.add(chosen_color)  # Mark this color as used
-        return chosen_color
-    else:
-        # Generate a new color if there are no available colors
-        return generate_new_color()
 
-MAX_COLOR_VALUE = 255
-MIN_COLOR_VALUE = 0
+def get_color_by_tid(tid: Optional[Any], default: Optional[str]) -> Optional[str]:
+    """Return the color of a TID, or the default color if there is no TID."""
+    if tid is None:
+        return default
+    return PALETTE[get_palette_index(tid)]
 
-def generate_new_color() -> str:
 
-    # Randomly generate RGB values
-    r = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-    g = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-    b = random.randint(MIN_COLOR_VALUE, MAX_COLOR_VALUE)
-    return f'#{r:02x}{g:02x}{b:02x}'
+def get_colors_by_tids(tids: list) -> List[str]:
+    """Return the color of every TID, in the order of the TIDs."""
+    return [PALETTE[get_palette_index(tid)] for tid in tids]
 
 
-def get_colors_by_tids(tids: list) -> list:
-    result = []
-    for tid in tids:
-        if tid not in process_tids_colors:
-            process_tids_colors[tid] = get_random_color()
-        result.append(process_tids_colors[tid])
-    return result
-
+def get_node_color(summary, default: Optional[str]) -> Optional[str]:
+    """
+    Return the color an object is drawn with - the color of its dominant TID, which its summary keeps,
+    or the default color if it has no logs.
+    """
+    return get_color_by_tid(summary.dominant_tid, default)
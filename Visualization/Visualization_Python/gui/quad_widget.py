@@ -2,7 +2,7 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QGridLayo
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtGui import QMouseEvent
 
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from entities.cluster import Cluster
 from entities.quad import Quad
@@ -10,10 +10,13 @@ from entities.quad import Quad
 from gui.cluster_info_widget import ClusterInfoWidget
 from gui.cluster_widget import ClusterWidget
 from gui.log_colors_dialog import LogColorDialog
-from gui.packets_colors import get_colors_by_tids
+from gui.packets_colors import get_color_by_tid, get_node_color
+from gui.widget_cache import WidgetCache
+
+from utils.data_manager import DataManager
 
 from utils.constants import VIEW_LOGS, QUAD_LOGS, HBM_LOGS, FORBIDDEN_CURSOR, POINTING_CURSOR, \
-    GREEN, ARROW_CURSOR ,TID, PACKET, BLACK, LIGHTGRAY
+    GREEN, ARROW_CURSOR, LIGHTGRAY
 
 COLUMN_LEFT = 0
 COLUMN_RIGHT = 1
@@ -26,23 +29,28 @@ BACK_BUTTON_TEXT = "Back To "
 class QuadWidget(QWidget):
 
 
-    def __init__(self, quad: Quad, is_right_side: bool, parent: Optional[QWidget] = None):
+    def __init__(self, quad: Quad, is_right_side: bool, parent: Optional[QWidget] = None,
+                 widget_cache: Optional[WidgetCache] = None, data_manager: Optional[DataManager] = None):
         super().__init__(parent)
         self.quad = quad
-        self.quad_tids = self.quad.get_attribute_from_active_logs(TID)
-        self.hbm_tids = self.quad.hbm.get_attribute_from_active_logs(TID)
-        self.colors = list(get_colors_by_tids(self.quad_tids))
-        self.hbm_colors = list(get_colors_by_tids(self.hbm_tids))
-        self.packet_messages = self.quad.get_attribute_from_active_logs(PACKET)
-        self.hbm_packet_messages = self.quad.hbm.get_attribute_from_active_logs(PACKET)
+        self.data_manager = data_manager  # Links the logs for the logs dialogs of the quad and its clusters
         self.is_right_side = is_right_side
         self.parent = parent
-        self.is_enable = False
-        self.is_hbm_enable = bool(self.hbm_packet_messages)  # Set based on whether there are HBM logs
-        if self.quad.is_enable and self.colors:
-            self.is_enable = True
+        # The widgets of the clusters, shared with the die view, kept while the quad is closed
+        self.widget_cache = widget_cache if widget_cache is not None else WidgetCache(lambda key: 0)
+        self.cluster_layout: Optional[QGridLayout] = None  # Built on the first open of the quad
+        self.back_button: Optional[QPushButton] = None
+        self.cluster_widgets = []  # The clusters shown, while the quad is opened
+        self.cluster_info_widget: Optional[ClusterInfoWidget] = None  # The cluster shown, while it is opened
+        self.update_state()
         self.initUI()
 
+    def update_state(self) -> None:
+        self.color = get_node_color(self.quad.summary, None)  # The colors of their dominant TIDs
+        self.hbm_color = get_node_color(self.quad.hbm.summary, None)
+        self.is_hbm_enable = self.quad.hbm.summary.has_activity  # Set based on whether there are HBM logs
+        self.is_enable = bool(self.quad.is_enable and self.color)
+
     def initUI(self) -> None:
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -64,24 +72,43 @@ class QuadWidget(QWidget):
         else:
             self.grid_layout.setColumnStretch(COLUMN_RIGHT, COLUMN_STRETCH_FACTOR)
 
-        back_color = LIGHTGRAY
-        if self.colors:
-            back_color = self.colors[0]
+        self.update_style()
+
+    def update_style(self) -> None:
+        back_color = self.color or LIGHTGRAY
 
-        self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {BLACK};')
-        color = "green" if self.is_enable else LIGHTGRAY
+        color = GREEN if self.is_enable else LIGHTGRAY
         self.setStyleSheet(f'background-color: {back_color}; border: 2px dashed {color};')
         self.setEnabled(self.is_enable)
+        self.update_hbm_style()
+
+    def refresh(self) -> None:
+        # Restyles the quad, its hbm and the clusters shown from the activity of a new snapshot
+        self.update_state()
+        self.update_style()
+        self.refresh_clusters()
+
+    def refresh_clusters(self) -> None:
+        # Restyles the clusters shown whose activity changed since they were drawn
+        self.widget_cache.refresh([(ClusterWidget, cluster_widget.cluster) for cluster_widget in self.cluster_widgets])
+        if self.cluster_info_widget is not None:
+            self.widget_cache.refresh([(ClusterInfoWidget, self.cluster_info_widget.cluster)])
 
     def add_hbm(self) -> None:
         # Adds HBM label to the layout
         self.label_hbm = QLabel(self.quad.hbm.type_name + "\n" + self.quad.name[:2], self)
         self.label_hbm.setAlignment(Qt.AlignCenter)
-        hbm_back_color = "grey"
-        if self.hbm_colors:
-            hbm_back_color = self.hbm_colors[0]
 
-        self.label_hbm.setStyleSheet(f"background-color: {hbm_back_color};")
+        if self.is_right_side:
+            self.grid_layout.addWidget(self.label_hbm, 0, COLUMN_RIGHT)
+        else:
+            self.grid_layout.addWidget(self.label_hbm, 0, COLUMN_LEFT)
+
+        # The event does nothing while the HBM has no logs
+        self.label_hbm.mousePressEvent = self.hbm_mouse_press_event
+
+    def update_hbm_style(self) -> None:
+        hbm_back_color = self.hbm_color or "grey"
 
         # Disable the HBM label if there are no logs
         if not self.is_hbm_enable:
@@ -89,19 +116,12 @@ class QuadWidget(QWidget):
                 f"background-color: {LIGHTGRAY}; color: darkgray;")  # Change color to indicate it's disabled
             self.label_hbm.setEnabled(False)  # Disable the label
         else:
+            self.label_hbm.setStyleSheet(f"background-color: {hbm_back_color};")
             self.label_hbm.setEnabled(True)  # Enable the label
 
-        if self.is_right_side:
-            self.grid_layout.addWidget(self.label_hbm, 0, COLUMN_RIGHT)
-        else:
-            self.grid_layout.addWidget(self.label_hbm, 0, COLUMN_LEFT)
-
-        # Only connect the event if HBM is enabled
-        if self.is_hbm_enable:
-            self.label_hbm.mousePressEvent = self.hbm_mouse_press_event
     def hbm_mouse_press_event(self, event: QMouseEvent) -> None:
         # Handles mouse press events on the HBM label
-        if event.button() == Qt.RightButton:
+        if self.is_hbm_enable and event.button() == Qt.RightButton:
             self.show_hbm_log_messages()  # Directly show logs
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
@@ -126,7 +146,7 @@ class QuadWidget(QWidget):
 
     def show_hbm_log_messages(self) -> None:
         try:
-            dialog = LogColorDialog(self.quad.hbm, HBM_LOGS, self)
+            dialog = LogColorDialog(self.quad.hbm, HBM_LOGS, self, self.data_manager)
             dialog.exec_()
         except Exception as e:
             print(f"Error showing HBM log messages: {e}")
@@ -153,7 +173,7 @@ class QuadWidget(QWidget):
     def show_log_messages(self) -> None:
         # Shows quad log messages in a dialog
         try:
-            dialog = LogColorDialog(self.quad, QUAD_LOGS, self)
+            dialog = LogColorDialog(self.quad, QUAD_LOGS, self, self.data_manager)
             dialog.exec_()
         except Exception as e:
             print(f"Error showing log messages: {e}")
@@ -169,103 +189,108 @@ class QuadWidget(QWidget):
             if self.label_quad:
                 self.label_quad.hide()
 
-            if hasattr(self, 'cluster_layout'):
-                while self.cluster_layout.count():
-                    item = self.cluster_layout.takeAt(0)
-                    widget = item.widget()
-                    if widget:
-                        widget.deleteLater()
-
-            self.cluster_layout = QGridLayout()
-            self.cluster_layout.setSpacing(0)
+            if self.cluster_layout is None:
+                self.cluster_layout = QGridLayout()
+                self.cluster_layout.setSpacing(0)
 
-            if self.is_right_side:
-                self.grid_layout.addLayout(self.cluster_layout, 0, COLUMN_LEFT, ROW_SPAN, COL_SPAN)
-            else:
-                self.grid_layout.addLayout(self.cluster_layout, 0, COLUMN_RIGHT, ROW_SPAN, COL_SPAN)
+                if self.is_right_side:
+                    self.grid_layout.addLayout(self.cluster_layout, 0, COLUMN_LEFT, ROW_SPAN, COL_SPAN)
+                else:
+                    self.grid_layout.addLayout(self.cluster_layout, 0, COLUMN_RIGHT, ROW_SPAN, COL_SPAN)
 
+                self.back_button = QPushButton(BACK_BUTTON_TEXT + self.quad.name)
+                self.back_button.setCursor(POINTING_CURSOR)
+                self.back_button.setStyleSheet(f'background-color : {LIGHTGRAY}')
+                self.back_button.clicked.connect(self.show_previous_state)
+                self.cluster_layout.addWidget(self.back_button, len(self.quad.clusters), 0, ROW_SPAN,
+                                              len(self.quad.clusters[0]))
 
+            # The clusters of an earlier open are shown again, restyled only if the logs changed since
+            self.cluster_widgets = []
             for row in self.quad.clusters:
                 for cluster in row:
                     if cluster is not None:
-                        cluster_widget = ClusterWidget(cluster, self)
-                        self.cluster_layout.addWidget(cluster_widget, cluster.row, cluster.col)
-
-
-            back_button = QPushButton(BACK_BUTTON_TEXT + self.quad.name)
-            back_button.setCursor(POINTING_CURSOR)
-            back_button.setStyleSheet(f'background-color : {LIGHTGRAY}')
-            back_button.clicked.connect(self.show_previous_state)
-            self.cluster_layout.addWidget(back_button, len(self.quad.clusters), 0, ROW_SPAN, len(self.quad.clusters[0]))
+                        cluster_widget = self.widget_cache.get(
+                            (ClusterWidget, cluster),
+                            lambda cluster=cluster: ClusterWidget(cluster, self, self.data_manager))
+                        if self.cluster_layout.indexOf(cluster_widget) < 0:
+                            self.cluster_layout.addWidget(cluster_widget, cluster.row, cluster.col)
+                        cluster_widget.show()
+                        self.cluster_widgets.append(cluster_widget)
+            self.back_button.show()
 
             self.setCursor(ARROW_CURSOR)
 
         except Exception as e:
             print(f"Error showing clusters: {e}")
+
+    def hide_clusters(self) -> None:
+        for cluster_widget in self.cluster_widgets:
+            cluster_widget.hide()
+        if self.back_button:
+            self.back_button.hide()
+        self.cluster_widgets = []
+
     def show_previous_state(self) -> None:
         # Shows the previous state of the widget
         try:
             if self.label_quad:
                 self.label_quad.show()
-            if hasattr(self, 'cluster_layout'):
-                while self.cluster_layout.count():
-                    item = self.cluster_layout.takeAt(0)
-                    widget = item.widget()
-                    if widget:
-                        widget.deleteLater()
-                self.grid_layout.removeItem(self.cluster_layout)
-                del self.cluster_layout
+            self.hide_clusters()
         except Exception as e:
             print(f"Error showing previous state: {e}")
 
+    def apply_playback(self, tids: Dict[object, Optional[int]], get_node: Callable[[object], object]) -> None:
+        # Colors the quad, its hbm and the clusters shown by the dominant TIDs of a playback frame that changed
+        quad_node = get_node(self.quad)
+        if quad_node in tids:
+            color = GREEN if self.is_enable else LIGHTGRAY
+            self.setStyleSheet(f'background-color: {get_color_by_tid(tids[quad_node], LIGHTGRAY)}; '
+                               f'border: 2px dashed {color};')
+        hbm_node = get_node(self.quad.hbm)
+        if hbm_node in tids and self.is_hbm_enable:
+            self.label_hbm.setStyleSheet(f"background-color: {get_color_by_tid(tids[hbm_node], LIGHTGRAY)};")
+        for cluster_widget in self.cluster_widgets:
+            cluster_node = get_node(cluster_widget.cluster)
+            if cluster_node in tids:
+                cluster_widget.set_activity_tid(tids[cluster_node])
+
     def show_quad_info(self) -> None:
         # Displays information about the quad
         try:
-            cluster_info_widget = ClusterInfoWidget(self.quad)
+            cluster_info_widget = ClusterInfoWidget(self.quad, data_manager=self.data_manager)
             cluster_info_widget.show()
         except Exception as e:
             print(f"Error showing quad info: {e}")
 
     def show_cluster_info(self, cluster: Cluster) -> None:
-        # Displays information about the cluster
-        self.clear_layout()
-        cluster_info_widget = ClusterInfoWidget(cluster, self)
-        self.layout.addWidget(cluster_info_widget)
+        # Displays information about the cluster instead of the quad
+        self.hide_clusters()
+        self.label_quad.hide()
+        self.label_hbm.hide()
+        self.cluster_info_widget = self.widget_cache.get((ClusterInfoWidget, cluster),
+                                                         lambda: ClusterInfoWidget(cluster, self, self.data_manager))
+        if self.layout.indexOf(self.cluster_info_widget) < 0:
+            self.layout.addWidget(self.cluster_info_widget)
+        self.cluster_info_widget.show()
 
     def show_quad(self, init: Optional[bool] = 0) -> None:
-        # Updates and shows the quad widget
+        # Updates and shows the quad widget, after the cluster shown was closed
+        if self.cluster_info_widget is not None:
+            self.cluster_info_widget.hide()
+            self.cluster_info_widget = None
         if self.is_enable:
             self.setCursor(POINTING_CURSOR)
         else:
             self.setCursor(FORBIDDEN_CURSOR)
-        self.setStyleSheet(f'border: 2px dashed {BLACK};')
-        back_color = LIGHTGRAY
-        if self.colors:
-            back_color = self.colors[0]
-        color =GREEN if self.is_enable else LIGHTGRAY
-        self.setStyleSheet(f'background-color:{back_color}; border: 2px dashed {color};')
-
-        self.clear_layout()
-
-        self.grid_layout = QGridLayout()
-        self.layout.addLayout(self.grid_layout)
-
-        self.label_quad = QLabel(self.quad.name, self)
-        self.label_quad.setAlignment(Qt.AlignCenter)
-        if self.is_right_side:
-            self.grid_layout.addWidget(self.label_quad, 0, COLUMN_LEFT)
-        else:
-            self.grid_layout.addWidget(self.label_quad, 0, COLUMN_RIGHT)
-        self.add_hbm()
-
-        if self.is_right_side:
-            self.grid_layout.setColumnStretch(COLUMN_LEFT, COLUMN_STRETCH_FACTOR)
-        else:
-            self.grid_layout.setColumnStretch(COLUMN_RIGHT, COLUMN_STRETCH_FACTOR)
+        self.update_style()
+        self.label_hbm.show()
 
         self.adjustSize()
         if init:
             self.show_clusters()
+        else:
+            self.show_previous_state()
 
     def clear_layout(self, layout: Optional[QGridLayout] = None) -> None:
         if layout is None:
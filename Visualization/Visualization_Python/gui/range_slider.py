@@ -2,9 +2,11 @@ from PyQt5.QtCore import Qt, QTime, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QSlider, QToolTip
 from PyQt5.QtGui import QMouseEvent, QPainter, QColor, QPen
 import datetime
+from typing import Tuple
 
 class RangeSlider(QSlider):
     range_changed = pyqtSignal(int, int)
+    range_preview = pyqtSignal(int, int)  # The tentative range while a handle is dragged
 
     def __init__(self, orientation: Qt.Orientation, main_window: QWidget = None) -> None:
         super().__init__(orientation, main_window)
@@ -28,10 +30,13 @@ class RangeSlider(QSlider):
             }
         """)
         self.start_time = datetime.datetime.now()
+        self.histogram = []  # Number of logs in each pixel column of the slider, drawn behind the handles
+        self.preview_text = ""  # Summary of the tentative range, shown in the tooltip while a handle is dragged
 
     def paintEvent(self, event) -> None:
         super().paintEvent(event)
         painter = QPainter(self)
+        self.draw_histogram(painter)
 
         handle_radius = 7
 
@@ -59,6 +64,20 @@ class RangeSlider(QSlider):
             temp_end_pos = max(handle_radius, min(self.width() - handle_radius, self.positionFromValue(self.temp_end_pos)))
             painter.drawEllipse(temp_end_pos - handle_radius, self.height() // 2 - handle_radius, handle_radius * 2, handle_radius * 2)
 
+    def draw_histogram(self, painter: QPainter) -> None:
+        """
+        Draws the density of the logs over time as a bar for every pixel column, scaled to the busiest column.
+        """
+        peak = max(self.histogram, default=0)
+        if not peak:
+            return
+        painter.setPen(QPen(QColor(100, 100, 100, 160), 1))
+        height = self.height()
+        for column, count in enumerate(self.histogram):
+            if count:
+                bar_height = max(1, round(height * count / peak))
+                painter.drawLine(column, height, column, height - bar_height)
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         pos = max(0, min(self.maximum(), self.valueFromPosition(event.pos())))
         if abs(pos - self.start_handle_pos) <= 5:
@@ -81,6 +100,7 @@ class RangeSlider(QSlider):
                 else:
                     self.dragging_handle = 'end'
                     self.temp_end_pos = pos
+        self.range_preview.emit(*self.get_temp_range())
         self.update()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
@@ -92,6 +112,8 @@ class RangeSlider(QSlider):
             elif self.dragging_handle == 'end':
                 # Ensure that the end handle never passes the start handle
                 self.temp_end_pos = max(pos, self.start_handle_pos + 1)
+            if self.dragging_handle:
+                self.range_preview.emit(*self.get_temp_range())
             self.update()
         self.updateToolTip(event)
 
@@ -108,6 +130,7 @@ class RangeSlider(QSlider):
             self.end_handle_pos = min(self.maximum(), self.start_handle_pos + 1)
 
         self.dragging_handle = None
+        self.preview_text = ""
         self.range_changed.emit(self.start_handle_pos, self.end_handle_pos)
         self.update()
 
@@ -115,8 +138,20 @@ class RangeSlider(QSlider):
         pos = self.valueFromPosition(event.pos())
         time = self.start_time + datetime.timedelta(seconds=pos)
         formatted_time = time.strftime("%H:%M:%S")
+        if self.dragging_handle and self.preview_text:
+            formatted_time = f"{formatted_time}\n{self.preview_text}"
         QToolTip.showText(event.globalPos(), formatted_time)
 
+    def get_temp_range(self) -> Tuple[int, int]:
+        """
+        Returns the start and end positions the handles would have if the dragged handle was released
+        """
+        if self.dragging_handle == 'start':
+            return self.temp_start_pos, self.end_handle_pos
+        if self.dragging_handle == 'end':
+            return self.start_handle_pos, self.temp_end_pos
+        return self.start_handle_pos, self.end_handle_pos
+
     def valueFromPosition(self, pos: QMouseEvent) -> int:
         return round(self.minimum() + (self.maximum() - self.minimum()) * pos.x() / self.width())
 
@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+from utils.constants import READ
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet(filename: str) -> str:
+    """
+    Returns the content of a stylesheet file, read from the disk once
+    """
+    with open(filename, READ, encoding='utf-8') as file:
+        return file.read()
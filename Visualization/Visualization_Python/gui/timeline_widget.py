@@ -1,17 +1,31 @@
 
-from PyQt5.QtCore import Qt, QTime
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel
+from PyQt5.QtCore import Qt, QTime, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
 
 import datetime
 
 
 from gui.range_slider import RangeSlider
+from utils.time_index import ALL_LOGS
+from utils.time_pyramid import BUCKET_WIDTHS
+
+HISTOGRAM_HEIGHT = 40  # Height of the slider, the density of the logs is drawn in it
+FRAME_INTERVAL_MS = 33  # 30 frames per second
+STEPS_PER_WINDOW = 10  # A playback frame moves the window by about a tenth of its width
+PLAY_TEXT = "Play"
+PAUSE_TEXT = "Pause"
+STEP_BACK_TEXT = "<"
+STEP_FORWARD_TEXT = ">"
+# The playback is played from the time index, which counts every log of the file
+PLAYBACK_FILTERED_TOOLTIP = "Playback shows the logs without the filters, it is disabled while filters are applied"
 
 
 class TimelineWidget(QWidget):
     """
     A QWidget for displaying and controlling a timeline with start and end times.
     """
+    playback_frame = pyqtSignal(dict)  # The dominant TIDs of the nodes that changed in a playback frame
+
     def __init__(self, data_manager, start_time=None, end_time=None, main_window=None) -> None:
         super().__init__(main_window)
         """
@@ -23,11 +37,15 @@ class TimelineWidget(QWidget):
         self.main_window = main_window
         self.previous_start_pos = 0
         self.previous_end_pos = None  # Initialize to None for comparison
+        self.playback = None  # Created when playback starts, from the range of the slider
+        self.playback_timer = QTimer(self)
+        self.playback_timer.timeout.connect(self.play_frame)
         self.initUI()
         self.setupTimes()
 
         # Connect the range_changed signal to update_labels
         self.timeline_slider.range_changed.connect(self.update_labels)
+        self.timeline_slider.range_preview.connect(self.preview_range)
 
     def initUI(self) -> None:
         """
@@ -40,11 +58,51 @@ class TimelineWidget(QWidget):
         self.layout.addWidget(self.start_label)
 
         self.timeline_slider = RangeSlider(Qt.Horizontal, self)
+        self.timeline_slider.setMinimumHeight(HISTOGRAM_HEIGHT)
         self.layout.addWidget(self.timeline_slider)
 
         self.end_label = QLabel(self)
         self.layout.addWidget(self.end_label)
 
+        self.count_label = QLabel(self)
+        self.layout.addWidget(self.count_label)
+
+        self.step_back_button = QPushButton(STEP_BACK_TEXT, self)
+        self.step_back_button.clicked.connect(lambda: self.step_playback(-1))
+        self.layout.addWidget(self.step_back_button)
+
+        self.play_button = QPushButton(PLAY_TEXT, self)
+        self.play_button.clicked.connect(self.toggle_playback)
+        self.layout.addWidget(self.play_button)
+
+        self.step_forward_button = QPushButton(STEP_FORWARD_TEXT, self)
+        self.step_forward_button.clicked.connect(lambda: self.step_playback(1))
+        self.layout.addWidget(self.step_forward_button)
+        self.update_playback_buttons()
+
+    def update_playback_buttons(self) -> None:
+        """
+        Enables the playback once the time index it is played from is built, and while no filter is applied -
+        the frames are counted from the index, they would not match the filtered view.
+        A playback that is running when a filter is applied is stopped.
+        """
+        is_filtered = bool(self.data_manager.active_filters)
+        enabled = self.data_manager.time_index is not None and not is_filtered
+        if not enabled:
+            self.stop_playback()
+        for button in (self.step_back_button, self.play_button, self.step_forward_button):
+            button.setEnabled(enabled)
+            button.setToolTip(PLAYBACK_FILTERED_TOOLTIP if is_filtered else "")
+
+    def on_time_index_changed(self) -> None:
+        """
+        Draws the histogram and the counts of the range again, after the time index was built or dropped
+        """
+        self.stop_playback()
+        self.update_playback_buttons()
+        self.update_histogram()
+        self.set_window_summary(self.timeline_slider.start_handle_pos, self.timeline_slider.end_handle_pos)
+
     def setupTimes(self) -> None:
         """
         Sets the start and end times for the timeline, either from the input or current time.
@@ -66,16 +124,36 @@ class TimelineWidget(QWidget):
         self.timeline_slider.setRange(0, seconds_range)
         self.timeline_slider.start_handle_pos = 0
         self.timeline_slider.end_handle_pos = seconds_range
+        self.update_histogram()
+        self.set_window_summary(0, seconds_range)
+
+    def update_histogram(self) -> None:
+        """
+        Draws the number of logs over the range of the slider, a column for every pixel of its width.
+        It is empty until the time index is built.
+        """
+        start = int(self.start_time.timestamp())
+        end = start + self.timeline_slider.maximum()
+        pyramid = self.data_manager.get_activity_pyramid()
+        self.timeline_slider.histogram = pyramid.histogram(ALL_LOGS, start, end, self.timeline_slider.width()) \
+            if pyramid is not None else []
+        self.timeline_slider.update()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.update_histogram()
 
     def update_labels(self, start_pos: int, end_pos: int) -> None:
         """
         Updates the displayed start and end times based on the slider positions.
         """
+        self.stop_playback()
         start_time = self.start_time + datetime.timedelta(seconds=start_pos)
         end_time = self.start_time + datetime.timedelta(seconds=end_pos)
 
         self.set_start_time(start_time.strftime("%H:%M:%S"))
         self.set_end_time(end_time.strftime("%H:%M:%S"))
+        self.set_window_summary(start_pos, end_pos)
         self.previous_start_pos = start_pos
         self.main_window.perform_action_with_wait(self.data_manager.change_time, int(start_time.timestamp()), int(end_time.timestamp()))
 
@@ -83,6 +161,121 @@ class TimelineWidget(QWidget):
         print("start", int(start_time.timestamp()))
         print("end", int(end_time.timestamp()))
 
+    def preview_range(self, start_pos: int, end_pos: int) -> None:
+        """
+        Shows the times, the number of logs and the active TIDs of the range while a handle is dragged.
+        The counts come from the activity pyramid, the logs are linked only once the handle is released.
+        """
+        start_time = self.start_time + datetime.timedelta(seconds=start_pos)
+        end_time = self.start_time + datetime.timedelta(seconds=end_pos)
+        self.set_start_time(start_time.strftime("%H:%M:%S"))
+        self.set_end_time(end_time.strftime("%H:%M:%S"))
+        self.timeline_slider.preview_text = self.set_window_summary(start_pos, end_pos)
+
+    def set_window_summary(self, start_pos: int, end_pos: int) -> str:
+        """
+        Sets the text of the count label to the number of logs and active TIDs between the slider positions,
+        and returns it. It is empty until the time index is built.
+        """
+        start = int(self.start_time.timestamp())
+        pyramid = self.data_manager.get_activity_pyramid()
+        if pyramid is None:
+            self.count_label.setText("")
+            return ""
+        count = pyramid.count(ALL_LOGS, start + start_pos, start + end_pos)
+        num_tids = len(pyramid.get_active_tids(start + start_pos, start + end_pos))
+        summary = f"Events: {count}  TIDs: {num_tids}"
+        self.count_label.setText(summary)
+        return summary
+
+    def get_playback(self):
+        """
+        Returns the playback of the range of the slider, the window keeps the width of the range.
+        None until the time index is built.
+        """
+        if self.playback is None:
+            start = int(self.start_time.timestamp())
+            window = self.timeline_slider.end_handle_pos - self.timeline_slider.start_handle_pos + 1
+            bucket_width = max([width for width in BUCKET_WIDTHS if width * STEPS_PER_WINDOW <= window], default=1)
+            self.playback = self.data_manager.get_playback(window, bucket_width)
+            if self.playback is None:
+                return None
+            self.playback.seek(self.playback.cube.get_bucket(start + self.timeline_slider.start_handle_pos))
+            # Every node is colored by the first window, the nodes without logs in it are cleared
+            changed = dict.fromkeys(self.playback.nodes)
+            changed.update(self.playback.dominant_tids)
+            self.show_playback_frame(changed)
+        return self.playback
+
+    def toggle_playback(self) -> None:
+        """
+        Plays the window through time, or pauses it and applies the window to the logs.
+        """
+        if self.playback_timer.isActive():
+            self.playback_timer.stop()
+            self.play_button.setText(PLAY_TEXT)
+            self.apply_playback_window()
+        elif self.get_playback() is not None:
+            self.play_button.setText(PAUSE_TEXT)
+            self.playback_timer.start(FRAME_INTERVAL_MS)
+
+    def play_frame(self) -> None:
+        """
+        Moves the window of the playback by a frame, playback is paused at the end of the logs.
+        """
+        playback = self.get_playback()
+        if playback is None or playback.frame + 1 >= playback.num_frames:
+            if self.playback_timer.isActive():
+                self.toggle_playback()
+            return
+        self.show_playback_frame(playback.step(1))
+
+    def step_playback(self, frames: int) -> None:
+        """
+        Moves the window by a frame forward or back and applies it to the logs.
+        """
+        if self.playback_timer.isActive():
+            self.playback_timer.stop()
+            self.play_button.setText(PLAY_TEXT)
+        playback = self.get_playback()
+        if playback is None:
+            return
+        self.show_playback_frame(playback.step(frames))
+        self.apply_playback_window()
+
+    def show_playback_frame(self, changed: dict) -> None:
+        """
+        Moves the handles to the window of the playback and sends the colors that changed, the logs are not read.
+        """
+        start = int(self.start_time.timestamp())
+        start_pos = max(self.playback.start_time - start, 0)
+        end_pos = min(self.playback.end_time - start, self.timeline_slider.maximum())
+        self.timeline_slider.start_handle_pos = start_pos
+        self.timeline_slider.end_handle_pos = end_pos
+        self.timeline_slider.update()
+        self.set_start_time((self.start_time + datetime.timedelta(seconds=start_pos)).strftime("%H:%M:%S"))
+        self.set_end_time((self.start_time + datetime.timedelta(seconds=end_pos)).strftime("%H:%M:%S"))
+        self.set_window_summary(start_pos, end_pos)
+        if changed:
+            self.playback_frame.emit(changed)
+
+    def apply_playback_window(self) -> None:
+        """
+        Links the logs of the window of the playback, like a release of the slider
+        """
+        playback = self.playback
+        self.update_labels(self.timeline_slider.start_handle_pos, self.timeline_slider.end_handle_pos)
+        self.playback = playback
+
+    def stop_playback(self) -> None:
+        """
+        Stops the playback, the next one starts from the range of the slider
+        """
+        if self.playback_timer.isActive():
+            self.playback_timer.stop()
+            self.play_button.setText(PLAY_TEXT)
+        self.playback = None
+
     def set_start_time(self, start_time: str) -> None:
         """
         Sets the text for the start time label.
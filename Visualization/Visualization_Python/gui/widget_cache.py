@@ -0,0 +1,60 @@
+from typing import Any, Callable, Dict, Hashable, List, TypeVar
+
+Widget = TypeVar('Widget')  # A widget with a refresh method that restyles it from the current activity
+
+
+class WidgetCache:
+    """
+    Widgets kept by key while the user navigates between the views, so a view that is shown again is not built
+    again. The key is the kind of the widget with the object it shows.
+
+    Every widget is tagged with the generation of its key - the snapshot of the activity in which its object last
+    changed. A widget whose object changed since is restyled by its refresh method when it is taken from the
+    cache, the others are returned as they are, so a filter restyles only the widgets of the nodes it changed.
+    """
+
+    def __init__(self, get_generation: Callable[[Hashable], int]) -> None:
+        self.get_generation = get_generation  # The generation of a key
+        self.widgets: Dict[Hashable, Any] = {}
+        self.generations: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable, create: Callable[[], Widget]) -> Widget:
+        """
+        Returns the widget of the key, created if it is not cached and refreshed if its object changed since
+        """
+        generation = self.get_generation(key)
+        widget = self.widgets.get(key)
+        if widget is None:
+            widget = self.widgets[key] = create()
+        elif self.generations[key] != generation:
+            widget.refresh()
+        self.generations[key] = generation
+        return widget
+
+    def refresh(self, keys: List[Hashable]) -> int:
+        """
+        Restyles the cached widgets of the keys whose objects changed since they were drawn.
+        Returns the number of widgets restyled.
+        """
+        restyled = 0
+        for key in keys:
+            if key not in self.widgets:
+                continue
+            generation = self.get_generation(key)
+            if self.generations[key] != generation:
+                self.widgets[key].refresh()
+                self.generations[key] = generation
+                restyled += 1
+        return restyled
+
+    def clear(self) -> None:
+        for widget in self.widgets.values():
+            widget.deleteLater()
+        self.widgets.clear()
+        self.generations.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.widgets
+
+    def __len__(self) -> int:
+        return len(self.widgets)
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QWidget
+
+from entities.component import Component
+
+from utils.constants import WINDOW_COUNT_TOOLTIP, ANCESTOR_WINDOW_COUNT_TOOLTIP
+from utils.data_manager import DataManager
+
+
+def get_window_count_tooltip(data_manager: Optional[DataManager], component: Component) -> str:
+    """
+    Returns the tooltip of the number of logs of an object in the time window of the view.
+    It is empty until the time index is built, a tooltip does not wait for a pass over the log file.
+    """
+    if data_manager is None or data_manager.time_index is None:
+        return ""
+    start_time, end_time = data_manager.time_window or (None, None)
+    _, is_ancestor = data_manager.get_count_node(component)
+    count = data_manager.get_window_count(component, start_time, end_time)
+    return (ANCESTOR_WINDOW_COUNT_TOOLTIP if is_ancestor else WINDOW_COUNT_TOOLTIP).format(count=count)
+
+
+def handle_tooltip_event(widget: QWidget, data_manager: Optional[DataManager], component: Component,
+                         event: QEvent) -> None:
+    """
+    Sets the tooltip of the widget of an object when it is about to be shown, from the event method of the widget.
+    The number of logs in the time window is counted then, the window may have moved since the last tooltip.
+    """
+    if event.type() == QEvent.ToolTip:
+        widget.setToolTip(get_window_count_tooltip(data_manager, component))
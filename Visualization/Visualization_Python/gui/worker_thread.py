@@ -2,14 +2,26 @@ from PyQt5.QtCore import Qt, QThread, pyqtSignal
 
 class WorkerThread(QThread):
     finished = pyqtSignal()  # Signal emitted when the worker thread finishes.
+    failed = pyqtSignal(str)  # The error the action raised, emitted before 'finished'.
+    progress = pyqtSignal(object)  # The ScanProgress of the pass the action runs, at a bounded rate.
+    partial_frame = pyqtSignal(dict)  # The dominant TIDs of the nodes that changed while the logs are still linked.
 
-    def __init__(self, action, args):
+    def __init__(self, action, args, lock=None):
         """Initialize the WorkerThread with an action and its arguments."""
         super().__init__()
         self.action = action  # The action to be executed in the thread.
         self.args = args  # Arguments to pass to the action.
+        self.lock = lock  # Held while the action runs, shared with the other workers that use the same data.
 
     def run(self):
         """Run the action in the worker thread."""
-        self.action(*self.args)  # Execute the action with the provided arguments.
-        self.finished.emit()  # Emit the 'finished' signal once the action is complete.
+        try:
+            if self.lock is None:
+                self.action(*self.args)  # Execute the action with the provided arguments.
+            else:
+                with self.lock:
+                    self.action(*self.args)
+        except Exception as e:
+            self.failed.emit(str(e))  # The GUI reports the error, the thread would otherwise end silently.
+        finally:
+            self.finished.emit()  # Emit the 'finished' signal even if the action failed, so the overlay is hidden.
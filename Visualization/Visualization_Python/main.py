@@ -6,12 +6,15 @@ from PyQt5.QtWidgets import QApplication
 
 from utils.paths import APP_ICON_IMAGE
 from gui.file_dialogs.file_selection_widget import FileSelectionWidget
+from gui.latency_monitor import install_latency_monitor
 
 if __name__ == '__main__':
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(' ')
     app = QApplication(sys.argv)
     icon_path = os.path.join(os.getcwd(),APP_ICON_IMAGE)
     app.setWindowIcon(QIcon(icon_path))
+    # Opt-in stall watchdog and latency histograms, see gui/latency_monitor.py
+    install_latency_monitor(app)
     # Open the file selection window
     file_selection_widget = FileSelectionWidget()
     file_selection_widget.show()
@@ -0,0 +1,50 @@
+import unittest
+from types import SimpleNamespace
+from PyQt5.QtWidgets import QApplication
+from gui.chip_canvas import ChipCanvas
+from gui.packets_colors import get_node_color
+
+from utils.constants import GRID, QUADS, ROW, COL, CLUSTER_ID
+from utils.topology import Topology
+from utils.type_names import ECORE
+
+
+class TestChipCanvas(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Create an instance of QApplication for PyQt tests
+        cls.app = QApplication([])
+
+    def setUp(self):
+        quad = {ECORE: {ROW: 0, COL: 0, CLUSTER_ID: 1}}
+        self.topology = Topology([{GRID: {QUADS: [quad]}}])
+        data_manager = SimpleNamespace(topology=self.topology, dimensions=self.topology.dimensions)
+        self.canvas = ChipCanvas(data_manager)
+        self.cluster = self.topology.get_cluster_node(0, 0, 0, 0)
+
+    def test_colors_agree_with_summaries(self):
+        # Test that a node is colored by its dominant TID, like the die view, not by the TID it saw first
+        for tid in [5, 3, 3, 3]:
+            self.topology.add(self.cluster, tid)
+        self.topology.rollup()
+        self.canvas.refresh()
+        for node in range(len(self.topology)):
+            self.assertEqual(self.canvas.node_colors[node], get_node_color(self.topology.get_summary(node), None))
+        # The nodes that changed are colored the same way
+        self.topology.add(self.cluster, 5)
+        self.topology.add(self.cluster, 5)
+        self.topology.add(self.cluster, 5)
+        self.topology.rollup()
+        self.canvas.setVisible(True)
+        self.canvas.apply_changes([self.cluster])
+        self.assertEqual(self.canvas.node_colors[self.cluster],
+                         get_node_color(self.topology.get_summary(self.cluster), None))
+
+    @classmethod
+    def tearDownClass(cls):
+        # Close the QApplication after the tests
+        cls.app.quit()
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from PyQt5.QtWidgets import QApplication
+from gui.main_window import MainWindow
+from utils.data_manager import DataManager
+
+from utils.paths import CHIP_DATA_JSON, SL_JSON, LOGS_CSV
+
+
+class TestNavbar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Create an instance of QApplication for PyQt tests
+        cls.app = QApplication([])
+
+    def setUp(self):
+        self.data_manager = DataManager(CHIP_DATA_JSON, SL_JSON, LOGS_CSV)
+        self.main_window = MainWindow(self.data_manager)
+
+    def test_navbar_updated_in_place(self):
+        # Test that a filter pass keeps the toolbar and its buttons and only restyles them
+        toolbar = self.main_window.toolBar
+        buttons = [self.main_window.host_interface_button, *self.main_window.die_buttons]
+        # A filter that no log passes disables every die
+        self.data_manager.clean_the_prev_logs_from_leaf_objects()
+        self.data_manager.topology.rollup()
+        self.main_window.on_action_finished()
+        self.assertIs(self.main_window.toolBar, toolbar)
+        self.assertEqual([self.main_window.host_interface_button, *self.main_window.die_buttons], buttons)
+        self.assertFalse(any(button.isEnabled() for button in self.main_window.die_buttons))
+        # The logs linked again enable the same buttons
+        self.data_manager.refresh_logs()
+        self.main_window.on_action_finished()
+        self.assertIs(self.main_window.toolBar, toolbar)
+        self.assertTrue(any(button.isEnabled() for button in self.main_window.die_buttons))
+
+    @classmethod
+    def tearDownClass(cls):
+        # Close the QApplication after the tests
+        cls.app.quit()
+
+# if __name__ == '__main__':
+#     unittest.main()
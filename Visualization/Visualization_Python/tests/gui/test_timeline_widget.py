@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+from PyQt5.QtWidgets import QApplication
+from gui.timeline_widget import TimelineWidget, PLAYBACK_FILTERED_TOOLTIP
+
+from utils.filter_types import CLUSTER
+
+
+class TestTimelineWidget(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Create an instance of QApplication for PyQt tests
+        cls.app = QApplication([])
+
+    def setUp(self):
+        self.data_manager = SimpleNamespace(time_index=None, active_filters=[], get_activity_pyramid=lambda: None)
+        self.timeline_widget = TimelineWidget(self.data_manager)
+        self.buttons = [self.timeline_widget.step_back_button, self.timeline_widget.play_button,
+                        self.timeline_widget.step_forward_button]
+
+    def test_playback_disabled_while_filtered(self):
+        # Test that the playback waits for the time index, and is disabled while a filter is applied
+        self.assertFalse(any(button.isEnabled() for button in self.buttons))
+        self.data_manager.time_index = object()
+        self.timeline_widget.update_playback_buttons()
+        self.assertTrue(all(button.isEnabled() for button in self.buttons))
+        self.data_manager.active_filters = [(CLUSTER, [(0, 0, 0, 0)])]
+        self.timeline_widget.update_playback_buttons()
+        self.assertFalse(any(button.isEnabled() for button in self.buttons))
+        self.assertEqual(self.timeline_widget.play_button.toolTip(), PLAYBACK_FILTERED_TOOLTIP)
+        # Clearing the filters enables it again
+        self.data_manager.active_filters = []
+        self.timeline_widget.update_playback_buttons()
+        self.assertTrue(all(button.isEnabled() for button in self.buttons))
+        self.assertEqual(self.timeline_widget.play_button.toolTip(), "")
+
+    @classmethod
+    def tearDownClass(cls):
+        # Close the QApplication after the tests
+        cls.app.quit()
+
+# if __name__ == '__main__':
+#     unittest.main()
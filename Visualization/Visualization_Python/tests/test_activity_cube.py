@@ -0,0 +1,43 @@
+import unittest
+
+from utils.activity_cube import ActivityCube, LogColumns
+
+
+class TestActivityCube(unittest.TestCase):
+
+    def setUp(self):
+        # (time, leaf, tid) of the logs, the cube starts at 100 with buckets of 10 seconds
+        self.logs = [(100, 'a', 7), (105, 'a', 7), (109, 'b', 3), (112, 'a', 3), (131, 'b', 7), (131, 'b', 7)]
+        self.columns = LogColumns()
+        for time, leaf, tid in self.logs:
+            self.columns.add(time, leaf, tid)
+        self.cube = ActivityCube(self.columns, 10)
+
+    def test_ordinals(self):
+        # Test that the leaves and TIDs are numbered in the order they were first seen
+        self.assertEqual(self.cube.leaf_keys, ['a', 'b'])
+        self.assertEqual(self.cube.tid_values, [7, 3])
+        self.assertEqual(self.columns.get_leaf_ordinal('b'), 1)
+        self.assertEqual((self.cube.start_time, self.cube.num_buckets), (100, 4))
+
+    def test_cells(self):
+        # Test that only the cells with logs are kept, with the number of their logs
+        self.assertEqual(self.cube.cells(), {(0, 0, 0): 2, (0, 1, 1): 1, (1, 0, 1): 1, (3, 1, 0): 2})
+        self.assertEqual(self.cube.cells(bucket=slice(1, None), leaf=1), {(3, 1, 0): 2})
+
+    def test_slices(self):
+        # Test the counts and totals of slices along every axis
+        self.assertEqual(self.cube.count(), len(self.logs))
+        self.assertEqual(self.cube.count(bucket=0), 3)
+        self.assertEqual(self.cube.count(bucket=slice(1, 3)), 1)
+        self.assertEqual(self.cube.count(tid=1), 2)
+        self.assertEqual(self.cube.count(bucket=9), 0)
+        self.assertEqual(self.cube.totals(0), {0: 3, 1: 1, 3: 2})
+        self.assertEqual(self.cube.totals(2, leaf=1), {0: 2, 1: 1})
+
+    def test_invalid_width(self):
+        with self.assertRaises(ValueError):
+            ActivityCube(self.columns, 0)
+
+# if __name__ == '__main__':
+#     unittest.main()
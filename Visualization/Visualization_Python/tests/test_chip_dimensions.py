@@ -0,0 +1,49 @@
+import unittest
+
+from utils.chip_dimensions import ChipDimensions, NO_DIE
+from utils.constants import GRID, QUADS, ROW, COL, CLUSTER_ID, CHIP, ID, QUADS_PER_SIDE
+from utils.topology import Topology
+from utils.type_names import ECORE
+
+
+def make_die_data(chip, die_id, num_quads=4, row=0, col=0):
+    quad = {ECORE: {ROW: row, COL: col, CLUSTER_ID: 1}}
+    return {CHIP: chip, ID: die_id, GRID: {QUADS: [quad] * num_quads}}
+
+
+class TestChipDimensions(unittest.TestCase):
+
+    def setUp(self):
+        self.dies_data = [make_die_data(chip, die_id) for chip in range(2) for die_id in range(3)]
+        self.dimensions = ChipDimensions.from_chip_data(self.dies_data)
+
+    def test_dies(self):
+        # Test that the dies are indexed in order and found by their chip and id
+        self.assertEqual(self.dimensions.num_dies, 6)
+        self.assertEqual(self.dimensions.num_chips, 2)
+        self.assertEqual(self.dimensions.get_die_index(1, 2), 5)
+        self.assertEqual(self.dimensions.get_die_index(2, 0), NO_DIE)
+        self.assertEqual(self.dimensions.get_dies_of_chip(1), [3, 4, 5])
+
+    def test_grid(self):
+        # Test that the grids are the defaults, grown to fit the json, unless they are given
+        self.assertEqual((self.dimensions.quads_per_side, self.dimensions.clusters_per_side), (2, 8))
+        grown = ChipDimensions.from_chip_data([make_die_data(0, 0, num_quads=9, row=11)])
+        self.assertEqual((grown.quads_per_side, grown.clusters_per_side), (3, 12))
+        given = ChipDimensions.from_chip_data(self.dies_data, {QUADS_PER_SIDE: 4})
+        self.assertEqual(given.quads_per_die, 16)
+
+    def test_topology(self):
+        # Test that the topology has a node for every die of every chip
+        topology = Topology(self.dies_data, self.dimensions)
+        die = self.dimensions.get_die_index(1, 2)
+        node = topology.get_cluster_node(die, 3, 0, 0)
+        self.assertEqual(topology.get_address(node), (die, 3, 0, 0))
+        self.assertEqual(Topology.from_state(topology.get_state()).dimensions, self.dimensions)
+
+    def test_duplicate_dies(self):
+        with self.assertRaises(ValueError):
+            ChipDimensions([(0, 0), (0, 0)])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from utils.chip_dimensions import ChipDimensions
+from utils.chip_layout import ChipLayout, CLUSTER_SIZE, HBM_WIDTH, QUAD_DETAIL, CLUSTER_DETAIL, UNIT_DETAIL, \
+    intersects, contains
+from utils.type_names import DIE, HBM, CLUSTER, HOST_INTERFACE, D2D
+
+
+class TestChipLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.dimensions = ChipDimensions([(0, 0), (0, 1), (1, 0), (1, 1)], quads_per_side=2, clusters_per_side=8)
+        self.layout = ChipLayout(self.dimensions)
+
+    def test_positions(self):
+        # Test that the dies of a chip are in a row, the chips one below the other and the parts do not overlap
+        die_x, die_y, _, _ = self.layout.die_rect(1)
+        self.assertEqual(die_y, self.layout.die_rect(0)[1])
+        self.assertGreater(die_x, self.layout.die_rect(0)[0])
+        self.assertGreater(self.layout.die_rect(2)[1], die_y)
+        rects = [self.layout.host_interface_rect, self.layout.d2d_rect]
+        for die in range(self.dimensions.num_dies):
+            for quad in range(self.dimensions.quads_per_die):
+                rects += [self.layout.quad_rect(die, quad), self.layout.hbm_rect(die, quad)]
+                self.assertTrue(intersects(self.layout.die_rect(die), self.layout.quad_rect(die, quad)))
+        for index, rect in enumerate(rects):
+            self.assertTrue(intersects(self.layout.bounds, rect))
+            self.assertFalse(any(intersects(rect, other) for other in rects[index + 1:]))
+
+    def test_hbm_side(self):
+        # Test that the hbm of a quad is on the outer side of the die
+        quad_x, _, quad_width, _ = self.layout.quad_rect(0, 0)
+        self.assertEqual(self.layout.hbm_rect(0, 0)[0], quad_x - HBM_WIDTH)
+        quad_x, _, quad_width, _ = self.layout.quad_rect(0, 1)
+        self.assertEqual(self.layout.hbm_rect(0, 1)[0], quad_x + quad_width)
+
+    def test_level_of_detail(self):
+        self.assertEqual(self.layout.get_level_of_detail(0.1), QUAD_DETAIL)
+        self.assertEqual(self.layout.get_level_of_detail(1), CLUSTER_DETAIL)
+        self.assertEqual(self.layout.get_level_of_detail(10), UNIT_DETAIL)
+
+    def test_visible_parts(self):
+        # Test that only the quads and the clusters in the view are found
+        self.assertEqual(len(list(self.layout.iter_visible_quads(self.layout.bounds))), 16)
+        x, y, _, _ = self.layout.cluster_rect(3, 2, 4, 5)
+        view = (x + 1, y + 1, CLUSTER_SIZE * 1.5, CLUSTER_SIZE / 2)
+        self.assertEqual(list(self.layout.iter_visible_quads(view)), [(3, 2)])
+        self.assertEqual(list(self.layout.iter_visible_clusters(3, 2, view)), [(4, 5), (4, 6)])
+        self.assertEqual(list(self.layout.iter_visible_clusters(0, 0, view)), [])
+
+    def test_hit_test(self):
+        # Test that the innermost part under a point is found
+        x, y, _, _ = self.layout.cluster_rect(2, 3, 7, 1)
+        self.assertEqual(self.layout.hit_test(x + 1, y + 1), (CLUSTER, (2, 3, 7, 1)))
+        x, y, _, _ = self.layout.hbm_rect(1, 0)
+        self.assertEqual(self.layout.hit_test(x + 1, y + 1), (HBM, (1, 0)))
+        x, y, _, _ = self.layout.die_rect(1)
+        self.assertEqual(self.layout.hit_test(x + 1, y + 1), (DIE, (1,)))
+        self.assertEqual(self.layout.hit_test(1, 1)[0], HOST_INTERFACE)
+        x, y, _, _ = self.layout.d2d_rect
+        self.assertEqual(self.layout.hit_test(x + 1, y + 1)[0], D2D)
+        self.assertIsNone(self.layout.hit_test(-1, -1))
+        self.assertTrue(contains(self.layout.bounds, 0, 0))
+
+# if __name__ == '__main__':
+#     unittest.main()
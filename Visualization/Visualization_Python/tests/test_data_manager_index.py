@@ -0,0 +1,115 @@
+import os
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from utils import data_manager
+from utils.data_manager import DataManager
+from utils.paths import CHIP_DATA_JSON, SL_JSON, LOGS_CSV
+from utils.type_names import HBM, PCIE, D2D, MEM_0
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+CLUSTER = (0, 0, 7, 0)  # Die, quad, row and col of the cluster of the ecores of the first quad
+
+
+def make_log(area, time_stamp, quad=0, row=7, col=0, tid=1):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=quad, row=row, col=col)
+    return SimpleNamespace(tid=tid, area=area, unit="fcb0", io="in", timeStamp=time_stamp, clusterId=cluster_id)
+
+
+LOGS = [make_log(MEM_0, 100), make_log(MEM_0, 110), make_log(HBM, 120), make_log(MEM_0, 200)]
+
+
+class FakeFilterFactory:
+    """
+    Reads LOGS instead of the log file
+    """
+
+    def __init__(self, log_file):
+        self.queue = []
+
+    def start_logs(self):
+        self.queue = list(LOGS)
+
+    def is_finished_process(self):
+        return True
+
+    def has_log(self):
+        return bool(self.queue)
+
+    def get_log(self):
+        return self.queue.pop(0)
+
+    def join_thread(self):
+        pass
+
+
+class TestDataManagerIndex(unittest.TestCase):
+
+    def setUp(self):
+        patches = [mock.patch.object(data_manager.filter_factory_module, "FilterFactory", FakeFilterFactory),
+                   mock.patch.object(data_manager.logs_factory, "LogsFactory", lambda log_file: None)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.data_manager = DataManager(os.path.join(ROOT_DIR, CHIP_DATA_JSON), os.path.join(ROOT_DIR, SL_JSON),
+                                        LOGS_CSV)
+        self.topology = self.data_manager.topology
+
+    def get_cluster(self):
+        die, quad, row, col = CLUSTER
+        return self.data_manager.load_die(die).get_quad(quad).get_cluster(row, col)
+
+    def test_cluster_path(self):
+        # Test that a log of a cluster is indexed in its cluster, quad and die, from the leaf up
+        path = self.data_manager.get_index_path(make_log(MEM_0, 100))
+        self.assertEqual(path, [self.topology.get_cluster_node(*CLUSTER), self.topology.get_quad_node(0, 0),
+                                self.topology.get_die_node(0)])
+
+    def test_hbm_path(self):
+        # Test that a log of the hbm is indexed only in the hbm, it is not a part of the die activity
+        path = self.data_manager.get_index_path(make_log(HBM, 100))
+        self.assertEqual(path, [self.topology.get_hbm_node(0, 0)])
+
+    def test_outside_die_path(self):
+        # Test that the logs outside the die area are indexed in their objects, from the leaf up
+        host_interface = self.data_manager.host_interface
+        self.assertEqual(self.data_manager.get_index_path(make_log(PCIE, 100)), [host_interface.pcie, host_interface])
+        self.assertEqual(self.data_manager.get_index_path(make_log(D2D, 100)), [self.data_manager.die2die])
+
+    def test_unit_counted_by_cluster(self):
+        # Test that a unit of a cluster is counted by its cluster, the index has no nodes for the units
+        cluster = self.get_cluster()
+        cluster_node = self.topology.get_cluster_node(*CLUSTER)
+        for unit in cluster.get_all_inner_details():
+            self.assertEqual(self.data_manager.get_count_node(unit), (cluster_node, True))
+        self.assertEqual(self.data_manager.get_count_node(cluster), (cluster_node, False))
+
+    def test_count_before_index(self):
+        # Test that nothing is counted until the index is built, the counts do not build it
+        cluster = self.get_cluster()
+        self.assertEqual(self.data_manager.get_window_count(cluster), 0)
+        self.assertEqual(list(self.data_manager.get_window_slice(cluster)), [])
+        self.assertIsNone(self.data_manager.time_index)
+        self.data_manager.build_time_index()
+        self.assertEqual(self.data_manager.get_window_count(cluster), 3)
+        self.assertEqual(self.data_manager.get_window_count(cluster, 100, 150), 2)
+        self.assertEqual(list(self.data_manager.get_window_slice(cluster, 100, 150)), [0, 1])
+        unit = cluster.get_all_inner_details()[0]
+        self.assertEqual(self.data_manager.get_window_count(unit, 100, 150), 2)
+        self.assertEqual(self.data_manager.get_window_count(self.data_manager.load_die(0).get_quad(0).hbm), 1)
+
+    def test_build_holds_pass_lock(self):
+        # Test that the index is built only once the pass that holds the lock is done
+        thread = threading.Thread(target=self.data_manager.build_time_index)
+        with self.data_manager.pass_lock:
+            thread.start()
+            thread.join(0.2)
+            self.assertTrue(thread.is_alive())
+            self.assertIsNone(self.data_manager.time_index)
+        thread.join(5)
+        self.assertIsNotNone(self.data_manager.time_index)
+
+# if __name__ == '__main__':
+#     unittest.main()
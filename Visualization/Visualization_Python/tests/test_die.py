@@ -4,12 +4,18 @@ import unittest
 from entities.die import Die
 from entities.quad import Quad
 
-from utils.constants import TOP, DIES
+from utils.constants import TOP, DIES, PACKET
 from utils.type_names import DIE
 
 from utils.paths import CHIP_DATA_JSON
 
 
+class Log:
+    def __init__(self, tid, packet):
+        self.tid = tid
+        self.packet = packet
+
+
 class TestDie(unittest.TestCase):
 
     def setUp(self):
@@ -43,11 +49,31 @@ class TestDie(unittest.TestCase):
         self.assertEqual(quads_matrix[0][0].id, 1)
         self.assertEqual(quads_matrix[1][1].id, 4)
 
+    def test_quads_are_loaded_on_demand(self):
+        # Check that no quad or cluster is built before it's requested
+        self.assertEqual(self.die.get_loaded_quads(), [])
+        quad = self.die.get_quad(0)
+        self.assertEqual(self.die.get_loaded_quads(), [quad])
+        self.assertEqual(quad.get_loaded_clusters(), [])
+        row, col = next(iter(quad.pending_clusters))
+        self.assertIs(quad.get_cluster(row, col), quad.clusters[row][col])
+
     def test_get_attribute_from_active_logs(self):
         mock_attribute = 'some_attribute'  # Example attribute to test
         attributes = self.die.get_attribute_from_active_logs(mock_attribute)
 
         self.assertIsInstance(attributes, list)  # Verify that the returned attributes are in a list
 
+    def test_iter_active_logs(self):
+        # Check that the logs are yielded from the inner layers in the order of get_attribute_from_active_logs
+        quad = self.die.get_quad(0)
+        cluster = next(cluster for row in quad.clusters for cluster in row if cluster is not None)
+        cluster.active_logs = [Log(1, "cluster")]
+        quad.active_logs = [Log(2, "quad")]
+        self.die.active_logs = [Log(3, "die")]
+        self.assertEqual([log.packet for log in self.die.iter_active_logs()],
+                         self.die.get_attribute_from_active_logs(PACKET))
+        self.assertEqual([log.tid for log in self.die.iter_active_logs()], [1, 2, 3])
+
 # if __name__ == '__main__':
 #     unittest.main()
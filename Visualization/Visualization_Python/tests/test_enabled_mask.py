@@ -0,0 +1,49 @@
+import unittest
+
+from utils.chip_dimensions import ChipDimensions
+from utils.enabled_mask import EnabledMask
+
+
+class TestEnabledMask(unittest.TestCase):
+
+    def setUp(self):
+        self.dimensions = ChipDimensions()
+        self.mask = EnabledMask(self.dimensions)
+        self.mask.enable(1, 2, 3, 4)
+        self.mask.enable(1, 3, 7, 7)
+
+    def test_clusters(self):
+        # Test that only the enabled clusters are set, and positions outside the chip are not
+        self.assertTrue(self.mask.is_enabled(1, 2, 3, 4))
+        self.assertFalse(self.mask.is_enabled(1, 2, 4, 3))
+        self.assertFalse(self.mask.is_enabled(2, 0, 0, 0))
+        self.assertFalse(self.mask.is_enabled(1, 2, 3, 8))
+        self.assertEqual(list(self.mask), [(1, 2, 3, 4), (1, 3, 7, 7)])
+        self.assertEqual(len(self.mask), 2)
+
+    def test_quads_and_dies(self):
+        # Test that a quad or a die is enabled by any of its clusters
+        self.assertTrue(self.mask.is_quad_enabled(1, 3))
+        self.assertFalse(self.mask.is_quad_enabled(1, 1))
+        self.assertTrue(self.mask.is_die_enabled(1))
+        self.assertFalse(self.mask.is_die_enabled(0))
+
+    def test_bytes(self):
+        # Test that a mask is restored from its bytes, and only for the same number of dies
+        self.assertEqual(EnabledMask(self.dimensions, self.mask.to_bytes()), self.mask)
+        with self.assertRaises(ValueError):
+            EnabledMask(ChipDimensions([(0, 0), (0, 1), (1, 0)]), self.mask.to_bytes())
+        # A mask is mutable, it is compared by value and not hashed
+        with self.assertRaises(TypeError):
+            hash(self.mask)
+
+    def test_diff(self):
+        # Test that the diff holds the clusters enabled in only one of the masks
+        other = EnabledMask(self.dimensions)
+        other.enable(1, 2, 3, 4)
+        other.enable(0, 0, 0, 1)
+        self.assertEqual(self.mask.diff(other), [(0, 0, 0, 1), (1, 3, 7, 7)])
+        self.assertEqual(self.mask.diff(self.mask), [])
+
+# if __name__ == '__main__':
+#     unittest.main()
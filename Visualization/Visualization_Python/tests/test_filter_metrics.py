@@ -0,0 +1,58 @@
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from utils import data_manager
+from utils.data_manager import DataManager, FILTER_METRICS, STAGES, FILTER, PASSED, REJECTED
+from utils.filter_types import CLUSTER
+from utils.paths import CHIP_DATA_JSON, SL_JSON, LOGS_CSV
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class FakeFilterFactory:
+    """
+    A module built before the counters of the chain were bound
+    """
+
+    def __init__(self, log_file):
+        pass
+
+
+class FakeMetricsFilterFactory(FakeFilterFactory):
+    """
+    Reports the counters of a pass that read 10 lines and passed 3 logs through a single filter
+    """
+
+    def get_metrics(self):
+        stage = SimpleNamespace(filter=CLUSTER, passed=3, rejected=6)
+        return SimpleNamespace(lines_read=10, lines_parsed=9, parse_failures=1, bytes_read=1000, bytes_to_read=1000,
+                               queued_logs=3, queue_high_water=2, pass_seconds=0.5, stages=[stage])
+
+
+class TestFilterMetrics(unittest.TestCase):
+
+    def make_data_manager(self, filter_factory):
+        patches = [mock.patch.object(data_manager.filter_factory_module, "FilterFactory", filter_factory),
+                   mock.patch.object(data_manager.logs_factory, "LogsFactory", lambda log_file: None)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        return DataManager(os.path.join(ROOT_DIR, CHIP_DATA_JSON), os.path.join(ROOT_DIR, SL_JSON), LOGS_CSV)
+
+    def test_metrics(self):
+        # Test that every counter of the pass is reported, and the logs every filter passed and rejected
+        metrics = self.make_data_manager(FakeMetricsFilterFactory).get_filter_metrics()
+        self.assertEqual(set(metrics), {*FILTER_METRICS, STAGES})
+        self.assertEqual(metrics["lines_read"], 10)
+        self.assertEqual(metrics["parse_failures"], 1)
+        self.assertEqual(metrics["queue_high_water"], 2)
+        self.assertEqual(metrics[STAGES], [{FILTER: CLUSTER, PASSED: 3, REJECTED: 6}])
+
+    def test_without_metrics(self):
+        # Test that a module built without the counters reports nothing
+        self.assertEqual(self.make_data_manager(FakeFilterFactory).get_filter_metrics(), {})
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import time
+import unittest
+
+from utils.latency import LatencyHistogram, LatencyReport, StallWatchdog, EVENT_LOOP_LAG
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLatency(unittest.TestCase):
+
+    def test_histogram(self):
+        # Test that the latencies are counted by bucket and the percentiles are the bounds of their buckets
+        histogram = LatencyHistogram()
+        for ms in [0.5, 3, 3, 3, 40, 7000]:
+            histogram.record(ms)
+        summary = histogram.to_dict()
+        self.assertEqual(summary['count'], 6)
+        self.assertEqual(summary['p50_ms'], 5.0)
+        self.assertEqual(summary['p99_ms'], 7000)
+        self.assertEqual(summary['buckets']['<=5'], 3)
+        self.assertEqual(summary['buckets']['>5000'], 1)
+        self.assertIsNone(LatencyHistogram().get_percentile(50))
+
+    def test_stall_stack(self):
+        # Test that a stall is recorded with the stack taken while the thread was stuck
+        clock = FakeClock()
+        report = LatencyReport()
+        watchdog = StallWatchdog(report, threshold_ms=100, beat_interval_ms=50,
+                                 thread_id=threading.get_ident(), clock=clock)
+        clock.now = 0.05
+        watchdog.beat()
+        watchdog.check()
+        self.assertEqual(report.stalls, [])
+        clock.now = 0.3
+        watchdog.check()
+        clock.now = 0.5
+        watchdog.beat()
+        self.assertEqual(len(report.stalls), 1)
+        self.assertAlmostEqual(report.stalls[0]['duration_ms'], 450)
+        self.assertIn('test_stall_stack', ''.join(report.stalls[0]['stack']))
+        self.assertEqual(report.histograms[EVENT_LOOP_LAG].count, 2)
+
+    def test_watchdog_thread(self):
+        # Test that the watchdog thread takes the stack of a thread that stops beating
+        report = LatencyReport()
+        watchdog = StallWatchdog(report, threshold_ms=20, thread_id=threading.get_ident())
+        watchdog.start()
+        time.sleep(0.1)
+        watchdog.beat()
+        watchdog.stop()
+        self.assertTrue(report.stalls and report.stalls[0]['stack'])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+
+from utils.multi_query import MultiQueryScan
+
+
+def make_log(tid, area="mem0", unit="fcb0", io="in", time_stamp=100):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=1, row=2, col=3)
+    return SimpleNamespace(tid=tid, area=area, unit=unit, io=io, timeStamp=time_stamp, clusterId=cluster_id)
+
+
+class TestMultiQueryScan(unittest.TestCase):
+
+    def test_each_spec_gets_its_own_logs(self):
+        # Test that one pass fills the results of every filter configuration
+        scan = MultiQueryScan([[("ThreadId", [1])], [("ThreadId", [2])], []])
+        logs = [make_log(1), make_log(2), make_log(1)]
+        for log in logs:
+            scan.feed(log)
+        self.assertEqual(scan.results[0], [logs[0], logs[2]])
+        self.assertEqual(scan.results[1], [logs[1]])
+        self.assertEqual(scan.results[2], logs)  # An empty configuration matches every log
+
+    def test_all_filters_of_a_spec_must_match(self):
+        scan = MultiQueryScan([[("ThreadId", [1, 2]), ("Io", "out")], [("TimeRange", (50, 150))]])
+        scan.feed(make_log(1, io="in"))
+        scan.feed(make_log(2, io="out", time_stamp=200))
+        self.assertEqual(scan.matched_counts, [1, 1])
+
+    def test_counts_only_routes_each_log_once(self):
+        # Test that per-leaf counts are collected with a single leaf lookup per log
+        routed = []
+        scan = MultiQueryScan([[("Area", "mem0")], [("Unit", "fcb0")]], counts_only=True)
+        scan.feed(make_log(1), lambda log: routed.append(log) or "leaf")
+        self.assertEqual(len(routed), 1)
+        self.assertEqual(dict(scan.results[0]), {"leaf": 1})
+        self.assertEqual(dict(scan.results[1]), {"leaf": 1})
+
+    def test_unknown_filter(self):
+        with self.assertRaises(ValueError):
+            MultiQueryScan([[("Unknown", 1)]])
+
+# if __name__ == '__main__':
+#     unittest.main()
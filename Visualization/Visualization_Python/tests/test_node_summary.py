@@ -0,0 +1,33 @@
+import unittest
+from utils.node_summary import NodeSummary, get_dominant_tid
+
+class TestNodeSummary(unittest.TestCase):
+
+    def test_counts_logs_and_distinct_tids(self):
+        # Test that every log is counted and the TIDs are kept in first-seen order
+        summary = NodeSummary()
+        for tid in [7, 3, 7, 5]:
+            summary.add(tid)
+        self.assertEqual(summary.count, 4)
+        self.assertEqual(summary.get_tids(), [7, 3, 5])
+        self.assertEqual(summary.first_tid, 7)
+
+    def test_clear(self):
+        summary = NodeSummary()
+        summary.add(1)
+        summary.clear()
+        self.assertFalse(summary.has_activity)
+        self.assertIsNone(summary.first_tid)
+
+    def test_dominant_tid(self):
+        # Test that the dominant TID has the most logs, not the first seen, and the lowest TID wins a tie
+        summary = NodeSummary()
+        for tid in [7, 3, 3, 5, 5]:
+            summary.add(tid)
+        self.assertEqual(summary.first_tid, 7)
+        self.assertEqual(summary.dominant_tid, 3)
+        self.assertEqual(get_dominant_tid({9: 1}), 9)
+        self.assertIsNone(get_dominant_tid({}))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from gui.packets_colors import PALETTE, get_color_by_tid, get_colors_by_tids, get_node_color
+from utils.node_summary import NodeSummary
+
+
+class TestPacketsColors(unittest.TestCase):
+
+    def test_deterministic(self):
+        # Test that a TID always gets the same color of the palette, whatever TIDs were colored before it
+        color = get_color_by_tid(7, None)
+        self.assertIn(color, PALETTE)
+        get_colors_by_tids(range(100))
+        self.assertEqual(get_color_by_tid(7, None), color)
+        self.assertEqual(get_color_by_tid("7a", None), get_color_by_tid("7a", None))
+        self.assertEqual(get_color_by_tid(None, "white"), "white")
+
+    def test_consecutive_tids(self):
+        # Test that a few consecutive TIDs get different colors
+        self.assertEqual(len(set(get_colors_by_tids(range(1, 17)))), 16)
+
+    def test_node_color(self):
+        # Test that an object is colored by its dominant TID, not the first one
+        summary = NodeSummary()
+        self.assertEqual(get_node_color(summary, "gray"), "gray")
+        for tid in [5, 3, 3]:
+            summary.add(tid)
+        self.assertEqual(get_node_color(summary, "gray"), get_color_by_tid(3, None))
+
+# if __name__ == '__main__':
+#     unittest.main()
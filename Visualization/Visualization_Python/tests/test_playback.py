@@ -0,0 +1,45 @@
+import unittest
+
+from utils.activity_cube import ActivityCube, LogColumns
+from utils.playback import Playback
+
+# The parent of every leaf, the leaves 'a' and 'b' are in the quad 'q'
+PARENTS = {'a': ['q'], 'b': ['q']}
+
+
+class TestPlayback(unittest.TestCase):
+
+    def setUp(self):
+        # (time, leaf, tid) of the logs, in buckets of 10 seconds from 100
+        logs = [(100, 'a', 1), (101, 'a', 1), (112, 'b', 2), (125, 'b', 2), (126, 'b', 2), (131, 'a', 3)]
+        columns = LogColumns()
+        for time, leaf, tid in logs:
+            columns.add(time, leaf, tid)
+        self.cube = ActivityCube(columns, 10)
+        self.playback = Playback(self.cube, 2, lambda node: PARENTS.get(node, []))
+
+    def test_first_window(self):
+        # Test that the first window covers two buckets and the parents count the logs of their leaves
+        self.assertEqual((self.playback.num_frames, self.playback.start_time, self.playback.end_time), (3, 100, 119))
+        self.assertEqual(self.playback.dominant_tids, {'a': 1, 'b': 2, 'q': 1})
+        self.assertEqual(self.playback.nodes, {'a', 'b', 'q'})
+
+    def test_step(self):
+        # Test that a step changes only the nodes whose dominant TID changed
+        self.assertEqual(self.playback.step(1), {'a': None, 'q': 2})
+        self.assertEqual(self.playback.step(1), {'a': 3})
+        self.assertEqual(self.playback.step(1), {})
+        self.assertEqual(self.playback.step(-1), {'a': None})
+        self.assertEqual(self.playback.frame, 1)
+
+    def test_step_matches_seek(self):
+        # Test that the deltas of the steps give the same counts as summing every window again
+        other = Playback(self.cube, 2, lambda node: PARENTS.get(node, []))
+        for frame in range(1, self.playback.num_frames):
+            self.playback.step(1)
+            other.seek(frame)
+            self.assertEqual(self.playback.dominant_tids, other.dominant_tids)
+            self.assertEqual(dict(self.playback.counts), dict(other.counts))
+
+# if __name__ == '__main__':
+#     unittest.main()
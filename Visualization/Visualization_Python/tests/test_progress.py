@@ -0,0 +1,59 @@
+import unittest
+
+from utils.progress import ProgressReporter, ScanProgress, format_progress
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgress(unittest.TestCase):
+
+    def test_eta(self):
+        # Test that the time left is estimated from the rate the window was read at so far
+        progress = ScanProgress(bytes_read=250, bytes_total=1000, matched=10, elapsed=2.0)
+        self.assertEqual(progress.fraction, 0.25)
+        self.assertAlmostEqual(progress.eta, 6.0)
+        self.assertIsNone(ScanProgress(0, 1000, 0, 1.0).eta)
+        self.assertIsNone(ScanProgress(10, 0, 0, 1.0).fraction)
+        # The last lines of the window may end past its size
+        self.assertEqual(ScanProgress(1100, 1000, 0, 1.0).fraction, 1.0)
+        self.assertEqual(format_progress(ScanProgress(2048, 4096, 1234, 1.0)),
+                         "Read 2.0 KB of 4.0 KB - 1,234 logs - about 1 s left")
+
+    def test_unknown_size(self):
+        # Test that only the logs are shown when the module does not count the bytes, and the bar stays busy
+        progress = ScanProgress(0, 0, 1234, 1.0)
+        self.assertIsNone(progress.fraction)
+        self.assertEqual(format_progress(progress), "1,234 logs")
+
+    def test_bounded_rate(self):
+        # Test that a report is due only once the interval passed since the previous one
+        clock = FakeClock()
+        reports = []
+        reporter = ProgressReporter(reports.append, interval=0.5, clock=clock)
+        reporter.start()
+        clock.now = 0.2
+        self.assertFalse(reporter.is_due())
+        clock.now = 0.6
+        self.assertTrue(reporter.is_due())
+        reporter.report(10, 100, 3)
+        self.assertFalse(reporter.is_due())
+        self.assertEqual(reports[0].elapsed, 0.6)
+
+    def test_partial_changes(self):
+        # Test that only the TIDs that changed are sent, and the nodes shown before the pass start blank
+        frames = []
+        reporter = ProgressReporter(lambda progress: None, frames.append, clock=FakeClock())
+        reporter.start({1: 5, 2: 6})
+        reporter.report(0, 100, 1, {1: 5, 3: 7})
+        reporter.report(0, 100, 1, {1: 5, 3: 7})
+        reporter.report(0, 100, 2, {1: 5, 2: 8, 3: 7})
+        self.assertEqual(frames, [{2: None, 3: 7}, {2: 8}])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from utils.time_index import TimeIndex
+
+
+class TestTimeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.time_index = TimeIndex()
+        # Logs of node 1 at times 10, 10, 12, 15 added out of order, and a log of node 2
+        for position, (node, time) in enumerate([(1, 15), (1, 10), (2, 11), (1, 12), (1, 10)]):
+            self.time_index.add(node, time, position)
+        self.time_index.build(5)
+
+    def test_count(self):
+        # Test that a window includes both of its ends
+        self.assertEqual(self.time_index.count(1), 4)
+        self.assertEqual(self.time_index.count(1, 10, 12), 3)
+        self.assertEqual(self.time_index.count(1, 11, 14), 1)
+        self.assertEqual(self.time_index.count(1, 16), 0)
+        self.assertEqual(self.time_index.count(1, 13, 11), 0)
+        self.assertEqual(self.time_index.count(3, 0, 100), 0)
+
+    def test_slice(self):
+        # Test that a window is the positions of its logs in time order
+        self.assertEqual(list(self.time_index.slice(1, 10, 12)), [1, 4, 3])
+        self.assertEqual(list(self.time_index.slice(1, end=9)), [])
+        self.assertEqual(list(self.time_index.slice(2)), [2])
+
+# if __name__ == '__main__':
+#     unittest.main()
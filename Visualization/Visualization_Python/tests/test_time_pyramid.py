@@ -0,0 +1,48 @@
+import unittest
+
+from utils.time_index import TimeIndex, ALL_LOGS, tid_key
+from utils.time_pyramid import TimePyramid
+
+
+class TestTimePyramid(unittest.TestCase):
+
+    def setUp(self):
+        self.times = [100, 100, 105, 130, 161, 299]
+        tids = [7, 2, 7, 3, 3, 2]
+        self.time_index = TimeIndex()
+        for position, (time, tid) in enumerate(zip(self.times, tids)):
+            self.time_index.add(ALL_LOGS, time, position)
+            self.time_index.add(tid_key(tid), time, position)
+        self.time_index.build(len(self.times))
+        self.pyramid = TimePyramid(self.time_index)
+
+    def test_levels(self):
+        # Test that the levels are kept only up to the maximum number of buckets
+        self.assertEqual((self.pyramid.start_time, self.pyramid.end_time), (100, 299))
+        self.assertEqual(self.pyramid.bucket_widths, [1, 10, 60, 600, 3600, 21600, 86400])
+        self.assertEqual(TimePyramid(self.time_index, max_buckets=10).bucket_widths[0], 60)
+
+    def test_count(self):
+        # Test that the counts of any window match the time index
+        for start, end in [(100, 100), (101, 160), (0, 1000), (150, 120), (None, 130)]:
+            self.assertEqual(self.pyramid.count(ALL_LOGS, start, end), self.time_index.count(ALL_LOGS, start, end))
+        self.assertEqual(self.pyramid.count("missing"), 0)
+
+    def test_histogram(self):
+        # Test that the columns are rounded to the buckets that fit in them and hold every log of the range
+        self.assertEqual(self.pyramid.histogram(ALL_LOGS, 100, 299, 20), [3, 0, 0, 1, 0, 0, 1] + [0] * 12 + [1])
+        self.assertEqual(self.pyramid.get_level(200 / 3), 2)
+        self.assertEqual(sum(self.pyramid.histogram(ALL_LOGS, 100, 299, 3)), len(self.times))
+        # Columns finer than a second are counted by the time index
+        self.assertEqual(self.pyramid.histogram(ALL_LOGS, 100, 101, 4), [0, 2, 0, 0])
+
+    def test_active_tids(self):
+        # Test that only the TIDs with logs in the window are active
+        self.assertEqual(self.time_index.tids, [2, 3, 7])
+        # They are sorted once when the index is built, not on every call
+        self.assertIs(self.time_index.tids, self.time_index.tids)
+        self.assertEqual(self.pyramid.get_active_tids(101, 160), [3, 7])
+        self.assertEqual(self.pyramid.get_active_tids(200, 298), [])
+
+# if __name__ == '__main__':
+#     unittest.main()
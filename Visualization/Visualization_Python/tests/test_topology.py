@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+from utils.constants import GRID, QUADS, ROW, COL, CLUSTER_ID, CBUS
+from utils.topology import Topology, NO_NODE
+from utils.topology_cache import get_cache_dir, load_topology_cache, save_topology_cache
+from utils.type_names import ECORE
+
+
+def make_die_data(num_quads=2):
+    quad = {
+        ECORE: {ROW: 0, COL: 0, CLUSTER_ID: 1},
+        CBUS: [{ROW: 0, COL: 1, CLUSTER_ID: 2}, {ROW: 3, COL: 4, CLUSTER_ID: 3}],
+    }
+    return {GRID: {QUADS: [quad] * num_quads}}
+
+
+class TestTopology(unittest.TestCase):
+
+    def setUp(self):
+        self.topology = Topology([make_die_data(), make_die_data()])
+
+    def test_table(self):
+        # Test that every die, quad, hbm and cluster gets a node, parents before children
+        self.assertEqual(len(self.topology), 2 * (1 + 2 * (2 + 3)))
+        self.assertEqual(len(self.topology.leaf_nodes), 2 * 2 * 4)
+        node = self.topology.get_cluster_node(1, 1, 3, 4)
+        self.assertEqual(self.topology.get_address(node), (1, 1, 3, 4))
+        self.assertLess(self.topology.parent[node], node)
+        self.assertEqual(self.topology.get_cluster_node(0, 0, 5, 5), NO_NODE)
+        self.assertEqual(self.topology.get_cluster_node(2, 0, 0, 0), NO_NODE)
+
+    def test_rollup(self):
+        # Test that the dies and quads sum their clusters, with the TIDs in the order they first entered
+        self.topology.add(self.topology.get_cluster_node(0, 1, 0, 1), 5)
+        self.topology.add(self.topology.get_cluster_node(0, 0, 0, 0), 7)
+        self.topology.add(self.topology.get_cluster_node(0, 1, 3, 4), 7)
+        self.topology.add(self.topology.get_hbm_node(0, 1), 9)
+        self.topology.rollup()
+        die_summary = self.topology.get_summary(self.topology.get_die_node(0))
+        self.assertEqual(die_summary.count, 3)
+        self.assertEqual(die_summary.get_tids(), [5, 7])
+        self.assertEqual(self.topology.get_summary(self.topology.get_quad_node(0, 1)).count, 2)
+        self.assertFalse(self.topology.get_summary(self.topology.get_die_node(1)).has_activity)
+
+    def test_reset(self):
+        self.topology.add(self.topology.get_cluster_node(0, 0, 0, 0), 1)
+        self.topology.rollup()
+        self.topology.reset()
+        self.topology.rollup()
+        self.assertFalse(any(self.topology.counts))
+        # Every rollup is a new snapshot of the activity
+        self.assertEqual(self.topology.generation, 2)
+
+    def test_changed_nodes(self):
+        # Test that a rollup tags only the nodes whose count or dominant TID changed since the previous one
+        cluster = self.topology.get_cluster_node(0, 1, 0, 1)
+        self.topology.add(cluster, 5)
+        self.topology.rollup()
+        generation = self.topology.generation
+        self.topology.reset()
+        self.topology.add(cluster, 5)
+        self.topology.add(self.topology.get_cluster_node(1, 0, 0, 0), 9)
+        self.topology.rollup()
+        self.assertEqual(self.topology.get_changed_nodes(generation), [self.topology.get_die_node(1),
+                                                                       self.topology.get_quad_node(1, 0),
+                                                                       self.topology.get_cluster_node(1, 0, 0, 0)])
+        self.assertEqual(self.topology.get_changed_nodes(self.topology.generation), [])
+        # A change without activity, like is_enable, is a new generation of the nodes given
+        self.topology.mark_changed([cluster])
+        self.assertEqual(self.topology.get_changed_nodes(generation + 1), [cluster])
+
+    def test_partial_tids(self):
+        # Test that before a rollup every node gets the dominant TID of its clusters' logs, the hbm of its own
+        self.topology.add(self.topology.get_cluster_node(0, 1, 0, 1), 5)
+        self.topology.add(self.topology.get_cluster_node(0, 0, 0, 0), 7)
+        self.topology.add(self.topology.get_cluster_node(0, 1, 3, 4), 7)
+        self.topology.add(self.topology.get_hbm_node(0, 0), 9)
+        self.topology.add(self.topology.get_hbm_node(0, 0), 9)
+        tids = self.topology.get_partial_tids()
+        self.assertEqual(tids[self.topology.get_die_node(0)], 7)
+        self.assertEqual(tids[self.topology.get_quad_node(0, 0)], 7)
+        self.assertEqual(tids[self.topology.get_quad_node(0, 1)], 5)
+        self.assertEqual(tids[self.topology.get_hbm_node(0, 0)], 9)
+        self.assertNotIn(self.topology.get_die_node(1), tids)
+        # The dominant TIDs of the rollup are the same
+        self.topology.rollup()
+        self.assertEqual(self.topology.get_dominant_tids(), tids)
+
+    def test_dominant_tids(self):
+        # Test that a rollup keeps the dominant TID of every node, the one with the most logs under it
+        self.topology.add(self.topology.get_cluster_node(0, 1, 0, 1), 5)
+        self.topology.add(self.topology.get_cluster_node(0, 0, 0, 0), 7)
+        self.topology.add(self.topology.get_cluster_node(0, 1, 3, 4), 7)
+        self.topology.rollup()
+        self.assertEqual(self.topology.dominant_tids[self.topology.get_die_node(0)], 7)
+        self.assertEqual(self.topology.dominant_tids[self.topology.get_quad_node(0, 1)], 5)
+        self.assertIsNone(self.topology.dominant_tids[self.topology.get_die_node(1)])
+
+    def test_cache(self):
+        # Test that a cached table is restored as it was built, and only for the same content key
+        with tempfile.TemporaryDirectory() as cache_dir:
+            save_topology_cache("key", {"topology": self.topology.get_state()}, cache_dir)
+            self.assertIsNone(load_topology_cache("other key", cache_dir))
+            restored = Topology.from_state(load_topology_cache("key", cache_dir)["topology"])
+        self.assertEqual(len(restored), len(self.topology))
+        self.assertEqual(restored.get_cluster_node(1, 1, 3, 4), self.topology.get_cluster_node(1, 1, 3, 4))
+        self.assertEqual(restored.parent, self.topology.parent)
+
+    def test_cache_location_and_failure(self):
+        # Test that the cache is kept next to the input file, and a failure to write it is logged, not raised
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = os.path.join(temp_dir, "chip_data.json")
+            self.assertEqual(get_cache_dir(input_file), os.path.join(temp_dir, ".cache"))
+            with open(input_file, 'w'):
+                pass
+            with self.assertLogs("utils.topology_cache", level="WARNING"):
+                save_topology_cache("key", {}, os.path.join(input_file, "cache"))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import utils.tracing as tracing
+from utils.tracing import Tracer, traced, traced_total, trace_span, trace_instant, AGGREGATED_LANE
+
+
+class TestTracing(unittest.TestCase):
+
+    def tearDown(self):
+        tracing.tracer = None
+
+    def test_disabled(self):
+        # Test that nothing is wrapped or recorded when tracing is off
+        def route(log):
+            return log
+        self.assertIs(traced()(route), route)
+        self.assertIs(traced_total()(route), route)
+        with trace_span("block"):
+            pass
+        trace_instant("metrics", lambda: self.fail("The values are read when tracing is off"))
+
+    def test_spans(self):
+        # Test that the spans are complete events on the lane of their thread, and the totals of the helpers
+        # called in a collecting span are added once, with their number of calls
+        tracer = tracing.tracer = Tracer()
+
+        @traced_total("route")
+        def route(log):
+            return log
+
+        @traced("link", collect=True)
+        def link(logs):
+            with trace_span("start_logs", logs=len(logs)):
+                pass
+            return [route(log) for log in logs]
+
+        self.assertEqual(link([1, 2, 3]), [1, 2, 3])
+        events = {event['name']: event for event in tracer.to_dict()['traceEvents'] if event['ph'] == 'X'}
+        self.assertEqual(set(events), {'start_logs', 'link', 'route'})
+        self.assertEqual(events['start_logs']['args'], {'logs': 3})
+        self.assertEqual(events['route']['args'], {'calls': 3})
+        self.assertEqual(events['route']['tid'], tracer.lanes[AGGREGATED_LANE])
+        self.assertNotEqual(events['link']['tid'], events['route']['tid'])
+        self.assertLessEqual(events['link']['ts'], events['start_logs']['ts'])
+        self.assertEqual(tracer.totals, {})
+        # A moment of the pass carries the values read for it, like the counters of the filter chain
+        trace_instant("metrics", lambda: {'lines_read': 3})
+        self.assertEqual(tracer.events[-1]['args'], {'lines_read': 3})
+
+# if __name__ == '__main__':
+#     unittest.main()
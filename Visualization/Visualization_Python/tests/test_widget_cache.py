@@ -0,0 +1,59 @@
+import unittest
+
+from gui.widget_cache import WidgetCache
+
+
+class FakeWidget:
+    def __init__(self, name):
+        self.name = name
+        self.refreshed = 0
+        self.deleted = False
+
+    def refresh(self):
+        self.refreshed += 1
+
+    def deleteLater(self):
+        self.deleted = True
+
+
+class TestWidgetCache(unittest.TestCase):
+
+    def setUp(self):
+        self.generations = {}
+        self.cache = WidgetCache(lambda key: self.generations.get(key, 0))
+
+    def test_reuse(self):
+        # Test that a widget is created once and returned as it is while the snapshot is the same
+        widget = self.cache.get(('quad', 1), lambda: FakeWidget('quad'))
+        self.assertIs(self.cache.get(('quad', 1), lambda: FakeWidget('other')), widget)
+        self.assertEqual(widget.refreshed, 0)
+        self.assertIn(('quad', 1), self.cache)
+        self.assertNotIn(('quad', 2), self.cache)
+
+    def test_refresh(self):
+        # Test that a widget whose object changed is refreshed once, when it is taken or by its key
+        first = self.cache.get('first', lambda: FakeWidget('first'))
+        second = self.cache.get('second', lambda: FakeWidget('second'))
+        self.generations.update(first=1, second=1)
+        self.assertIs(self.cache.get('first', lambda: FakeWidget('other')), first)
+        self.cache.get('first', lambda: FakeWidget('other'))
+        self.assertEqual(first.refreshed, 1)
+        self.assertEqual(self.cache.refresh(['second', 'missing']), 1)
+        self.assertEqual(self.cache.refresh(['second']), 0)
+        self.assertEqual(second.refreshed, 1)
+
+    def test_refresh_changed_only(self):
+        # Test that only the widgets whose objects changed are refreshed
+        widgets = [self.cache.get(index, lambda: FakeWidget('cluster')) for index in range(4)]
+        self.generations[2] = 1
+        self.assertEqual(self.cache.refresh(list(range(4))), 1)
+        self.assertEqual([widget.refreshed for widget in widgets], [0, 0, 1, 0])
+
+    def test_clear(self):
+        widget = self.cache.get('first', lambda: FakeWidget('first'))
+        self.cache.clear()
+        self.assertTrue(widget.deleted)
+        self.assertEqual(len(self.cache), 0)
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,145 @@
+import threading
+import unittest
+from types import SimpleNamespace
+
+from utils.window_prefetch import WindowPrefetcher, get_prefetch_span
+
+
+def make_log(tid, time_stamp):
+    cluster_id = SimpleNamespace(chip=0, die=0, quad=1, row=2, col=3)
+    return SimpleNamespace(tid=tid, area="mem0", unit="fcb0", io="in", timeStamp=time_stamp, clusterId=cluster_id)
+
+
+LOGS = [make_log(tid, time_stamp) for time_stamp in range(100, 200) for tid in (1, 2)]
+
+
+class FakeFilterFactory:
+    """
+    Reads LOGS instead of the log file, the time window is set like in the module
+    """
+
+    scans = 0
+
+    def __init__(self, log_file):
+        self.start_time, self.end_time = 0, 0
+        self.queue = []
+
+    def set_start_time(self, time):
+        self.start_time = time
+
+    def set_end_time(self, time):
+        self.end_time = time
+
+    def start_logs(self):
+        FakeFilterFactory.scans += 1
+        self.queue = [log for log in LOGS if self.start_time <= log.timeStamp <= self.end_time]
+
+    def is_finished_process(self):
+        return True
+
+    def has_log(self):
+        return bool(self.queue)
+
+    def get_log(self):
+        return self.queue.pop(0)
+
+    def join_thread(self):
+        pass
+
+
+class BlockingFilterFactory(FakeFilterFactory):
+    """
+    Stops in the middle of the scan, after its first log, until the test releases it
+    """
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_log(self):
+        log = super().get_log()
+        BlockingFilterFactory.started.set()
+        BlockingFilterFactory.release.wait(5)
+        return log
+
+
+class TestWindowPrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        FakeFilterFactory.scans = 0
+        self.prefetcher = WindowPrefetcher("logs.csv", lambda log: True, FakeFilterFactory)
+
+    def prefetch(self, window, filters):
+        self.prefetcher.prefetch(get_prefetch_span(window), filters)
+        self.prefetcher.join()
+
+    def test_span_around_window(self):
+        # Test that a width of the window is prefetched before it and after it
+        self.assertEqual(get_prefetch_span((130, 139)), (120, 149))
+
+    def test_hit(self):
+        # Test that the windows the timeline asks for next - a step of the playback or a moved handle - are hits
+        self.prefetch((130, 139), [])
+        step = self.prefetcher.get((132, 141), [])
+        self.assertEqual(step, [log for log in LOGS if 132 <= log.timeStamp <= 141])
+        handle = self.prefetcher.get((125, 139), [("ThreadId", [1])])
+        self.assertIsNone(handle)  # Not under the filters it was prefetched with
+        self.prefetch((130, 139), [("ThreadId", [1])])
+        handle = self.prefetcher.get((125, 139), [("ThreadId", [1])])
+        self.assertEqual(handle, [log for log in LOGS if 125 <= log.timeStamp <= 139 and log.tid == 1])
+
+    def test_miss(self):
+        # Test that a window that goes out of the span is read from the file, and a covered span is not scanned
+        self.prefetch((130, 139), [])
+        self.assertIsNone(self.prefetcher.get((145, 154), []))
+        self.assertIsNone(self.prefetcher.get((110, 139), []))
+        self.prefetch((125, 144), [])
+        self.assertEqual(FakeFilterFactory.scans, 2)
+        self.prefetch((130, 139), [])
+        self.assertEqual(FakeFilterFactory.scans, 2)
+
+    def test_filter_change(self):
+        # Test that the logs of other filters are not served, in any shape of equal filters
+        self.prefetch((130, 139), [("ThreadId", [1, 2])])
+        self.assertIsNotNone(self.prefetcher.get((130, 139), [("ThreadId", [2, 1])]))
+        self.assertIsNone(self.prefetcher.get((130, 139), [("ThreadId", [2])]))
+        self.assertIsNone(self.prefetcher.get((130, 139), []))
+        self.prefetcher.clear()
+        self.assertIsNone(self.prefetcher.get((130, 139), [("ThreadId", [1, 2])]))
+
+
+class TestPrefetchCancel(unittest.TestCase):
+
+    def setUp(self):
+        BlockingFilterFactory.started.clear()
+        BlockingFilterFactory.release.clear()
+        self.prefetcher = WindowPrefetcher("logs.csv", lambda log: True, BlockingFilterFactory)
+
+    def tearDown(self):
+        BlockingFilterFactory.release.set()
+        self.prefetcher.join(5)
+
+    def test_cancel(self):
+        # Test that a cancelled scan stops in the middle and its logs are dropped
+        self.prefetcher.prefetch(get_prefetch_span((130, 139)), [])
+        self.assertTrue(BlockingFilterFactory.started.wait(5))
+        self.prefetcher.cancel()
+        BlockingFilterFactory.release.set()
+        self.prefetcher.join(5)
+        self.assertFalse(self.prefetcher.is_running)
+        self.assertIsNone(self.prefetcher.get((130, 139), []))
+
+    def test_new_request_cancels(self):
+        # Test that the next prefetch cancels the scan that runs, only the new span is kept
+        self.prefetcher.prefetch(get_prefetch_span((130, 139)), [])
+        self.assertTrue(BlockingFilterFactory.started.wait(5))
+        cancelled = self.prefetcher._thread
+        self.prefetcher.prefetch(get_prefetch_span((170, 179)), [])
+        BlockingFilterFactory.release.set()
+        cancelled.join(5)
+        self.prefetcher.join(5)
+        self.assertFalse(cancelled.is_alive())
+        self.assertIsNone(self.prefetcher.get((130, 139), []))
+        self.assertEqual(self.prefetcher.get((170, 179), []), [log for log in LOGS if 170 <= log.timeStamp <= 179])
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,171 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # The cube is then counted in pure python, about ten times slower
+
+# Cubes with up to this many cells are counted with a dense bincount, larger ones by sorting the cells of the logs
+MAX_DENSE_CELLS = 1 << 26
+
+# A coordinate of an axis of the cube - a single ordinal, a slice of ordinals or all of them
+Coordinate = Union[None, int, slice]
+
+
+class LogColumns:
+    """
+    The time, leaf and TID of every log of the log file that has a leaf, one array per attribute.
+    Leaves and TIDs are stored by their ordinal, in the order they were first seen.
+    """
+    __slots__ = ('times', 'leaves', 'tids', 'leaf_keys', 'tid_values', '_leaf_ordinals', '_tid_ordinals')
+
+    def __init__(self) -> None:
+        self.times = array('q')
+        self.leaves = array('i')
+        self.tids = array('i')
+        self.leaf_keys: List[Hashable] = []  # The node of the time index of each leaf ordinal
+        self.tid_values: List[int] = []  # The TID of each TID ordinal
+        self._leaf_ordinals: Dict[Hashable, int] = {}
+        self._tid_ordinals: Dict[int, int] = {}
+
+    def add(self, time: int, leaf: Hashable, tid: int) -> None:
+        leaf_ordinal = self._leaf_ordinals.get(leaf)
+        if leaf_ordinal is None:
+            leaf_ordinal = self._leaf_ordinals[leaf] = len(self.leaf_keys)
+            self.leaf_keys.append(leaf)
+        tid_ordinal = self._tid_ordinals.get(tid)
+        if tid_ordinal is None:
+            tid_ordinal = self._tid_ordinals[tid] = len(self.tid_values)
+            self.tid_values.append(tid)
+        self.times.append(time)
+        self.leaves.append(leaf_ordinal)
+        self.tids.append(tid_ordinal)
+
+    def get_leaf_ordinal(self, leaf: Hashable) -> Optional[int]:
+        return self._leaf_ordinals.get(leaf)
+
+    def get_tid_ordinal(self, tid: int) -> Optional[int]:
+        return self._tid_ordinals.get(tid)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+class ActivityCube:
+    """
+    Number of logs by time bucket, leaf and TID.
+
+    Only the cells with logs are kept, as cell keys sorted in time bucket, leaf and TID order with their counts,
+    so a range of time buckets is a single bisection and any other slice is one pass over the cells.
+    """
+
+    def __init__(self, columns: LogColumns, bucket_width: int, start_time: Optional[int] = None) -> None:
+        if bucket_width <= 0:
+            raise ValueError(f"Invalid bucket width {bucket_width}")
+        self.bucket_width = bucket_width
+        self.start_time = start_time if start_time is not None else min(columns.times, default=0)
+        self.leaf_keys = list(columns.leaf_keys)
+        self.tid_values = list(columns.tid_values)
+        self.num_leaves = max(len(self.leaf_keys), 1)
+        self.num_tids = max(len(self.tid_values), 1)
+        last_time = max(columns.times, default=self.start_time)
+        self.num_buckets = (last_time - self.start_time) // bucket_width + 1
+        self.keys, self.counts = self._count_cells(columns)
+
+    def _count_cells(self, columns: LogColumns) -> Tuple[array, array]:
+        """
+        Returns the sorted keys of the cells with logs and the number of logs in each of them
+        """
+        keys, counts = array('q'), array('q')
+        if not len(columns):
+            return keys, counts
+        if numpy is not None:
+            times = numpy.frombuffer(columns.times, dtype=numpy.int64)
+            leaves = numpy.frombuffer(columns.leaves, dtype=numpy.int32).astype(numpy.int64)
+            tids = numpy.frombuffer(columns.tids, dtype=numpy.int32).astype(numpy.int64)
+            cells = ((times - self.start_time) // self.bucket_width * self.num_leaves + leaves) * self.num_tids + tids
+            cells = cells[cells >= 0]
+            num_cells = self.num_buckets * self.num_leaves * self.num_tids
+            if num_cells <= MAX_DENSE_CELLS:
+                dense_counts = numpy.bincount(cells, minlength=num_cells)
+                cell_keys = numpy.flatnonzero(dense_counts)
+                cell_counts = dense_counts[cell_keys]
+            else:
+                cell_keys, cell_counts = numpy.unique(cells, return_counts=True)
+            keys.frombytes(cell_keys.astype(numpy.int64).tobytes())
+            counts.frombytes(cell_counts.astype(numpy.int64).tobytes())
+            return keys, counts
+
+        start_time, bucket_width, num_leaves, num_tids = \
+            self.start_time, self.bucket_width, self.num_leaves, self.num_tids
+        cells = Counter(((time - start_time) // bucket_width * num_leaves + leaf) * num_tids + tid
+                        for time, leaf, tid in zip(columns.times, columns.leaves, columns.tids)
+                        if time >= start_time)
+        for key in sorted(cells):
+            keys.append(key)
+            counts.append(cells[key])
+        return keys, counts
+
+    def get_bucket(self, time: int) -> int:
+        """
+        Returns the time bucket of a time
+        """
+        return (time - self.start_time) // self.bucket_width
+
+    def get_bucket_start(self, bucket: int) -> int:
+        return self.start_time + bucket * self.bucket_width
+
+    def cells(self, bucket: Coordinate = None, leaf: Coordinate = None,
+              tid: Coordinate = None) -> Dict[Tuple[int, int, int], int]:
+        """
+        Returns the counts of the cells in the slice, by their (bucket, leaf ordinal, TID ordinal).
+        Each axis is selected by a single ordinal, a slice of ordinals or None for the whole axis.
+        """
+        first, last = self._bucket_range(bucket)
+        leaves = self._axis_range(leaf, self.num_leaves)
+        tids = self._axis_range(tid, self.num_tids)
+        cells = {}
+        cell_size = self.num_leaves * self.num_tids
+        for index in range(bisect_left(self.keys, first * cell_size), bisect_left(self.keys, last * cell_size)):
+            cell_bucket, rest = divmod(self.keys[index], cell_size)
+            cell_leaf, cell_tid = divmod(rest, self.num_tids)
+            if cell_leaf in leaves and cell_tid in tids:
+                cells[cell_bucket, cell_leaf, cell_tid] = self.counts[index]
+        return cells
+
+    def count(self, bucket: Coordinate = None, leaf: Coordinate = None, tid: Coordinate = None) -> int:
+        """
+        Returns the number of logs in the slice
+        """
+        if leaf is None and tid is None:
+            first, last = self._bucket_range(bucket)
+            cell_size = self.num_leaves * self.num_tids
+            return sum(self.counts[bisect_left(self.keys, first * cell_size):bisect_left(self.keys, last * cell_size)])
+        return sum(self.cells(bucket, leaf, tid).values())
+
+    def totals(self, axis: int, bucket: Coordinate = None, leaf: Coordinate = None,
+               tid: Coordinate = None) -> Dict[int, int]:
+        """
+        Returns the number of logs in the slice by their ordinal on one axis - 0 for the time buckets,
+        1 for the leaves and 2 for the TIDs
+        """
+        totals = Counter()
+        for cell, count in self.cells(bucket, leaf, tid).items():
+            totals[cell[axis]] += count
+        return dict(totals)
+
+    def _bucket_range(self, bucket: Coordinate) -> Tuple[int, int]:
+        buckets = self._axis_range(bucket, self.num_buckets)
+        return (buckets.start, buckets.stop) if buckets else (0, 0)
+
+    @staticmethod
+    def _axis_range(coordinate: Coordinate, size: int) -> range:
+        if coordinate is None:
+            return range(size)
+        if isinstance(coordinate, slice):
+            start, stop, _ = coordinate.indices(size)
+            return range(start, max(start, stop))
+        return range(coordinate, coordinate + 1) if 0 <= coordinate < size else range(0)
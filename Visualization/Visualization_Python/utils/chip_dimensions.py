@@ -0,0 +1,118 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from entities.quad import iter_clusters_data
+
+from utils.constants import ID, CHIP, GRID, QUADS, QUADS_PER_SIDE, CLUSTERS_PER_SIDE, NUM_DIES, \
+    NUM_QUADS_PER_SIDE, NUM_CLUSTERS_PER_SIDE
+from utils.error_messages import WarningMessages
+from utils.type_names import DIE
+
+NO_DIE = -1
+
+
+class ChipDimensions:
+    """
+    Dimensions of the system in chip_data.json - its chips, the dies of each chip, and the quad and cluster
+    grids of a die.
+
+    The dies are indexed in the order of the DIES list, a die of the logs is found by its (chip, die id).
+    The grid sizes are taken from the dimensions in Top, or else are the defaults grown to fit the json.
+    """
+    __slots__ = ('die_addresses', 'die_indexes', 'quads_per_side', 'clusters_per_side')
+
+    def __init__(self, die_addresses: Optional[Sequence[Tuple[int, int]]] = None,
+                 quads_per_side: int = NUM_QUADS_PER_SIDE, clusters_per_side: int = NUM_CLUSTERS_PER_SIDE) -> None:
+        if die_addresses is None:
+            die_addresses = [(0, die) for die in range(NUM_DIES)]
+        self.die_addresses: List[Tuple[int, int]] = [tuple(address) for address in die_addresses]  # Index -> (chip, id)
+        self.die_indexes: Dict[Tuple[int, int], int] = {}
+        for index, address in enumerate(self.die_addresses):
+            if address in self.die_indexes:
+                raise ValueError(WarningMessages.INVALID_DATA.value.format(component=DIE, data=address))
+            self.die_indexes[address] = index
+        self.quads_per_side = quads_per_side
+        self.clusters_per_side = clusters_per_side
+
+    @classmethod
+    def from_chip_data(cls, dies_data: List[Dict[str, Any]],
+                       dimensions_data: Optional[Dict[str, int]] = None) -> 'ChipDimensions':
+        """
+        Reads the dimensions from the DIES of chip_data.json and the optional dimensions of its Top.
+        A die without a chip belongs to chip 0, a die without an id is numbered by its order in its chip.
+        """
+        dimensions_data = dimensions_data or {}
+        die_addresses, dies_per_chip = [], Counter()
+        for die_data in dies_data:
+            chip = int(die_data.get(CHIP, 0))
+            die_id = die_data.get(ID)
+            die_addresses.append((chip, dies_per_chip[chip] if die_id is None else int(die_id)))
+            dies_per_chip[chip] += 1
+
+        quads_per_side = dimensions_data.get(QUADS_PER_SIDE)
+        if quads_per_side is None:
+            most_quads = max((len(die_data.get(GRID, {}).get(QUADS, [])) for die_data in dies_data), default=0)
+            quads_per_side = NUM_QUADS_PER_SIDE
+            while quads_per_side * quads_per_side < most_quads:
+                quads_per_side += 1
+        clusters_per_side = dimensions_data.get(CLUSTERS_PER_SIDE)
+        if clusters_per_side is None:
+            clusters_per_side = max([NUM_CLUSTERS_PER_SIDE] + [
+                max(row, col) + 1 for die_data in dies_data for quad_data in die_data.get(GRID, {}).get(QUADS, [])
+                for row, col, _, _ in iter_clusters_data(quad_data)])
+        return cls(die_addresses, int(quads_per_side), int(clusters_per_side))
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return self.die_addresses, self.quads_per_side, self.clusters_per_side
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> 'ChipDimensions':
+        return cls(*state)
+
+    @property
+    def num_dies(self) -> int:
+        return len(self.die_addresses)
+
+    @property
+    def num_chips(self) -> int:
+        return len({chip for chip, _ in self.die_addresses})
+
+    @property
+    def quads_per_die(self) -> int:
+        return self.quads_per_side * self.quads_per_side
+
+    @property
+    def clusters_per_quad(self) -> int:
+        return self.clusters_per_side * self.clusters_per_side
+
+    @property
+    def num_cluster_positions(self) -> int:
+        return self.num_dies * self.quads_per_die * self.clusters_per_quad
+
+    def get_die_index(self, chip: int, die: int) -> int:
+        """
+        Returns the index of the die of the given chip, or NO_DIE if there is no such die
+        """
+        return self.die_indexes.get((chip, die), NO_DIE)
+
+    def get_dies_of_chip(self, chip: int) -> List[int]:
+        return [index for index, (die_chip, _) in enumerate(self.die_addresses) if die_chip == chip]
+
+    def is_valid(self, die: int, quad: int, row: int = 0, col: int = 0) -> bool:
+        return (0 <= die < self.num_dies and 0 <= quad < self.quads_per_die
+                and 0 <= row < self.clusters_per_side and 0 <= col < self.clusters_per_side)
+
+    def quad_position(self, die: int, quad: int) -> int:
+        return die * self.quads_per_die + quad
+
+    def cluster_position(self, die: int, quad: int, row: int, col: int) -> int:
+        return ((die * self.quads_per_die + quad) * self.clusters_per_side + row) * self.clusters_per_side + col
+
+    def get_cluster_address(self, position: int) -> Tuple[int, int, int, int]:
+        position, col = divmod(position, self.clusters_per_side)
+        position, row = divmod(position, self.clusters_per_side)
+        die, quad = divmod(position, self.quads_per_die)
+        return die, quad, row, col
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ChipDimensions) and self.get_state() == other.get_state()
@@ -0,0 +1,157 @@
+from typing import Iterator, Optional, Tuple
+
+from utils.chip_dimensions import ChipDimensions
+from utils.type_names import DIE, HBM, CLUSTER, HOST_INTERFACE, D2D
+
+# A rectangle in the coordinates of the layout - x, y, width and height
+Rect = Tuple[float, float, float, float]
+
+CLUSTER_SIZE = 10.0
+HBM_WIDTH = 10.0
+QUAD_GAP = 4.0
+DIE_GAP = 20.0
+HOST_INTERFACE_WIDTH = 40.0
+D2D_HEIGHT = 16.0
+
+# Levels of detail - what is drawn of a quad, by the size of a cluster on the screen
+QUAD_DETAIL, CLUSTER_DETAIL, UNIT_DETAIL = range(3)
+MIN_CLUSTER_PIXELS = 6  # Smaller clusters are drawn as a part of their quad
+MIN_UNIT_PIXELS = 60  # Larger clusters show their units
+
+
+class ChipLayout:
+    """
+    Positions of every part of the system in a single plane - the host interface on the left, the dies of every
+    chip in a row next to it, and the die2die below them. A die is the grid of its quads, and a quad is the grid
+    of its clusters with its hbm on the outer side, like the die view.
+
+    Every position is arithmetic on the dimensions of the chip, so nothing is kept per cluster, and the clusters
+    in any rectangle are found without going over the others.
+    """
+
+    def __init__(self, dimensions: ChipDimensions) -> None:
+        self.dimensions = dimensions
+        self.quad_size = dimensions.clusters_per_side * CLUSTER_SIZE
+        self.quad_step = self.quad_size + HBM_WIDTH + QUAD_GAP
+        self.die_width = dimensions.quads_per_side * self.quad_step + QUAD_GAP
+        self.die_height = dimensions.quads_per_side * (self.quad_size + QUAD_GAP) + QUAD_GAP
+        chips = sorted({chip for chip, _ in dimensions.die_addresses})
+        self.chip_rows = {chip: row for row, chip in enumerate(chips)}
+        self.die_columns = [len([other for other in dimensions.get_dies_of_chip(chip) if other < die])
+                            for die, (chip, _) in enumerate(dimensions.die_addresses)]
+        num_columns = max(self.die_columns, default=-1) + 1
+        self.dies_left = HOST_INTERFACE_WIDTH + DIE_GAP
+        self.width = self.dies_left + num_columns * (self.die_width + DIE_GAP)
+        self.dies_height = max(len(chips), 1) * (self.die_height + DIE_GAP)
+        self.height = self.dies_height + D2D_HEIGHT
+
+    @property
+    def bounds(self) -> Rect:
+        return 0.0, 0.0, self.width, self.height
+
+    @property
+    def host_interface_rect(self) -> Rect:
+        return 0.0, 0.0, HOST_INTERFACE_WIDTH, self.dies_height - DIE_GAP
+
+    @property
+    def d2d_rect(self) -> Rect:
+        return self.dies_left, self.dies_height, self.width - self.dies_left - DIE_GAP, D2D_HEIGHT
+
+    def die_rect(self, die: int) -> Rect:
+        chip, _ = self.dimensions.die_addresses[die]
+        x = self.dies_left + self.die_columns[die] * (self.die_width + DIE_GAP)
+        y = self.chip_rows[chip] * (self.die_height + DIE_GAP)
+        return x, y, self.die_width, self.die_height
+
+    def is_right_side(self, quad: int) -> bool:
+        return quad % self.dimensions.quads_per_side >= self.dimensions.quads_per_side // 2
+
+    def quad_rect(self, die: int, quad: int) -> Rect:
+        """
+        The clusters of the quad, without its hbm
+        """
+        die_x, die_y, _, _ = self.die_rect(die)
+        row, col = divmod(quad, self.dimensions.quads_per_side)
+        x = die_x + QUAD_GAP + col * self.quad_step + (0 if self.is_right_side(quad) else HBM_WIDTH)
+        y = die_y + QUAD_GAP + row * (self.quad_size + QUAD_GAP)
+        return x, y, self.quad_size, self.quad_size
+
+    def hbm_rect(self, die: int, quad: int) -> Rect:
+        x, y, width, height = self.quad_rect(die, quad)
+        return (x + width if self.is_right_side(quad) else x - HBM_WIDTH), y, HBM_WIDTH, height
+
+    def cluster_rect(self, die: int, quad: int, row: int, col: int) -> Rect:
+        x, y, _, _ = self.quad_rect(die, quad)
+        return x + col * CLUSTER_SIZE, y + row * CLUSTER_SIZE, CLUSTER_SIZE, CLUSTER_SIZE
+
+    def get_level_of_detail(self, scale: float) -> int:
+        """
+        Returns what is drawn of the quads when a unit of the layout is scale pixels
+        """
+        cluster_pixels = CLUSTER_SIZE * scale
+        if cluster_pixels < MIN_CLUSTER_PIXELS:
+            return QUAD_DETAIL
+        if cluster_pixels < MIN_UNIT_PIXELS:
+            return CLUSTER_DETAIL
+        return UNIT_DETAIL
+
+    def iter_visible_quads(self, view: Rect) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the die and quad of every quad that overlaps the view, with its hbm
+        """
+        for die in range(self.dimensions.num_dies):
+            if not intersects(self.die_rect(die), view):
+                continue
+            for quad in range(self.dimensions.quads_per_die):
+                x, y, width, height = self.quad_rect(die, quad)
+                if intersects((x - HBM_WIDTH, y, width + 2 * HBM_WIDTH, height), view):
+                    yield die, quad
+
+    def iter_visible_clusters(self, die: int, quad: int, view: Rect) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the row and column of every cluster position of the quad that overlaps the view
+        """
+        x, y, _, _ = self.quad_rect(die, quad)
+        view_x, view_y, view_width, view_height = view
+        last = self.dimensions.clusters_per_side - 1
+        first_col = max(int((view_x - x) // CLUSTER_SIZE), 0)
+        last_col = min(int((view_x + view_width - x) // CLUSTER_SIZE), last)
+        first_row = max(int((view_y - y) // CLUSTER_SIZE), 0)
+        last_row = min(int((view_y + view_height - y) // CLUSTER_SIZE), last)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                yield row, col
+
+    def hit_test(self, x: float, y: float) -> Optional[Tuple[str, Tuple[int, ...]]]:
+        """
+        Returns the type and the address of the part of the system at a point, the innermost one,
+        or None if there is nothing there
+        """
+        if contains(self.host_interface_rect, x, y):
+            return HOST_INTERFACE, ()
+        if contains(self.d2d_rect, x, y):
+            return D2D, ()
+        for die in range(self.dimensions.num_dies):
+            if not contains(self.die_rect(die), x, y):
+                continue
+            for quad in range(self.dimensions.quads_per_die):
+                if contains(self.hbm_rect(die, quad), x, y):
+                    return HBM, (die, quad)
+                quad_x, quad_y, width, height = self.quad_rect(die, quad)
+                if contains((quad_x, quad_y, width, height), x, y):
+                    row = min(int((y - quad_y) // CLUSTER_SIZE), self.dimensions.clusters_per_side - 1)
+                    col = min(int((x - quad_x) // CLUSTER_SIZE), self.dimensions.clusters_per_side - 1)
+                    return CLUSTER, (die, quad, row, col)
+            return DIE, (die,)
+        return None
+
+
+def intersects(rect: Rect, other: Rect) -> bool:
+    x, y, width, height = rect
+    other_x, other_y, other_width, other_height = other
+    return x < other_x + other_width and other_x < x + width and y < other_y + other_height and other_y < y + height
+
+
+def contains(rect: Rect, x: float, y: float) -> bool:
+    rect_x, rect_y, width, height = rect
+    return rect_x <= x < rect_x + width and rect_y <= y < rect_y + height
@@ -27,6 +27,15 @@ UNIT = "unit"
 AREA = "area"
 TIMESTAMP = "timeStemp"
 
+# chip dimensions
+DIMENSIONS = "dimensions"
+QUADS_PER_SIDE = "quads_per_side"
+CLUSTERS_PER_SIDE = "clusters_per_side"
+
+# topology cache
+TOPOLOGY = "topology"
+DIE_IDS = "die_ids"
+
 OBJECT_COLORS = {
     BMT: "lightblue",
     H2G: "pink",
@@ -62,6 +71,9 @@ X_BUTTON = "X"
 COMPONENT_LOGS = "{component} Logs"
 EMPTY = "Empty"
 VIEW_LOGS = "View Logs"
+# The logs counted by the time index, the filters of the view are not applied
+WINDOW_COUNT_TOOLTIP = "Logs in the time window, before the filters: {count}"
+ANCESTOR_WINDOW_COUNT_TOOLTIP = "Logs of its cluster in the time window, before the filters: {count}"
 
 # colors
 BLACK = "black"
@@ -74,7 +86,7 @@ GRAY = "gray"
 # open_files
 READ = "r"
 
-# settings
+# settings - defaults of the chip dimensions, which are read from chip_data.json
 NUM_QUADS_PER_SIDE = 2
 NUM_CLUSTERS_PER_SIDE = 8
 NUM_DIES = 2
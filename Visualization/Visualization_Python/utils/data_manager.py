@@ -1,34 +1,107 @@
 import json
 import datetime
-from typing import Dict, Any, List
+import threading
+from array import array
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
 
 from entities.die import Die
+from entities.quad import Quad
+from entities.cluster import Cluster
 from entities.host_interface import HostInterface
 from entities.component import Component
 
 import filter_factory_module
 import logs_factory
 
-from utils.filter_types import FILTER_TYPES_NAMES, CLUSTER, IO
-from utils.type_names import HOST_INTERFACE, BMT, PCIE, AREAS, D2D, ECORE, EQ, HBM, MCU, QUAD, DIE
-from utils.constants import TOP, DIES, ID, ENABLED_CLUSTERS, COL, DID, ROW, NUM_DIES, NUM_QUADS_PER_SIDE, READ, \
-    TIMESTAMP, CLUSTER_ID, CHIP, AREA, UNIT, TID, PACKET
+from utils.filter_types import FILTER_TYPES_NAMES, CLUSTER
+from utils.type_names import HOST_INTERFACE, BMT, PCIE, AREAS, D2D, ECORE, EQ, HBM, MCU, QUAD, DIE, G2H
+from utils.constants import TOP, DIES, ID, ENABLED_CLUSTERS, COL, DID, ROW, CHIP, READ, TOPOLOGY, DIE_IDS, \
+    DIMENSIONS
+from utils.multi_query import MultiQueryScan, FilterSpec
+from utils.topology import Topology, TopologySummary, NO_NODE, HBM_NODE
+from utils.chip_dimensions import ChipDimensions, NO_DIE
+from utils.enabled_mask import EnabledMask
+from utils.time_index import TimeIndex, ALL_LOGS, tid_key
+from utils.time_pyramid import TimePyramid
+from utils.activity_cube import ActivityCube, LogColumns
+from utils.playback import Playback
+from utils.window_prefetch import WindowPrefetcher, get_prefetch_span
+from utils.progress import ProgressReporter, POLLS_PER_CHECK
+from utils.tracing import traced, traced_total, trace_span, trace_instant
+from utils.topology_cache import get_cache_dir, get_content_key, load_topology_cache, save_topology_cache
 from utils.paths import LOGS_CSV
 from utils.error_messages import ErrorMessages, WarningMessages
 
+# The counters of a pass of the filter chain, as filter_factory_module.FilterMetrics names them
+FILTER_METRICS = ('lines_read', 'lines_parsed', 'parse_failures', 'bytes_read', 'bytes_to_read', 'queued_logs',
+                  'queue_high_water', 'pass_seconds')
+STAGES, FILTER, PASSED, REJECTED = 'stages', 'filter', 'passed', 'rejected'
+
 
 class DataManager:
-    def __init__(self, chip_file: str, sl_file: str, log_file: str) -> None:
+    def __init__(self, chip_file: str, sl_file: str, log_file: str, summary_only: bool = True,
+                 drop_disabled_logs: bool = False) -> None:
         self.chip_file = chip_file
         self.sl_file = sl_file
         self.log_file = log_file
-        self.chip_data = self.load_json(self.chip_file)
-        self.sl_data = self.load_json(self.sl_file)
+        self._chip_data: Optional[Dict[str, Any]] = None
+        self._sl_data: Optional[Dict[str, Any]] = None
         self.die_objects = {}
         self.die2die = Component(None, D2D)
-        self.host_interface = self.load_host_interface()
+
+        # The topology, the enabled clusters and the host interface are restored from the cache
+        # when the json files did not change, the json is then parsed only when a quad is built
+        try:
+            self.cache_key = get_content_key(self.chip_file, self.sl_file)
+        except OSError:
+            self.cache_key = None  # load_json reports the missing file
+        self.cache_dir = get_cache_dir(self.chip_file)
+        self.cached_state = load_topology_cache(self.cache_key, self.cache_dir) if self.cache_key else None
+        if self.cached_state is not None:
+            # Flat table of the die area, routes the logs by address while the quads and clusters are loaded lazily
+            self.topology = Topology.from_state(self.cached_state[TOPOLOGY])
+            self.die_ids = self.cached_state[DIE_IDS]
+            self.host_interface = HostInterface(self.cached_state[HOST_INTERFACE])
+        else:
+            dies_data = self.chip_data.get(TOP, {}).get(DIES, [])
+            dimensions = ChipDimensions.from_chip_data(dies_data, self.chip_data.get(TOP, {}).get(DIMENSIONS))
+            self.topology = Topology(dies_data, dimensions)
+            self.die_ids = [die_data.get(ID, None) for die_data in dies_data]
+            self.host_interface = self.load_host_interface()
+        self.dimensions = self.topology.dimensions  # The chips and dies, and the quad and cluster grids of a die
+        self.enabled_mask = EnabledMask(self.dimensions)  # Filled by enable_widgets
+        self.drop_disabled_logs = drop_disabled_logs  # Logs of the disabled clusters are neither counted nor kept
         self.filter_factory = filter_factory_module.FilterFactory(LOGS_CSV)
+        # A module built before the byte counters were bound reports only the logs, the progress bar stays busy
+        self.reports_bytes = hasattr(self.filter_factory, 'get_bytes_read') and \
+            hasattr(self.filter_factory, 'get_bytes_to_read')
+        self.reports_metrics = hasattr(self.filter_factory, 'get_metrics')  # Bound with the counters of the chain
         self.logs_factory = logs_factory.LogsFactory(LOGS_CSV)
+        self.summary_only = summary_only  # Link only the per-node summaries, the logs are loaded on demand
+        self.logs_loaded = False
+        self.time_index: Optional[TimeIndex] = None  # Built by build_time_index, on a worker
+        self.time_window: Optional[Tuple[int, int]] = None  # The window of the main view, None for the whole file
+        self.unit_clusters: Dict[Component, int] = {}  # The cluster node of every unit of a loaded cluster
+        self.activity_pyramid: Optional[TimePyramid] = None  # Counts by time bucket, built with the time index
+        self.log_columns: Optional[LogColumns] = None  # Time, leaf and TID of every log, built with the time index
+        self.activity_cubes: Dict[int, ActivityCube] = {}  # By their bucket width
+        self.active_filters: List[Tuple[str, Any]] = []  # The filters of the chain, in the order they were added
+        self.prefetcher = WindowPrefetcher(LOGS_CSV, self.is_log_kept)  # The time around the time window
+        self.progress_reporter: Optional[ProgressReporter] = None  # Set by the GUI around a pass on its worker
+        # Held by every pass over the filter chain, the GUI runs them on more than one worker
+        self.pass_lock = threading.RLock()
+
+    @property
+    def chip_data(self) -> Dict[str, Any]:
+        if self._chip_data is None:
+            self._chip_data = self.load_json(self.chip_file)
+        return self._chip_data
+
+    @property
+    def sl_data(self) -> Dict[str, Any]:
+        if self._sl_data is None:
+            self._sl_data = self.load_json(self.sl_file)
+        return self._sl_data
 
     def load_json(self, filename: str) -> Dict[str, Any]:
         """
@@ -49,19 +122,20 @@ class DataManager:
         Load a die object by index
         """
         # Validate the die_index
-        dies_data = self.chip_data.get(TOP)
-        if dies_data is None or DIES not in dies_data or die_index >= len(dies_data[DIES]):
+        if die_index >= self.topology.num_dies:
             raise KeyError(WarningMessages.INVALID_DATA.value.format(component=DIE, data=die_index))
 
         # Retrieve or create the die object
         if die_index not in self.die_objects:
-            die_data = dies_data[DIES][die_index]
-
-            # Create a new Die object
-            self.die_objects[die_index] = Die(die_data.get(ID, None), die_data)
+            # Create a new Die object, its json is read once its quads are needed
+            self.die_objects[die_index] = Die(self.die_ids[die_index],
+                                              lambda: self.chip_data[TOP][DIES][die_index],
+                                              lambda address, node: self.on_node_loaded((die_index, *address), node),
+                                              self.dimensions.quads_per_side, self.dimensions.clusters_per_side)
+            self.topology.register(self.topology.get_die_node(die_index), self.die_objects[die_index])
 
             # Check if all dies are loaded, and if so, enable widgets and link logs
-            if len(self.die_objects) == NUM_DIES:
+            if len(self.die_objects) == self.topology.num_dies:
                 self.enable_widgets()
                 self.link_the_logs_to_leaf_objects()
 
@@ -89,156 +163,417 @@ class DataManager:
 
         return self.host_interface
 
+    @traced(collect=True)
     def link_the_logs_to_leaf_objects(self) -> None:
         """
-        Link logs to the corresponding leaf objects
+        Link logs to the corresponding leaf objects.
+        In summary only mode just the per-node counts and TIDs are collected,
+        the logs themselves are linked later by ensure_logs_loaded.
         """
+        self.logs_loaded = not self.summary_only
+        reporter = self.progress_reporter
+        if reporter is not None:
+            reporter.start(self.topology.get_dominant_tids())
         try:
-            self.filter_factory.start_logs()
+            with trace_span("FilterFactory.start_logs"):
+                self.filter_factory.start_logs()
+            matched = polls = 0
             while not self.filter_factory.is_finished_process() or self.filter_factory.has_log():
                 if self.filter_factory.has_log():
                     log = self.filter_factory.get_log()
-                    print(
-                        f"{TIMESTAMP}:{log.timeStamp},{CLUSTER_ID}:{CHIP}:{log.clusterId.chip},{DIE}:{log.clusterId.die},{QUAD}{log.clusterId.quad},{ROW}:{log.clusterId.row},{COL}:{log.clusterId.col},{AREA}:{log.area},{UNIT}:{log.unit},{IO}:{log.io},{TID}:{log.tid},{PACKET}:{log.packet}")
-                    self.link_the_log_to_leaf_object(log)
+                    self.link_the_log_to_leaf_object(log, keep_log=self.logs_loaded)
+                    matched += 1
+                polls += 1
+                if reporter is not None and polls % POLLS_PER_CHECK == 0 and reporter.is_due():
+                    self.report_progress(reporter, matched)
+            if reporter is not None:
+                # The last report completes the activity shown before the rollup restyles the nodes that changed
+                self.report_progress(reporter, matched)
+            trace_instant("FilterFactory metrics", self.get_filter_metrics)
+            self.topology.rollup()
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
         finally:
             self.filter_factory.join_thread()
 
-    def link_the_log_to_leaf_object(self, log) -> None:
+    def get_filter_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the counters of the last pass of the filter chain - lines read and parsed, parse failures,
+        the logs every filter passed and rejected, in the order they were added, and the high-water mark
+        of the queue of filtered logs. Empty when the module was built without the counters.
+        """
+        if not self.reports_metrics:
+            return {}
+        metrics = self.filter_factory.get_metrics()
+        values = {name: getattr(metrics, name) for name in FILTER_METRICS}
+        values[STAGES] = [{FILTER: stage.filter, PASSED: stage.passed, REJECTED: stage.rejected}
+                          for stage in metrics.stages]
+        return values
+
+    def report_progress(self, reporter: ProgressReporter, matched: int, from_chain: bool = True) -> None:
+        """
+        Reports the bytes of the time window read, the logs linked and the dominant TIDs of the nodes so far.
+        The bytes are 0 when the logs are not read by the filter chain or the module does not count them,
+        the size of the window is then unknown.
+        """
+        if from_chain and self.reports_bytes:
+            bytes_read, bytes_to_read = self.filter_factory.get_bytes_read(), self.filter_factory.get_bytes_to_read()
+        else:
+            bytes_read = bytes_to_read = 0
+        reporter.report(bytes_read, bytes_to_read, matched, self.topology.get_partial_tids())
+
+    @traced_total()
+    def link_the_log_to_leaf_object(self, log, keep_log: bool = True, summarize: bool = True) -> None:
+        """
+        Link a single log to the corresponding leaf object and count it in the summary of every node on its path
+        """
+        area = AREAS.get(log.area)
+        if self.is_die_area(area, log.clusterId):
+            self._link_die_area_log(log, area, keep_log, summarize)
+            return
+        path = self.resolve_leaf_path(log)
+        if not path:
+            return
+        if summarize:
+            for node in path:
+                node.summary.add(log.tid)
+        if keep_log:
+            path[-1].active_logs.append(log)
+
+    @traced_total()
+    def _link_die_area_log(self, log, area: str, keep_log: bool, summarize: bool) -> None:
+        """
+        Link a log of the die area to its node in the topology table,
+        a log of a cluster that was not loaded yet waits in the table
+        """
+        cluster_id = log.clusterId
+        die = self.get_die_index(cluster_id)
+        if area == HBM:
+            node = self.topology.get_hbm_node(die, cluster_id.quad)
+        else:
+            node = self.topology.get_cluster_node(die, cluster_id.quad, cluster_id.row, cluster_id.col)
+        if node == NO_NODE or (self.drop_disabled_logs and not self.is_log_enabled(log)):
+            return
+
+        # The hbm itself is the leaf, the units of a cluster are found once the cluster is loaded
+        loaded = self.topology.loaded[node]
+        inner_path = []
+        if loaded is not None and area != HBM:
+            inner_path = self._find_cluster_path(loaded, area, log.unit)
+        if summarize:
+            self.topology.add(node, log.tid)
+            if loaded is None and area != HBM:
+                self.topology.add_pending_unit(node, area, log.unit, log.tid)
+            for inner_node in inner_path:
+                inner_node.summary.add(log.tid)
+        if keep_log:
+            if loaded is None:
+                self.topology.add_pending_log(node, log)
+            elif area == HBM:
+                loaded.active_logs.append(log)
+            elif inner_path:
+                inner_path[-1].active_logs.append(log)
+
+    def on_node_loaded(self, address: Tuple[int, ...], node: Component) -> None:
+        """
+        Connects a quad or a cluster that was just built to its node in the topology table,
+        and passes it the activity and logs that waited for it.
+        """
+        if isinstance(node, Quad):
+            self.topology.register(self.topology.get_quad_node(*address), node)
+            hbm_node = self.topology.get_hbm_node(*address)
+            self.topology.register(hbm_node, node.hbm)
+            node.hbm.active_logs.extend(self.topology.pop_pending(hbm_node)[1])
+            node.is_enable = self.enabled_mask.is_quad_enabled(*address)
+        elif isinstance(node, Cluster):
+            cluster_node = self.topology.get_cluster_node(*address)
+            self.topology.register(cluster_node, node)
+            for unit in node.get_all_inner_details():
+                self.unit_clusters[unit] = cluster_node
+            node.is_enable = self.enabled_mask.is_enabled(*address)
+            pending_units, pending_logs = self.topology.pop_pending(cluster_node)
+            for (area, unit, tid), count in pending_units.items():
+                for inner_node in self._find_cluster_path(node, area, unit):
+                    inner_node.summary.add(tid, count)
+            for log in pending_logs:
+                inner_path = self._find_cluster_path(node, AREAS.get(log.area), log.unit)
+                if inner_path:
+                    inner_path[-1].active_logs.append(log)
+
+    @traced(collect=True)
+    def ensure_logs_loaded(self, is_interrupted: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Links the full logs of the current filters to the leaf objects, if only the summaries were collected.
+        Called on drill-down, when the logs themselves are needed. Waits for a pass that runs on another worker,
+        so the logs are linked once. Returns whether the logs are loaded - when is_interrupted returns True
+        the pass stops and the logs linked until then are dropped, they are all linked again by the next call.
+        """
+        with self.pass_lock:
+            if self.logs_loaded:
+                return True
+            interrupted = False
+            try:
+                with trace_span("FilterFactory.start_logs"):
+                    self.filter_factory.start_logs()
+                polls = 0
+                while not self.filter_factory.is_finished_process() or self.filter_factory.has_log():
+                    if self.filter_factory.has_log():
+                        self.link_the_log_to_leaf_object(self.filter_factory.get_log(), summarize=False)
+                    polls += 1
+                    if is_interrupted is not None and polls % POLLS_PER_CHECK == 0 and is_interrupted():
+                        interrupted = True
+                        break
+            except ValueError as e:
+                raise ValueError(ErrorMessages.ERROR_OCCURRED.value.format(error=str(e)))
+            finally:
+                self.filter_factory.join_thread()
+            if interrupted:
+                self.drop_linked_logs()
+                return False
+            self.logs_loaded = True
+            return True
+
+    def drop_linked_logs(self) -> None:
         """
-        Link a single log to the corresponding leaf object
+        Removes the logs linked to the objects and the logs that wait for them, the summaries are kept
+        """
+        for node in self.get_all_nodes():
+            node.clear_logs()
+        self.topology.drop_pending_logs()
+
+    def resolve_leaf_object(self, log) -> Optional[Component]:
+        """
+        Returns the leaf object a single log belongs to, or None if no leaf matches its unit
+        """
+        path = self.resolve_leaf_path(log)
+        return path[-1] if path else None
+
+    @traced_total()
+    def resolve_leaf_path(self, log) -> List[Component]:
+        """
+        Returns the nodes a single log passes through, from the outer layer down to its leaf,
+        or an empty list if no leaf matches its unit. The quad and cluster of the log are loaded if needed.
         """
         area = AREAS.get(log.area)
+        cluster_id = log.clusterId
+        if self.is_die_area(area, cluster_id):
+            return self._find_die_area_path(area, log.unit, cluster_id)
         # Separation sign between a unit and its number - ;
         sep_sign = ";"
         unit = list(log.unit.split(sep_sign))
-        cluster_id = log.clusterId
         if (area == BMT and cluster_id.row == -1) or area == PCIE:
-            self._add_log_to_host_interface(area, log)
+            return [self.host_interface, getattr(self.host_interface, area)]
         elif area == HOST_INTERFACE:
-            self._add_log_to_host_interface_unit(unit, log)
-        elif area == D2D:
-            self.die2die.active_logs.append(log)
+            leaf = self._find_unit_in_details(self.host_interface.get_all_inner_details(), unit, EQ)
+            if leaf is None:
+                return []
+            for inner_obj in (self.host_interface.h2g, self.host_interface.g2h):
+                if any(detail is leaf for detail in inner_obj.get_details()):
+                    return [self.host_interface, inner_obj, leaf]
+            return [self.host_interface, leaf]
         else:
-            self._add_log_to_die_area(area, unit, cluster_id, log)
+            return [self.die2die]
 
-    def _add_log_to_host_interface(self, area, log) -> None:
+    def is_die_area(self, area: str, cluster_id) -> bool:
         """
-        Add log to the host interface
+        Returns whether logs of the area belong to a quad of a die
         """
-        getattr(self.host_interface, area).active_logs.append(log)
+        return not ((area == BMT and cluster_id.row == -1) or area in (PCIE, HOST_INTERFACE, D2D))
 
-    def _add_log_to_host_interface_unit(self, unit, log) -> None:
+    def _find_die_area_path(self, area, unit: str, cluster_id) -> List[Component]:
         """
-        Add log to a specific unit of the host interface
+        Find the path to the leaf of the die area
         """
-        eq_count = 0
-        for detail in self.host_interface.get_all_inner_details():
-            if detail.type_name != unit[0]: continue
-            if detail.type_name == EQ:
-                eq_count += 1
-                num_of_unit = int(unit[1])
-                if num_of_unit != eq_count: continue
-            detail.active_logs.append(log)
-            break
+        die = self.die_objects.get(self.get_die_index(cluster_id))
+        quad = die.get_quad(cluster_id.quad) if die is not None else None
+        if quad is None:
+            return []
+        if area == HBM:
+            # The hbm is shown by the quad widget on its own, it is not a part of the die activity
+            return [quad.hbm]
+        if not self.dimensions.is_valid(0, 0, cluster_id.row, cluster_id.col):
+            return []
+        cluster = quad.get_cluster(cluster_id.row, cluster_id.col)
+        inner_path = self._find_cluster_path(cluster, area, unit) if cluster is not None else []
+        return [die, quad, cluster, *inner_path] if inner_path else []
 
-    def _add_log_to_die_area(self, area, unit, cluster_id, log) -> None:
+    def get_die_index(self, cluster_id) -> int:
         """
-        Add log to the die area
+        Returns the index of the die of a log's cluster id - by its chip and die - or NO_DIE
         """
-        die = self.die_objects[cluster_id.die]
-        quad = die.quads[cluster_id.quad // NUM_QUADS_PER_SIDE][cluster_id.quad % NUM_QUADS_PER_SIDE]
-        if area == HBM:
-            quad.hbm.active_logs.append(log)
-        else:
-            self._add_log_to_cluster(area, unit, quad, cluster_id, log)
+        return self.dimensions.get_die_index(cluster_id.chip, cluster_id.die)
 
-    def _add_log_to_cluster(self, area, unit, quad, cluster_id, log) -> None:
+    @traced_total()
+    def _find_cluster_path(self, cluster: Cluster, area: str, unit: str) -> List[Component]:
         """
-        Add log to a specific cluster
+        Find the path inside the cluster to the leaf of the unit
         """
-        cluster = quad.clusters[cluster_id.row][cluster_id.col]
+        # Separation sign between a unit and its number - ;
+        unit = list(unit.split(";"))
         if area == MCU:
-            self._add_log_to_mcu(unit, cluster, log)
-        else:
-            self._add_log_to_ecore_or_other(unit, cluster, log)
+            leaf = self._find_unit_in_details(cluster.mcu.get_details(), unit, EQ)
+            return [cluster.mcu, leaf] if leaf is not None else []
+        leaf = self._find_unit_in_details(cluster.get_details(), unit, ECORE)
+        return [leaf] if leaf is not None else []
 
-    def _add_log_to_mcu(self, unit, cluster, log) -> None:
+    def _find_unit_in_details(self, details: List[Component], unit: List[str],
+                              numbered_type: str) -> Optional[Component]:
         """
-        Add log to the MCU
+        Find the detail matching the unit, the numbered type is selected by the unit number
         """
-        eq_count = 0
-        for detail in cluster.mcu.get_details():
+        count = 0
+        for detail in details:
             if detail.type_name != unit[0]: continue
-            if detail.type_name == EQ:
-                eq_count += 1
+            if detail.type_name == numbered_type:
+                count += 1
                 num_of_unit = int(unit[1])
-                if num_of_unit != eq_count: continue
-            detail.active_logs.append(log)
-            break
+                if num_of_unit != count: continue
+            return detail
+        return None
 
-    def _add_log_to_ecore_or_other(self, unit, cluster, log) -> None:
+    def enable_widgets(self) -> None:
         """
-        Add log to ECORE or other types
+        Enables the widgets by sl json file.
         """
-        ecore_count = 0
-        for detail in cluster.get_details():
-            if detail.type_name != unit[0]: continue
-            if detail.type_name == ECORE:
-                ecore_count += 1
-                num_of_unit = int(unit[1])
-                if num_of_unit != ecore_count: continue
-            detail.active_logs.append(log)
-            break
+        if self.cached_state is not None:
+            self.apply_enabled_mask(EnabledMask(self.dimensions, self.cached_state[ENABLED_CLUSTERS]))
+            self.enable_die()
+            return
 
-    def enable_widgets(self) -> None:
+        self.apply_enabled_mask(self.compile_enabled_mask(self.sl_data))
+        self.enable_die()
+        if self.cache_key:
+            self.save_cache()
+
+    def compile_enabled_mask(self, sl_data: Dict[str, Any]) -> EnabledMask:
         """
-        Enables the widgets by sl json file.
+        Returns the mask of the enabled clusters listed in the sl json data.
         """
-        enabled_clusters = self.sl_data.get(ENABLED_CLUSTERS, [])
+        enabled_clusters = sl_data.get(ENABLED_CLUSTERS, [])
         if not enabled_clusters:
             raise KeyError(WarningMessages.WARNING.value,
-                           WarningMessages.INVALID_DATA.value.format(component=ENABLED_CLUSTERS, data=self.sl_data))
+                           WarningMessages.INVALID_DATA.value.format(component=ENABLED_CLUSTERS, data=sl_data))
 
+        mask = EnabledMask(self.dimensions)
         for id in enabled_clusters:
             if ID not in id:
                 raise KeyError(WarningMessages.WARNING.value,
                                WarningMessages.INVALID_DATA.value.format(component=ID, data=enabled_clusters))
-            self.enable_widget_by_id(id[ID])
+            mask.enable(*self.get_cluster_address(id[ID]))
+        return mask
+
+    def apply_enabled_mask(self, mask: EnabledMask) -> List[Tuple[int, ...]]:
+        """
+        Makes the mask the enabled clusters of the chip and updates the loaded objects it changes.
+        Returns the addresses of the dies, quads and clusters whose is_enable changed.
+        """
+        previous, self.enabled_mask = self.enabled_mask, mask
+        changed_clusters = previous.diff(mask)
+        changed_quads = [address for address in sorted({address[:2] for address in changed_clusters})
+                         if previous.is_quad_enabled(*address) != mask.is_quad_enabled(*address)]
+        changed_dies = [(die,) for die in sorted({die for die, _ in changed_quads})
+                        if previous.is_die_enabled(die) != mask.is_die_enabled(die)]
+
+        for address in changed_clusters:
+            cluster = self.topology.loaded[self.topology.get_cluster_node(*address)]
+            if cluster is not None:
+                cluster.is_enable = mask.is_enabled(*address)
+        for address in changed_quads:
+            quad = self.topology.loaded[self.topology.get_quad_node(*address)]
+            if quad is not None:
+                quad.is_enable = mask.is_quad_enabled(*address)
+        for (die_index,) in changed_dies:
+            if die_index in self.die_objects:
+                self.die_objects[die_index].is_enable = mask.is_die_enabled(die_index)
+        return [*changed_dies, *changed_quads, *changed_clusters]
+
+    def reload_sl(self, sl_file: Optional[str] = None) -> List[Tuple[int, ...]]:
+        """
+        Reloads the sl json file at runtime and applies its enabled clusters.
+        The logs and the summaries are kept, only is_enable of the changed clusters, quads and dies is updated.
+        With drop_disabled_logs the linked logs depend on the enabled clusters, so they are linked again.
+        Returns the addresses of the dies, quads and clusters whose is_enable changed.
+        """
+        sl_file = sl_file or self.sl_file
+        sl_data = self.load_json(sl_file)
+        # An invalid file raises here, before anything is changed
+        mask = self.compile_enabled_mask(sl_data)
+        self.sl_file, self._sl_data = sl_file, sl_data
+        changed = self.apply_enabled_mask(mask)
+        if changed and self.drop_disabled_logs:
+            self.prefetcher.clear()
+            # The time index counts only the logs of the enabled clusters, the GUI builds it again on a worker
+            self.reset_time_index()
+            self.refresh_logs()
+        # The widgets of the dies, quads and clusters whose is_enable changed are drawn again
+        if changed:
+            self.topology.mark_changed([self.topology.get_address_node(address) for address in changed])
+        return changed
 
-        self.enable_die()
+    def save_cache(self) -> None:
+        """
+        Saves the topology, the enabled clusters and the host interface data to the cache of the json files.
+        """
+        host_interface_data = self.chip_data[TOP][HOST_INTERFACE]
+        save_topology_cache(self.cache_key, {
+            TOPOLOGY: self.topology.get_state(),
+            DIE_IDS: self.die_ids,
+            HOST_INTERFACE: {G2H: host_interface_data.get(G2H, {})},
+            ENABLED_CLUSTERS: self.enabled_mask.to_bytes(),
+        }, self.cache_dir)
 
-    def enable_widget_by_id(self, id: Dict[str, int]) -> None:
+    def get_cluster_address(self, id: Dict[str, int]) -> Tuple[int, int, int, int]:
         """
-        Enables a specific widget identified by its ID.
+        Returns the (die, quad, row, col) address of a cluster ID of the sl json file, the die is given by its
+        did and the chip, which is 0 if it's missing.
         """
         try:
             col, did, quad, row = id[COL], id[DID], id[QUAD], id[ROW]
         except KeyError as e:
             raise KeyError(WarningMessages.WARNING.value,
                            WarningMessages.WARNING_MISSING_DATA.value.format(component=ID))
-        if did not in self.die_objects:
+        die_index = self.dimensions.get_die_index(id.get(CHIP, 0), did)
+        if die_index == NO_DIE:
             raise IndexError(ErrorMessages.ERROR.value,
-                             ErrorMessages.INDEX_OUT_OF_RANGE.value.format(index=str(did), object=self.die_objects))
-        try:
-            current_quad = self.die_objects[did].quads[quad // NUM_QUADS_PER_SIDE][quad % NUM_QUADS_PER_SIDE]
-        except IndexError:
+                             ErrorMessages.INDEX_OUT_OF_RANGE.value.format(index=str(did), object=DIES))
+        if self.topology.get_quad_node(die_index, quad) == NO_NODE:
             raise IndexError(ErrorMessages.ERROR.value,
                              ErrorMessages.INDEX_OUT_OF_RANGE.value.format(index=str(quad), object=DIE))
-        if row >= len(current_quad.clusters) or col >= len(current_quad.clusters[row]):
+        # A position of the quad without a cluster cannot be enabled either
+        if self.topology.get_cluster_node(die_index, quad, row, col) == NO_NODE:
             raise IndexError(ErrorMessages.ERROR.value,
                              ErrorMessages.INDEX_OUT_OF_RANGE.value.format(index=f"{row},{col}", object=CLUSTER))
-        current_quad.clusters[row][col].is_enable = True
-        current_quad.is_enable = True
+        return die_index, quad, row, col
+
+    def enable_widget_by_id(self, id: Dict[str, int]) -> None:
+        """
+        Enables a specific widget identified by its ID.
+        """
+        did, quad, row, col = self.get_cluster_address(id)
+        # The clusters are enabled in the mask, the quad and cluster objects already loaded are updated here
+        self.enabled_mask.enable(did, quad, row, col)
+        for node in (self.topology.get_quad_node(did, quad), self.topology.get_cluster_node(did, quad, row, col)):
+            if node != NO_NODE and self.topology.loaded[node] is not None:
+                self.topology.loaded[node].is_enable = True
 
     def enable_die(self) -> None:
         """
         Enables the die based on its quadrants.
         """
-        for die in self.die_objects.values():
-            die.is_enable = any(quad and quad.is_enable for row in die.quads for quad in row)
+        for die_index, die in self.die_objects.items():
+            die.is_enable = self.enabled_mask.is_die_enabled(die_index)
+
+    def is_log_enabled(self, log) -> bool:
+        """
+        Returns whether a log belongs to an enabled cluster. Logs outside the clusters - the host interface,
+        the die2die and the hbms - are always enabled. Used as a predicate before a log is routed.
+        """
+        area = AREAS.get(log.area)
+        if area == HBM or not self.is_die_area(area, log.clusterId):
+            return True
+        cluster_id = log.clusterId
+        return self.enabled_mask.is_enabled(self.get_die_index(cluster_id), cluster_id.quad, cluster_id.row,
+                                            cluster_id.col)
 
     def get_start_time(self) -> datetime.datetime:
         """
@@ -274,6 +609,10 @@ class DataManager:
                 else:
                     print(filter_type, values)
                     self.filter_factory.update_filter_in_chain((filter_type, values))
+                self.prefetcher.cancel()
+                self.active_filters = [(active_type, active_values) for active_type, active_values in
+                                       self.active_filters if active_type != filter_type]
+                self.active_filters.append((filter_type, values))
 
                 self.clean_the_prev_logs_from_leaf_objects()
                 self.link_the_logs_to_leaf_objects()
@@ -294,6 +633,8 @@ class DataManager:
                     self.filter_factory.add_filter_to_chain((filter_type, cluster))
                 else:
                     self.filter_factory.add_filter_to_chain((filter_type, values))
+                self.prefetcher.cancel()
+                self.active_filters.append((filter_type, values))
                 self.clean_the_prev_logs_from_leaf_objects()
                 self.link_the_logs_to_leaf_objects()
             except ValueError as e:
@@ -302,24 +643,30 @@ class DataManager:
             raise ValueError(WarningMessages.WARNING.value,
                              WarningMessages.UNKNOWN_FILTER.value.format(filter_type=filter_type))
 
+    @traced()
     def clean_the_prev_logs_from_leaf_objects(self) -> None:
         """
-        Cleans the previous logs from all leaf objects before connecting new logs.
+        Cleans the previous logs and summaries from all objects before connecting new logs.
         """
-        # Clean logs from each leaf in the inner layers of die objects
-        for die in self.die_objects.values():
-            for quad in (quad for row in die.quads for quad in row if quad):
-                quad.hbm.active_logs = []
-                for cluster in (cluster for row in quad.clusters for cluster in row):
-                    for detail in cluster.get_all_inner_details():
-                        detail.active_logs = []
+        for node in self.get_all_nodes():
+            node.clear_activity()
+        self.topology.reset()
+        self.logs_loaded = False
 
-        # Clean logs from host interface
-        for detail in self.host_interface.get_all_inner_details():
-            detail.active_logs = []
-
-        # Clean die2die logs
-        self.die2die.active_logs = []
+    def get_all_nodes(self) -> List[Component]:
+        """
+        Returns every loaded object of the chip that logs or summaries are linked to.
+        """
+        nodes = [self.die2die, self.host_interface, self.host_interface.h2g, self.host_interface.g2h]
+        nodes.extend(self.host_interface.get_all_inner_details())
+        for die in self.die_objects.values():
+            nodes.append(die)
+            for quad in die.get_loaded_quads():
+                nodes.extend((quad, quad.hbm))
+                for cluster in quad.get_loaded_clusters():
+                    nodes.append(cluster)
+                    nodes.extend(cluster.get_all_inner_details())
+        return nodes
 
     def refresh_logs(self):
         """
@@ -331,13 +678,47 @@ class DataManager:
     def change_time(self, start_time: datetime.datetime, end_time: datetime.datetime) -> None:
         """
         Changes the start and end time for log filtering.
+        A window in a prefetched span is linked from memory, then the span around the window is prefetched.
         """
+        self.prefetcher.cancel()
         try:
             self.filter_factory.set_start_time(start_time)
             self.filter_factory.set_end_time(end_time)
-            self.refresh_logs()
+            self.time_window = (start_time, end_time)
+            logs = self.prefetcher.get((start_time, end_time), self.active_filters)
+            if logs is None:
+                self.refresh_logs()
+            else:
+                self.link_prefetched_logs(logs)
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
+        self.prefetcher.prefetch(get_prefetch_span((start_time, end_time)), self.active_filters)
+
+    @traced(collect=True)
+    def link_prefetched_logs(self, logs: List[Any]) -> None:
+        """
+        Links the logs of a prefetched window instead of the logs read by the filter chain,
+        their progress is reported like the progress of a pass over the file
+        """
+        self.clean_the_prev_logs_from_leaf_objects()
+        self.logs_loaded = not self.summary_only
+        reporter = self.progress_reporter
+        if reporter is not None:
+            reporter.start(self.topology.get_dominant_tids())
+        trace_instant("WindowPrefetcher hit", lambda: {'logs': len(logs)})
+        for matched, log in enumerate(logs, 1):
+            self.link_the_log_to_leaf_object(log, keep_log=self.logs_loaded)
+            if reporter is not None and matched % POLLS_PER_CHECK == 0 and reporter.is_due():
+                self.report_progress(reporter, matched, from_chain=False)
+        if reporter is not None:
+            self.report_progress(reporter, len(logs), from_chain=False)
+        self.topology.rollup()
+
+    def is_log_kept(self, log) -> bool:
+        """
+        Returns whether a log is linked at all - with drop_disabled_logs the logs of disabled clusters are not
+        """
+        return not self.drop_disabled_logs or self.is_log_enabled(log)
 
     def clear_all_filters(self) -> None:
         """
@@ -345,6 +726,8 @@ class DataManager:
         """
         try:
             self.filter_factory.clear_filters()
+            self.prefetcher.cancel()
+            self.active_filters = []
             self.refresh_logs()
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
@@ -355,6 +738,200 @@ class DataManager:
         """
         try:
             self.filter_factory.remove_filter(filter_type)
+            self.prefetcher.cancel()
+            self.active_filters = [(active_type, values) for active_type, values in self.active_filters
+                                   if active_type != filter_type]
             self.refresh_logs()
         except ValueError as e:
             raise ValueError(ErrorMessages.ERROR_OCCURRED.value.fomramt(error=str(e)))
+
+    def evaluate_filter_specs(self, specs: Sequence[FilterSpec], counts_only: bool = False,
+                              start_time: Optional[int] = None, end_time: Optional[int] = None) -> List[Any]:
+        """
+        Evaluates many filter configurations in a single pass over the log file.
+        Returns, per configuration, the list of matching logs or, with counts_only,
+        a dict of leaf object -> number of matching logs.
+        The filter chain of the main view is left untouched.
+        """
+        scan = MultiQueryScan(specs, counts_only)
+        scan_factory = filter_factory_module.FilterFactory(LOGS_CSV)
+        try:
+            if start_time is not None:
+                scan_factory.set_start_time(start_time)
+            if end_time is not None:
+                scan_factory.set_end_time(end_time)
+            scan_factory.start_logs()
+            while not scan_factory.is_finished_process() or scan_factory.has_log():
+                if scan_factory.has_log():
+                    log = scan_factory.get_log()
+                    if self.is_log_kept(log):
+                        scan.feed(log, self.resolve_leaf_object)
+        except ValueError as e:
+            raise ValueError(ErrorMessages.ERROR_OCCURRED.value.format(error=str(e)))
+        finally:
+            scan_factory.join_thread()
+        return scan.results
+
+    def build_time_index(self) -> TimeIndex:
+        """
+        Builds the time index of the whole log file in a single pass, without the filters of the main view.
+        A log is indexed in every node of its path - its cluster, quad and die, or the hbm on its own,
+        and in the objects of the host interface or the die2die, and in its TID and ALL_LOGS.
+        The columns of the activity cubes are collected in the same pass, and the activity pyramid is built
+        from the index. It is a pass over the file, the GUI runs it on a worker, under the lock of the passes.
+        """
+        with self.pass_lock:
+            self.reset_time_index()
+            time_index = TimeIndex()
+            log_columns = LogColumns()
+            scan_factory = filter_factory_module.FilterFactory(LOGS_CSV)
+            position = 0
+            try:
+                scan_factory.start_logs()
+                while not scan_factory.is_finished_process() or scan_factory.has_log():
+                    if not scan_factory.has_log():
+                        continue
+                    log = scan_factory.get_log()
+                    if self.is_log_kept(log):
+                        path = self.get_index_path(log)
+                        for node in path:
+                            time_index.add(node, log.timeStamp, position)
+                        if path:
+                            log_columns.add(log.timeStamp, path[0], log.tid)
+                        time_index.add(tid_key(log.tid), log.timeStamp, position)
+                        time_index.add(ALL_LOGS, log.timeStamp, position)
+                    position += 1
+            except ValueError as e:
+                raise ValueError(ErrorMessages.ERROR_OCCURRED.value.format(error=str(e)))
+            finally:
+                scan_factory.join_thread()
+            time_index.build(position)
+            self.activity_pyramid = TimePyramid(time_index)
+            self.log_columns = log_columns
+            self.time_index = time_index
+            return time_index
+
+    def reset_time_index(self) -> None:
+        """
+        Drops the time index and everything built from it, until build_time_index builds them again
+        """
+        self.time_index = None
+        self.activity_pyramid = None
+        self.log_columns = None
+        self.activity_cubes = {}
+
+    def get_index_path(self, log) -> List[Any]:
+        """
+        Returns the nodes of the time index a log is counted in, from its leaf up
+        """
+        area = AREAS.get(log.area)
+        cluster_id = log.clusterId
+        if not self.is_die_area(area, cluster_id):
+            return self.resolve_leaf_path(log)[::-1]
+        die = self.get_die_index(cluster_id)
+        if area == HBM:
+            node = self.topology.get_hbm_node(die, cluster_id.quad)
+            return [node] if node != NO_NODE else []
+        path = []
+        node = self.topology.get_cluster_node(die, cluster_id.quad, cluster_id.row, cluster_id.col)
+        while node != NO_NODE:
+            path.append(node)
+            node = self.topology.parent[node]
+        return path
+
+    def get_generation(self, component: Component) -> int:
+        """
+        Returns the generation in which the activity of an object last changed. The objects outside the topology
+        table, like the host interface, change with every rollup.
+        """
+        summary = component.summary
+        if isinstance(summary, TopologySummary):
+            return self.topology.changed_generations[summary.node]
+        return self.topology.generation
+
+    def get_index_node(self, component: Component) -> Any:
+        """
+        Returns the node of the time index of an object - its node in the topology table, or the object itself
+        """
+        summary = component.summary
+        return summary.node if isinstance(summary, TopologySummary) else component
+
+    def get_count_node(self, component: Component) -> Tuple[Any, bool]:
+        """
+        Returns the node of the time index the logs of an object are counted in, and whether it is the node of
+        an ancestor. The index has no nodes for the units of the clusters of the die area - the mcu, ecores, EQs,
+        lnb and the rest - so a unit is counted by its cluster.
+        """
+        cluster_node = self.unit_clusters.get(component)
+        if cluster_node is not None:
+            return cluster_node, True
+        return self.get_index_node(component), False
+
+    def get_window_count(self, component: Component, start_time: Optional[int] = None,
+                         end_time: Optional[int] = None) -> int:
+        """
+        Returns the number of logs of the object from start_time to end_time, over the whole log file.
+        For a unit of a cluster it is the number of logs of its cluster, see get_count_node.
+        It is a bisection of the time index, 0 until build_time_index builds it.
+        """
+        time_index = self.time_index
+        if time_index is None:
+            return 0
+        return time_index.count(self.get_count_node(component)[0], start_time, end_time)
+
+    def get_window_slice(self, component: Component, start_time: Optional[int] = None,
+                         end_time: Optional[int] = None) -> array:
+        """
+        Returns the positions in the log file of the logs of the object from start_time to end_time, in time order.
+        For a unit of a cluster they are the logs of its cluster, see get_count_node.
+        Empty until build_time_index builds the time index.
+        """
+        time_index = self.time_index
+        if time_index is None:
+            return array('q')
+        return time_index.slice(self.get_count_node(component)[0], start_time, end_time)
+
+    def get_activity_pyramid(self) -> Optional[TimePyramid]:
+        """
+        Returns the counts of the logs by time bucket at every resolution of the timeline,
+        or None until the time index is built.
+        """
+        return self.activity_pyramid
+
+    def get_activity_cube(self, bucket_width: int) -> Optional[ActivityCube]:
+        """
+        Returns the number of logs by time bucket of the width in seconds, leaf and TID,
+        built once for every width and kept until the time index is rebuilt, or None until it is built.
+        The time buckets start with the first log, like the buckets of the activity pyramid.
+        """
+        # Read once, a worker may build the index again meanwhile - a cube of the old index is then not kept
+        cubes, log_columns, pyramid = self.activity_cubes, self.log_columns, self.activity_pyramid
+        if log_columns is None or pyramid is None:
+            return None
+        cube = cubes.get(bucket_width)
+        if cube is None:
+            cube = cubes[bucket_width] = ActivityCube(log_columns, bucket_width, pyramid.start_time)
+        return cube
+
+    def get_index_parents(self, node: Any) -> List[Any]:
+        """
+        Returns the parents of a node of the time index in the topology table, from the closest up.
+        An hbm has none, like in get_index_path.
+        """
+        parents = []
+        if isinstance(node, int) and self.topology.node_type[node] != HBM_NODE:
+            node = self.topology.parent[node]
+            while node != NO_NODE:
+                parents.append(node)
+                node = self.topology.parent[node]
+        return parents
+
+    def get_playback(self, window: int, bucket_width: int) -> Optional[Playback]:
+        """
+        Returns a playback of a window of the width in seconds, moved by a time bucket of bucket_width every frame,
+        or None until the time index is built
+        """
+        cube = self.get_activity_cube(bucket_width)
+        if cube is None:
+            return None
+        return Playback(cube, window // bucket_width, self.get_index_parents)
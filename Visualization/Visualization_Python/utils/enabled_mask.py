@@ -0,0 +1,84 @@
+from typing import Iterator, List, Optional, Tuple
+
+from utils.chip_dimensions import ChipDimensions
+
+
+class EnabledMask:
+    """
+    Bitset of the enabled clusters of the chip, one bit per (die, quad, row, col) position.
+
+    Compiled once from the enabled_clusters of sl.json. A quad is enabled when any of its clusters is,
+    and a die when any of its quads is, so both are read from the bits of their clusters.
+    The bits of a quad are contiguous, which makes the quad and die checks a scan of a few bytes.
+    """
+    __slots__ = ('dimensions', 'bits')
+
+    def __init__(self, dimensions: ChipDimensions, bits: Optional[bytes] = None) -> None:
+        self.dimensions = dimensions
+        size = (dimensions.num_cluster_positions + 7) // 8
+        self.bits = bytearray(bits) if bits is not None else bytearray(size)
+        if len(self.bits) != size:
+            raise ValueError(f"Enabled mask of {len(self.bits)} bytes does not fit {dimensions.num_dies} dies")
+
+    def enable(self, die: int, quad: int, row: int, col: int) -> None:
+        position = self.dimensions.cluster_position(die, quad, row, col)
+        self.bits[position >> 3] |= 1 << (position & 7)
+
+    def is_enabled(self, die: int, quad: int, row: int, col: int) -> bool:
+        """
+        Returns whether the cluster is enabled, a position outside the chip is not
+        """
+        if not self.dimensions.is_valid(die, quad, row, col):
+            return False
+        position = self.dimensions.cluster_position(die, quad, row, col)
+        return bool(self.bits[position >> 3] & (1 << (position & 7)))
+
+    def is_quad_enabled(self, die: int, quad: int) -> bool:
+        if not self.dimensions.is_valid(die, quad):
+            return False
+        start = self.dimensions.cluster_position(die, quad, 0, 0)
+        return self._any_bit(start, start + self.dimensions.clusters_per_quad)
+
+    def is_die_enabled(self, die: int) -> bool:
+        if not self.dimensions.is_valid(die, 0):
+            return False
+        start = self.dimensions.cluster_position(die, 0, 0, 0)
+        return self._any_bit(start, start + self.dimensions.quads_per_die * self.dimensions.clusters_per_quad)
+
+    def _any_bit(self, start: int, stop: int) -> bool:
+        # Whole bytes are checked at once, the partial bytes at the edges bit by bit
+        first_byte, last_byte = (start + 7) >> 3, stop >> 3
+        if first_byte < last_byte and any(self.bits[first_byte:last_byte]):
+            return True
+        edges = range(start, min(stop, first_byte << 3)), range(max(start, last_byte << 3), stop)
+        return any(self.bits[position >> 3] & (1 << (position & 7)) for edge in edges for position in edge)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Yields the (die, quad, row, col) address of every enabled cluster
+        """
+        for byte_index, byte in enumerate(self.bits):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield self.dimensions.get_cluster_address((byte_index << 3) + bit)
+
+    def diff(self, other: 'EnabledMask') -> List[Tuple[int, int, int, int]]:
+        """
+        Returns the addresses of the clusters that are enabled in one of the masks but not in the other
+        """
+        changed = EnabledMask(self.dimensions, bytes(a ^ b for a, b in zip(self.bits, other.bits)))
+        return list(changed)
+
+    def __len__(self) -> int:
+        return sum(bin(byte).count("1") for byte in self.bits)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, EnabledMask) and self.dimensions == other.dimensions and self.bits == other.bits
+
+    # The bits change with enable, so a mask is compared by value but cannot be a key of a dict or a set
+    __hash__ = None
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.bits)
@@ -17,4 +17,5 @@ class WarningMessages(Enum):
     WARNING_MISSING_DATA = "Missing data for component: {component}"
     INVALID_DATA = "Invalid {component} data: {data}"
     STYLE_SHEET_FILE_NOT_FOUND = "Stylesheet file '{filename}' not found."
-    UNKNOWN_FILTER = "Unknown filter: {filter_type}"
\ No newline at end of file
+    UNKNOWN_FILTER = "Unknown filter: {filter_type}"
+    CACHE_NOT_SAVED = "Failed to write the cache file '{filename}': {error}"
\ No newline at end of file
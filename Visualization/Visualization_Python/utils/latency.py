@@ -0,0 +1,154 @@
+import json
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional
+
+# Upper bounds of the buckets of a latency histogram, in milliseconds - the last bucket is everything above
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+STALL_THRESHOLD_MS = 200
+BEAT_INTERVAL_MS = 50
+EVENT_LOOP_LAG = 'event_loop_lag'
+MAX_STALLS = 100  # The stalls kept with their stacks, the histogram counts them all
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies by bucket, with their number, sum and maximum.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Returns the upper bound of the bucket the percentile falls in, the maximum for the last bucket
+        """
+        if not self.count:
+            return None
+        rank = percentile / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return float(BUCKET_BOUNDS_MS[index]) if index < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'max_ms': self.max_ms,
+            'p50_ms': self.get_percentile(50),
+            'p90_ms': self.get_percentile(90),
+            'p99_ms': self.get_percentile(99),
+            'buckets': {f'<={bound}' if index < len(BUCKET_BOUNDS_MS) else f'>{BUCKET_BOUNDS_MS[-1]}': count
+                        for index, (bound, count) in enumerate(zip(BUCKET_BOUNDS_MS + (None,), self.counts))},
+        }
+
+
+class LatencyReport:
+    """
+    The latency histograms by their name and the stalls of the event loop, saved as json for regression tracking.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.stalls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, ms: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(ms)
+
+    def add_stall(self, ms: float, stack: List[str]) -> None:
+        with self._lock:
+            if len(self.stalls) < MAX_STALLS:
+                self.stalls.append({'duration_ms': ms, 'stack': stack})
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'histograms': {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+                    'stalls': list(self.stalls)}
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+class StallWatchdog:
+    """
+    Detects the stalls of the event loop of a thread.
+
+    The thread calls beat from its event loop, on a timer. A daemon thread checks the time of the last beat,
+    and once it is older than the threshold takes the stack of the stalled thread - where it is stuck, not
+    where it was after. The next beat ends the stall and records its duration with that stack.
+    """
+
+    def __init__(self, report: LatencyReport, threshold_ms: float = STALL_THRESHOLD_MS,
+                 beat_interval_ms: float = BEAT_INTERVAL_MS, thread_id: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.report = report
+        self.threshold = threshold_ms / 1000
+        self.beat_interval = beat_interval_ms / 1000
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.clock = clock
+        self.last_beat = clock()
+        self.stack: Optional[List[str]] = None  # Taken in the current stall
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def beat(self) -> None:
+        now = self.clock()
+        with self._lock:
+            gap, stack = now - self.last_beat, self.stack
+            self.last_beat, self.stack = now, None
+        # How late the beat is, the time the loop could not run its timers
+        self.report.record(EVENT_LOOP_LAG, max(gap - self.beat_interval, 0.0) * 1000)
+        if gap >= self.threshold:
+            self.report.add_stall(gap * 1000, stack or [])
+
+    def check(self) -> None:
+        """
+        Takes the stack of the thread if it stalls and it was not taken yet
+        """
+        with self._lock:
+            if self.stack is not None or self.clock() - self.last_beat < self.threshold:
+                return
+        frame = sys._current_frames().get(self.thread_id)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        with self._lock:
+            if self.stack is None:
+                self.stack = stack
+
+    def start(self) -> None:
+        self.last_beat = self.clock()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        # Checked a few times per threshold, so the stack is taken early in the stall
+        while not self._stop_event.wait(self.threshold / 4):
+            self.check()
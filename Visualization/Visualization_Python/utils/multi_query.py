@@ -0,0 +1,124 @@
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.filter_types import FILTER_TYPES_NAMES, THREADID, CLUSTER, QUAD, AREA, UNIT, IO, TIME, TIMERANGE
+from utils.error_messages import WarningMessages
+
+# A filter configuration - the same (filter_type, values) pairs passed to DataManager.change_filter
+FilterSpec = Sequence[Tuple[str, Any]]
+
+# Extracts from a log the value that a keyed filter type compares against
+LOG_KEYS: Dict[str, Callable[[Any], Any]] = {
+    FILTER_TYPES_NAMES[THREADID]: lambda log: log.tid,
+    FILTER_TYPES_NAMES[AREA]: lambda log: log.area,
+    FILTER_TYPES_NAMES[UNIT]: lambda log: log.unit,
+    FILTER_TYPES_NAMES[IO]: lambda log: log.io,
+    FILTER_TYPES_NAMES[TIME]: lambda log: log.timeStamp,
+    FILTER_TYPES_NAMES[QUAD]: lambda log: (log.clusterId.chip, log.clusterId.die, log.clusterId.quad),
+    FILTER_TYPES_NAMES[CLUSTER]: lambda log: (log.clusterId.chip, log.clusterId.die, log.clusterId.quad,
+                                              log.clusterId.row, log.clusterId.col),
+}
+
+
+def normalize_filter_keys(filter_type: str, values: Any) -> Tuple[Any, ...]:
+    """
+    Converts filter values, in any of the shapes accepted by the filter chain,
+    to the tuple of log keys that the filter accepts.
+    """
+    if filter_type == FILTER_TYPES_NAMES[THREADID]:
+        tids = values if isinstance(values, (list, tuple, set)) else [values]
+        return tuple(sorted(int(tid) for tid in tids))
+    if filter_type == FILTER_TYPES_NAMES[CLUSTER]:
+        if hasattr(values, "chip"):
+            values = [values.chip, values.die, values.quad, values.row, values.col]
+        return (tuple(int(value) for value in values),)
+    if filter_type == FILTER_TYPES_NAMES[QUAD]:
+        return (tuple(int(value) for value in values),)
+    if filter_type == FILTER_TYPES_NAMES[TIME]:
+        return (int(values),)
+    if filter_type == FILTER_TYPES_NAMES[TIMERANGE]:
+        start_time, end_time = values
+        return int(start_time), int(end_time)
+    if filter_type in LOG_KEYS:
+        return (values,)
+    raise ValueError(WarningMessages.WARNING.value, WarningMessages.UNKNOWN_FILTER.value.format(filter_type=filter_type))
+
+
+class MultiQueryScan:
+    """
+    Evaluates many filter configurations against a single stream of logs.
+
+    Every distinct (filter type, values) predicate gets one bit. Keyed filters are
+    compiled into per-type dispatch tables (log key -> bits of the predicates it
+    satisfies), so each log costs one dictionary lookup per filter type no matter
+    how many configurations share that type. A configuration matches a log when
+    all of its predicate bits are set. Configurations with the same predicates
+    are grouped and evaluated once, and the log is routed to its leaf at most once.
+    """
+
+    def __init__(self, specs: Sequence[FilterSpec], counts_only: bool = False) -> None:
+        self.specs = [list(spec) for spec in specs]
+        self.counts_only = counts_only
+        self._predicate_bits: Dict[Tuple[str, Tuple[Any, ...]], int] = {}
+        self._keyed: Dict[str, Dict[Any, int]] = defaultdict(dict)
+        self._ranges: List[Tuple[int, int, int]] = []
+        self._spec_groups: Dict[int, List[int]] = defaultdict(list)
+        for index, spec in enumerate(self.specs):
+            self._spec_groups[self._compile_spec(spec)].append(index)
+        self.results: List[Any] = [defaultdict(int) if counts_only else [] for _ in self.specs]
+        self.matched_counts = [0] * len(self.specs)
+
+    def _compile_spec(self, spec: FilterSpec) -> int:
+        mask = 0
+        for filter_type, values in spec:
+            mask |= self._predicate_bit(filter_type, values)
+        return mask
+
+    def _predicate_bit(self, filter_type: str, values: Any) -> int:
+        keys = normalize_filter_keys(filter_type, values)
+        predicate = (filter_type, keys)
+        if predicate in self._predicate_bits:
+            return self._predicate_bits[predicate]
+
+        bit = 1 << len(self._predicate_bits)
+        self._predicate_bits[predicate] = bit
+        if filter_type == FILTER_TYPES_NAMES[TIMERANGE]:
+            self._ranges.append((keys[0], keys[1], bit))
+        else:
+            dispatch = self._keyed[filter_type]
+            for key in keys:
+                dispatch[key] = dispatch.get(key, 0) | bit
+        return bit
+
+    def log_mask(self, log) -> int:
+        """
+        Returns the bits of all predicates satisfied by the log.
+        """
+        mask = 0
+        for filter_type, dispatch in self._keyed.items():
+            mask |= dispatch.get(LOG_KEYS[filter_type](log), 0)
+        for start_time, end_time, bit in self._ranges:
+            if start_time <= log.timeStamp <= end_time:
+                mask |= bit
+        return mask
+
+    def feed(self, log, resolve_leaf: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        Adds a single log to the result of every configuration it satisfies.
+        """
+        mask = self.log_mask(log)
+        leaf = None
+        resolved = False
+        for spec_mask, indexes in self._spec_groups.items():
+            if spec_mask & mask != spec_mask:
+                continue
+            if self.counts_only and not resolved:
+                leaf = resolve_leaf(log) if resolve_leaf else None
+                resolved = True
+            for index in indexes:
+                self.matched_counts[index] += 1
+                if self.counts_only:
+                    if leaf is not None:
+                        self.results[index][leaf] += 1
+                else:
+                    self.results[index].append(log)
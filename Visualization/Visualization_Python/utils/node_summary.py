@@ -0,0 +1,49 @@
+from typing import Dict, List, Mapping, Optional
+
+
+def get_dominant_tid(tids: Mapping[int, int]) -> Optional[int]:
+    """
+    Returns the dominant TID of a node - the TID with the most logs, the lowest TID wins a tie so a node keeps
+    its color while the counts are equal - or None if it has no logs. The node is colored by it.
+    """
+    return min(tids, key=lambda tid: (-tids[tid], tid)) if tids else None
+
+
+class NodeSummary:
+    """
+    Activity summary of a single node in the chip hierarchy.
+    Holds the number of logs that passed through the node and the TIDs seen,
+    in the order they first entered the node.
+    """
+
+    __slots__ = ('count', 'tids')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.tids: Dict[int, int] = {}  # TID -> number of logs, kept in first-seen order
+
+    def add(self, tid: int, count: int = 1) -> None:
+        self.count += count
+        self.tids[tid] = self.tids.get(tid, 0) + count
+
+    def clear(self) -> None:
+        self.count = 0
+        self.tids = {}
+
+    @property
+    def has_activity(self) -> bool:
+        return self.count > 0
+
+    @property
+    def first_tid(self) -> Optional[int]:
+        return next(iter(self.tids), None)
+
+    @property
+    def dominant_tid(self) -> Optional[int]:
+        return get_dominant_tid(self.tids)
+
+    def get_tids(self) -> List[int]:
+        """
+        Returns the distinct TIDs of the node, the first one is the TID that entered it first.
+        """
+        return list(self.tids)
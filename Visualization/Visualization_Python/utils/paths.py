@@ -1,6 +1,7 @@
 # directories
 IMAGES_DIR = "images"
 STYLES_DIR = "styles"
+CACHE_DIR = ".cache"
 
 # images
 APP_ICON_IMAGE = f"{IMAGES_DIR}/app_icon.ico"
@@ -22,6 +23,7 @@ SL_JSON = "data/sl.json"
 LOGS_CSV = "data/logs.csv"
 
 # style files
+MAIN_WINDOW_CSS = "gui/styles.css"
 INFO_WIDGET_CSS = f"{STYLES_DIR}/info_styles.css"
 CLUSTER_INFO_WIDGET_CSS = f"{STYLES_DIR}/cluster_info_styles.css"
 DIALOG_FILTAR_CSS = f"{STYLES_DIR}/dialog_styles.css"
@@ -0,0 +1,105 @@
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+from utils.activity_cube import ActivityCube
+from utils.node_summary import get_dominant_tid
+
+
+class Playback:
+    """
+    A window of a fixed number of time buckets moved over the activity cube, a bucket every frame.
+
+    The number of logs of every node by TID is precomputed for each time bucket, with the leaves counted in all
+    their parents, so moving the window adds the bucket that enters it and removes the bucket that leaves it.
+    A frame touches only the nodes active in these two buckets, never the logs. The color of a node is the color
+    of its dominant TID in the window, as get_dominant_tid defines it for the summaries.
+    """
+
+    def __init__(self, cube: ActivityCube, window_buckets: int,
+                 get_parents: Callable[[Hashable], Iterable[Hashable]]) -> None:
+        self.cube = cube
+        self.window_buckets = max(1, min(window_buckets, cube.num_buckets))
+        self.num_frames = cube.num_buckets - self.window_buckets + 1
+        self.frame = 0
+        self.buckets: List[Dict[Hashable, Counter]] = [{} for _ in range(cube.num_buckets)]
+        for (bucket, leaf, tid), count in cube.cells().items():
+            leaf_key = cube.leaf_keys[leaf]
+            tid_value = cube.tid_values[tid]
+            for node in (leaf_key, *get_parents(leaf_key)):
+                tids = self.buckets[bucket].get(node)
+                if tids is None:
+                    tids = self.buckets[bucket][node] = Counter()
+                tids[tid_value] += count
+        self.nodes = {node for tids_by_node in self.buckets for node in tids_by_node}  # The nodes with logs
+        self.counts: Dict[Hashable, Counter] = defaultdict(Counter)  # The logs of each node in the window by TID
+        self.dominant_tids: Dict[Hashable, int] = {}
+        self.seek(0)
+
+    @property
+    def start_time(self) -> int:
+        return self.cube.get_bucket_start(self.frame)
+
+    @property
+    def end_time(self) -> int:
+        """
+        The last second of the window
+        """
+        return self.cube.get_bucket_start(self.frame + self.window_buckets) - 1
+
+    def seek(self, frame: int) -> Dict[Hashable, Optional[int]]:
+        """
+        Moves the window to start at the bucket of the frame, the counts are summed again.
+        Returns the dominant TID of every node whose dominant TID changed, None if it has no logs in the window.
+        """
+        frame = min(max(frame, 0), self.num_frames - 1)
+        previous = self.dominant_tids
+        self.frame = frame
+        self.counts = defaultdict(Counter)
+        for bucket in range(frame, frame + self.window_buckets):
+            for node, tids in self.buckets[bucket].items():
+                self.counts[node].update(tids)
+        self.dominant_tids = {node: get_dominant_tid(tids) for node, tids in self.counts.items()}
+        changed = {node: tid for node, tid in self.dominant_tids.items() if previous.get(node) != tid}
+        changed.update({node: None for node in previous if node not in self.dominant_tids})
+        return changed
+
+    def step(self, frames: int = 1) -> Dict[Hashable, Optional[int]]:
+        """
+        Moves the window by a number of frames, forward or back, from the deltas of the buckets.
+        Returns the dominant TID of every node whose dominant TID changed, None if it has no logs in the window.
+        """
+        if abs(frames) != 1:
+            return self.seek(self.frame + frames)
+        if not 0 <= self.frame + frames < self.num_frames:
+            return {}
+        if frames > 0:
+            entering, leaving = self.frame + self.window_buckets, self.frame
+        else:
+            entering, leaving = self.frame - 1, self.frame + self.window_buckets - 1
+        self.frame += frames
+
+        touched = set()
+        for node, tids in self.buckets[entering].items():
+            self.counts[node].update(tids)
+            touched.add(node)
+        for node, tids in self.buckets[leaving].items():
+            counts = self.counts[node]
+            counts.subtract(tids)
+            for tid in tids:
+                if counts[tid] <= 0:
+                    del counts[tid]
+            if not counts:
+                del self.counts[node]
+            touched.add(node)
+
+        changed = {}
+        for node in touched:
+            tids = self.counts.get(node)
+            tid = get_dominant_tid(tids)
+            if self.dominant_tids.get(node) != tid:
+                changed[node] = tid
+                if tid is None:
+                    del self.dominant_tids[node]
+                else:
+                    self.dominant_tids[node] = tid
+        return changed
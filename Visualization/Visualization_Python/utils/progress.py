@@ -0,0 +1,119 @@
+import time
+from typing import Callable, Dict, Optional
+
+# A pass reports its progress at most this often, the GUI is not flooded by the worker
+REPORT_INTERVAL = 0.2
+# The link loop looks at the clock once in this many polls of the filter chain
+POLLS_PER_CHECK = 1024
+
+
+class ScanProgress:
+    """
+    Progress of a pass over the time window of the log file - the bytes read of the window, the logs that
+    passed the filters and the seconds since the pass started.
+    """
+
+    __slots__ = ('bytes_read', 'bytes_total', 'matched', 'elapsed')
+
+    def __init__(self, bytes_read: int, bytes_total: int, matched: int, elapsed: float) -> None:
+        self.bytes_read = bytes_read
+        self.bytes_total = bytes_total
+        self.matched = matched
+        self.elapsed = elapsed
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """
+        The part of the window read, or None while its size is not known
+        """
+        if self.bytes_total <= 0:
+            return None
+        return min(self.bytes_read / self.bytes_total, 1.0)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        The seconds left at the rate read so far, or None before anything was read
+        """
+        fraction = self.fraction
+        if not fraction:
+            return None
+        return self.elapsed * (1 - fraction) / fraction
+
+
+class ProgressReporter:
+    """
+    Sends the progress of a pass, and the activity linked so far, at a bounded rate.
+
+    The pass calls is_due cheaply and report when it is due, from its own thread. The activity is a dict of
+    node -> dominant TID, like a playback frame, and only the nodes that changed since the previous report are
+    sent. The nodes shown before the pass start blank, so the picture forms as the logs are linked.
+    """
+
+    def __init__(self, on_progress: Callable[[ScanProgress], None],
+                 on_partial: Optional[Callable[[Dict[int, Optional[int]]], None]] = None,
+                 interval: float = REPORT_INTERVAL, clock: Callable[[], float] = time.monotonic) -> None:
+        self.on_progress = on_progress
+        self.on_partial = on_partial
+        self.interval = interval
+        self.clock = clock
+        self.started = clock()
+        self.last_report = self.started
+        self.shown: Dict[int, Optional[int]] = {}  # The TIDs sent so far
+
+    def start(self, shown: Optional[Dict[int, Optional[int]]] = None) -> None:
+        """
+        Starts a pass, shown are the TIDs of the nodes as they are drawn before it
+        """
+        self.started = self.last_report = self.clock()
+        self.shown = dict(shown or {})
+
+    def is_due(self) -> bool:
+        return self.clock() - self.last_report >= self.interval
+
+    def report(self, bytes_read: int, bytes_total: int, matched: int,
+               tids: Optional[Dict[int, int]] = None) -> None:
+        now = self.clock()
+        self.last_report = now
+        self.on_progress(ScanProgress(bytes_read, bytes_total, matched, now - self.started))
+        if tids is not None and self.on_partial is not None:
+            changed = self.get_changed(tids)
+            if changed:
+                self.on_partial(changed)
+
+    def get_changed(self, tids: Dict[int, int]) -> Dict[int, Optional[int]]:
+        """
+        Returns the TIDs that differ from the ones sent, the nodes without logs yet as None
+        """
+        shown = self.shown
+        changed: Dict[int, Optional[int]] = {node: None for node, tid in shown.items()
+                                             if tid is not None and node not in tids}
+        for node, tid in tids.items():
+            if shown.get(node) != tid:
+                changed[node] = tid
+        shown.update(changed)
+        return changed
+
+
+def format_bytes(size: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_progress(progress: ScanProgress) -> str:
+    """
+    Returns the progress as it is shown to the user, like "Read 1.2 MB of 4.0 MB - 1,024 logs - about 3 s left",
+    only the logs when the bytes are not counted
+    """
+    parts = []
+    if progress.bytes_read > 0 or progress.bytes_total > 0:
+        parts.append(f"Read {format_bytes(progress.bytes_read)}"
+                     + (f" of {format_bytes(progress.bytes_total)}" if progress.bytes_total > 0 else ""))
+    parts.append(f"{progress.matched:,} logs")
+    eta = progress.eta
+    if eta is not None:
+        parts.append(f"about {eta:.0f} s left" if eta >= 1 else "less than a second left")
+    return " - ".join(parts)
@@ -0,0 +1,102 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Node of the time index that every log is counted in
+ALL_LOGS = "all_logs"
+TID_KEY = "tid"
+
+
+def tid_key(tid: int) -> Tuple[str, int]:
+    """
+    Returns the node of the time index that the logs of a TID are counted in
+    """
+    return TID_KEY, tid
+
+
+class NodeTimeIndex:
+    """
+    The logs of one node sorted by time.
+
+    times holds the distinct timestamps in order and cumulative the number of logs up to and including each
+    of them, so the number of logs in a window is the difference of two bisections. positions holds the
+    position of every log in the log file, in time order, so the logs of a window are a single slice of it.
+    """
+    __slots__ = ('times', 'cumulative', 'positions')
+
+    def __init__(self, entries: List[Tuple[int, int]]) -> None:
+        entries.sort()
+        self.times = array('q')
+        self.cumulative = array('q')
+        self.positions = array('q', (position for _, position in entries))
+        for count, (time, _) in enumerate(entries, 1):
+            if self.times and self.times[-1] == time:
+                self.cumulative[-1] = count
+            else:
+                self.times.append(time)
+                self.cumulative.append(count)
+
+    def _bounds(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        # The window includes both of its ends, like the time filter of the filter factory
+        first = bisect_left(self.times, start) if start is not None else 0
+        last = bisect_right(self.times, end) if end is not None else len(self.times)
+        return (self.cumulative[first - 1] if first else 0), (self.cumulative[last - 1] if last else 0)
+
+    def count(self, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        first, last = self._bounds(start, end)
+        return max(last - first, 0)
+
+    def slice(self, start: Optional[int] = None, end: Optional[int] = None) -> array:
+        first, last = self._bounds(start, end)
+        return self.positions[first:last]
+
+    def count_before(self, time: int) -> int:
+        """
+        Returns the number of logs before the time, not included
+        """
+        first = bisect_left(self.times, time)
+        return self.cumulative[first - 1] if first else 0
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+class TimeIndex:
+    """
+    Time index of the whole log file by node - the number and the positions of the logs of a node
+    in any time window, found by bisection without a pass over the logs.
+
+    A node is a node id of the topology table in the die area, an object outside it,
+    the key of a TID or ALL_LOGS.
+    Logs are added in any order, then build sorts them once.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, List[Tuple[int, int]]] = defaultdict(list)
+        self.nodes: Dict[Hashable, NodeTimeIndex] = {}
+        self.tids: List[int] = []  # The TIDs of the indexed logs, in order - sorted once by build
+        self.num_logs = 0
+
+    def add(self, node: Hashable, time: int, position: int) -> None:
+        self._entries[node].append((time, position))
+
+    def build(self, num_logs: int) -> None:
+        self.nodes = {node: NodeTimeIndex(entries) for node, entries in self._entries.items()}
+        self._entries = defaultdict(list)
+        self.tids = sorted(node[1] for node in self.nodes if isinstance(node, tuple) and node[0] == TID_KEY)
+        self.num_logs = num_logs
+
+    def count(self, node: Hashable, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        """
+        Returns the number of logs of the node from start to end, both included
+        """
+        index = self.nodes.get(node)
+        return index.count(start, end) if index is not None else 0
+
+    def slice(self, node: Hashable, start: Optional[int] = None, end: Optional[int] = None) -> array:
+        """
+        Returns the positions in the log file of the logs of the node from start to end, in time order
+        """
+        index = self.nodes.get(node)
+        return index.slice(start, end) if index is not None else array('q')
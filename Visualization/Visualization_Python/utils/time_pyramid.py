@@ -0,0 +1,108 @@
+from array import array
+from math import ceil
+from typing import Dict, Hashable, List, Optional
+
+from utils.time_index import TimeIndex, ALL_LOGS, tid_key
+
+# Widths of the time buckets of the levels of the pyramid in seconds, every width divides the next one
+BUCKET_WIDTHS = (1, 10, 60, 600, 3600, 21600, 86400)
+# Levels with more buckets than this are not kept, the time index counts the windows finer than the finest level
+MAX_BUCKETS = 4096
+
+
+class TimePyramid:
+    """
+    Counts of the logs of every node of a time index in time buckets of several widths - 1 second, 10 seconds,
+    a minute and so on, over the whole time range of the logs.
+
+    Every level keeps the cumulative count at the start of each of its buckets, so the number of logs of a node
+    in a range of buckets is a single difference. A histogram of any time range is then drawn in constant time
+    per column from the coarsest level whose buckets fit in a column. The levels of a node are built the first
+    time it's requested.
+    """
+
+    def __init__(self, time_index: TimeIndex, start_time: Optional[int] = None, end_time: Optional[int] = None,
+                 bucket_widths=BUCKET_WIDTHS, max_buckets: int = MAX_BUCKETS) -> None:
+        self.time_index = time_index
+        all_logs = time_index.nodes.get(ALL_LOGS)
+        if start_time is None:
+            start_time = all_logs.times[0] if all_logs else 0
+        if end_time is None:
+            end_time = all_logs.times[-1] if all_logs else start_time
+        self.start_time = start_time
+        self.end_time = max(end_time, start_time)
+        span = self.end_time - self.start_time + 1
+        # The coarsest level is kept even if it has too many buckets
+        self.bucket_widths = [width for width in bucket_widths if -(-span // width) <= max_buckets] or \
+                             [bucket_widths[-1]]
+        self._levels: Dict[Hashable, List[array]] = {}
+
+    def get_levels(self, node: Hashable) -> List[array]:
+        """
+        Returns the cumulative counts of the node at the start of every bucket of every level, and at the end
+        """
+        levels = self._levels.get(node)
+        if levels is None:
+            index = self.time_index.nodes.get(node)
+            levels = []
+            for width in self.bucket_widths:
+                num_buckets = -(-(self.end_time - self.start_time + 1) // width)
+                if index is None:
+                    levels.append(array('q', bytes(8 * (num_buckets + 1))))
+                else:
+                    levels.append(array('q', (index.count_before(self.start_time + bucket * width)
+                                              for bucket in range(num_buckets + 1))))
+            self._levels[node] = levels
+        return levels
+
+    def get_level(self, column_width: float) -> int:
+        """
+        Returns the level of the coarsest buckets that fit in a column of the width in seconds,
+        or -1 if the buckets of every level are wider
+        """
+        level = -1
+        for index, width in enumerate(self.bucket_widths):
+            if width > column_width:
+                break
+            level = index
+        return level
+
+    def count(self, node: Hashable, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        """
+        Returns the number of logs of the node from start to end, both included
+        """
+        if self.bucket_widths[0] == 1:
+            cumulative = self.get_levels(node)[0]
+            last_bucket = len(cumulative) - 1
+            first = 0 if start is None else min(max(start - self.start_time, 0), last_bucket)
+            last = last_bucket if end is None else min(max(end - self.start_time + 1, 0), last_bucket)
+            return max(cumulative[last] - cumulative[first], 0)
+        return self.time_index.count(node, start, end)
+
+    def get_active_tids(self, start: Optional[int] = None, end: Optional[int] = None) -> List[int]:
+        """
+        Returns the TIDs that have logs from start to end, both included
+        """
+        return [tid for tid in self.time_index.tids if self.count(tid_key(tid), start, end)]
+
+    def histogram(self, node: Hashable, start: int, end: int, columns: int) -> List[int]:
+        """
+        Returns the number of logs of the node in each of the columns that the time range from start to end,
+        both included, is split into. The columns are rounded to the buckets of the level drawn.
+        """
+        if columns <= 0 or end < start:
+            return []
+        column_width = (end - start + 1) / columns
+        level = self.get_level(column_width)
+        if level < 0:
+            # Zoomed in past the finest level, every column is a bisection of the time index
+            edges = [start + round(column * column_width) for column in range(columns + 1)]
+            return [self.time_index.count(node, edges[column], edges[column + 1] - 1) for column in range(columns)]
+
+        width = self.bucket_widths[level]
+        cumulative = self.get_levels(node)[level]
+        last_bucket = len(cumulative) - 1
+        # A bucket is drawn in the column its start falls in
+        edges = [min(max(ceil((start + column * column_width - self.start_time) / width), 0), last_bucket)
+                 for column in range(columns + 1)]
+        return [cumulative[edges[column + 1]] - cumulative[edges[column]] for column in range(columns)]
@@ -0,0 +1,338 @@
+from array import array
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from entities.component import Component
+from entities.quad import iter_clusters_data
+
+from utils.chip_dimensions import ChipDimensions
+from utils.constants import GRID, QUADS, ROW, COL
+from utils.error_messages import WarningMessages
+from utils.node_summary import get_dominant_tid
+from utils.tracing import traced
+from utils.type_names import DIE, QUAD, HBM, CLUSTER
+
+NO_NODE = -1
+
+# Node types of the table
+NODE_TYPES = [DIE, QUAD, HBM, CLUSTER]
+DIE_NODE, QUAD_NODE, HBM_NODE, CLUSTER_NODE = range(len(NODE_TYPES))
+
+
+class Topology:
+    """
+    Flat table of the die area of the chip - dies, quads, hbms and clusters - built once from chip_data.json.
+
+    Every node has an id, and its parent, type, die, quad, row, col and leaf ordinal are kept in arrays
+    indexed by the id. The leaves are the clusters and the hbms, the nodes which logs are routed to.
+    Ids are given parents first, so a rollup from the leaves is a single pass over the ids in reverse.
+    Routing is arithmetic - the position of a cluster in the chip grid indexes the id of its node.
+    The grid has the dimensions of the chip json, for any number of chips and dies.
+    """
+
+    # The arrays that make the table, saved to and restored from the topology cache
+    TABLE_ARRAYS = ('parent', 'node_type', 'die', 'quad', 'row', 'col', 'leaf_ordinal', 'leaf_nodes',
+                    'die_nodes', 'quad_nodes', 'hbm_nodes', 'cluster_nodes')
+
+    def __init__(self, dies_data: List[Dict[str, Any]], dimensions: Optional[ChipDimensions] = None,
+                 state: Optional[Dict[str, Any]] = None) -> None:
+        if state is not None:
+            dimensions = ChipDimensions.from_state(state['dimensions'])
+        self.dimensions = dimensions or ChipDimensions.from_chip_data(dies_data)
+        self.num_dies = self.dimensions.num_dies
+        num_quads = self.num_dies * self.dimensions.quads_per_die
+        self.parent = array('i')
+        self.node_type = array('b')
+        self.die = array('i')
+        self.quad = array('i')
+        self.row = array('i')
+        self.col = array('i')
+        self.leaf_ordinal = array('i')
+        self.leaf_nodes = array('i')  # Leaf ordinal -> node id
+        self.die_nodes = array('i', [NO_NODE] * self.num_dies)
+        self.quad_nodes = array('i', [NO_NODE] * num_quads)
+        self.hbm_nodes = array('i', [NO_NODE] * num_quads)
+        self.cluster_nodes = array('i', [NO_NODE] * self.dimensions.num_cluster_positions)
+        if state is None:
+            self.build(dies_data)
+        else:
+            for name in self.TABLE_ARRAYS:
+                setattr(self, name, array(getattr(self, name).typecode, state[name]))
+
+        # Activity of the nodes, the leaves are filled by the link pass and the other nodes by rollup
+        self.counts = array('q', [0] * len(self))
+        self.tids: List[Dict[int, int]] = [{} for _ in range(len(self))]  # TID -> number of logs
+        self.first_seen: List[Dict[int, int]] = [{} for _ in range(len(self))]  # TID -> order of its first log
+        self.sequence = 0
+        self.generation = 0  # The snapshot of the activity, a new one after every rollup
+        # The generation in which the activity of each node last changed, and what it was then
+        self.changed_generations = array('q', [0] * len(self))
+        self.rolled_counts = array('q', [-1] * len(self))
+        self.dominant_tids: List[Optional[int]] = [None] * len(self)  # The node is colored by it
+
+        # Loaded objects and what waits for the clusters and hbms that were not loaded yet
+        self.loaded: List[Optional[Component]] = [None] * len(self)
+        self.pending_units: Dict[int, Counter] = defaultdict(Counter)  # (area, unit, tid) -> number of logs
+        self.pending_logs: Dict[int, List[Any]] = defaultdict(list)
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'Topology':
+        """
+        Restores a table saved by get_state, without the chip json.
+        """
+        return cls([], state=state)
+
+    def get_state(self) -> Dict[str, Any]:
+        state = {name: getattr(self, name).tobytes() for name in self.TABLE_ARRAYS}
+        state['dimensions'] = self.dimensions.get_state()
+        return state
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def build(self, dies_data: List[Dict[str, Any]]) -> None:
+        dimensions = self.dimensions
+        for die_index, die_data in enumerate(dies_data):
+            die_node = self.add_node(NO_NODE, DIE_NODE, die_index)
+            self.die_nodes[die_index] = die_node
+            quads_data = die_data.get(GRID, {}).get(QUADS, [])[:dimensions.quads_per_die]
+            for quad_index, quad_data in enumerate(quads_data):
+                quad_node = self.add_node(die_node, QUAD_NODE, die_index, quad_index)
+                quad_position = dimensions.quad_position(die_index, quad_index)
+                self.quad_nodes[quad_position] = quad_node
+                self.hbm_nodes[quad_position] = self.add_node(quad_node, HBM_NODE, die_index, quad_index, is_leaf=True)
+                for row, col, _, _ in iter_clusters_data(quad_data):
+                    if not dimensions.is_valid(die_index, quad_index, row, col):
+                        raise ValueError(WarningMessages.INVALID_DATA.value.format(component=CLUSTER,
+                                                                                   data={ROW: row, COL: col}))
+                    cluster_node = self.add_node(quad_node, CLUSTER_NODE, die_index, quad_index, row, col, True)
+                    self.cluster_nodes[dimensions.cluster_position(die_index, quad_index, row, col)] = cluster_node
+
+    def add_node(self, parent: int, node_type: int, die: int, quad: int = -1, row: int = -1, col: int = -1,
+                 is_leaf: bool = False) -> int:
+        node = len(self.parent)
+        self.parent.append(parent)
+        self.node_type.append(node_type)
+        self.die.append(die)
+        self.quad.append(quad)
+        self.row.append(row)
+        self.col.append(col)
+        self.leaf_ordinal.append(len(self.leaf_nodes) if is_leaf else NO_NODE)
+        if is_leaf:
+            self.leaf_nodes.append(node)
+        return node
+
+    def get_die_node(self, die: int) -> int:
+        return self.die_nodes[die] if 0 <= die < self.num_dies else NO_NODE
+
+    def get_quad_node(self, die: int, quad: int) -> int:
+        if not self.dimensions.is_valid(die, quad):
+            return NO_NODE
+        return self.quad_nodes[self.dimensions.quad_position(die, quad)]
+
+    def get_hbm_node(self, die: int, quad: int) -> int:
+        if not self.dimensions.is_valid(die, quad):
+            return NO_NODE
+        return self.hbm_nodes[self.dimensions.quad_position(die, quad)]
+
+    def get_cluster_node(self, die: int, quad: int, row: int, col: int) -> int:
+        """
+        Returns the node of the cluster in the given address, or NO_NODE if the chip has no such cluster
+        """
+        if not self.dimensions.is_valid(die, quad, row, col):
+            return NO_NODE
+        return self.cluster_nodes[self.dimensions.cluster_position(die, quad, row, col)]
+
+    def get_address_node(self, address: Tuple[int, ...]) -> int:
+        """
+        Returns the node of a logical address - (die,), (die, quad) or (die, quad, row, col)
+        """
+        if len(address) == 1:
+            return self.get_die_node(*address)
+        if len(address) == 2:
+            return self.get_quad_node(*address)
+        return self.get_cluster_node(*address)
+
+    def get_address(self, node: int) -> Tuple[int, ...]:
+        """
+        Returns the logical address of a node - (die,), (die, quad) or (die, quad, row, col)
+        """
+        node_type = self.node_type[node]
+        if node_type == DIE_NODE:
+            return (self.die[node],)
+        if node_type in (QUAD_NODE, HBM_NODE):
+            return self.die[node], self.quad[node]
+        return self.die[node], self.quad[node], self.row[node], self.col[node]
+
+    def add(self, node: int, tid: int) -> None:
+        """
+        Counts a log of the TID in a leaf node
+        """
+        self.counts[node] += 1
+        tids = self.tids[node]
+        if tid in tids:
+            tids[tid] += 1
+        else:
+            tids[tid] = 1
+            self.first_seen[node][tid] = self.sequence
+        self.sequence += 1
+
+    @traced()
+    def rollup(self) -> None:
+        """
+        Recomputes the activity of the dies and quads from the activity of their clusters.
+        """
+        for node in range(len(self)):
+            if self.leaf_ordinal[node] == NO_NODE:
+                self.counts[node] = 0
+                self.tids[node] = {}
+                self.first_seen[node] = {}
+        for node in range(len(self) - 1, -1, -1):
+            parent = self.parent[node]
+            # The hbm is shown by the quad widget on its own, it is not a part of the quad activity
+            if parent == NO_NODE or self.node_type[node] == HBM_NODE or not self.counts[node]:
+                continue
+            self.counts[parent] += self.counts[node]
+            parent_tids, parent_first_seen = self.tids[parent], self.first_seen[parent]
+            first_seen = self.first_seen[node]
+            for tid, count in self.tids[node].items():
+                parent_tids[tid] = parent_tids.get(tid, 0) + count
+                if first_seen[tid] < parent_first_seen.get(tid, self.sequence):
+                    parent_first_seen[tid] = first_seen[tid]
+        # The TIDs of a node are kept in the order they first entered it
+        for node in range(len(self)):
+            if self.leaf_ordinal[node] == NO_NODE and self.tids[node]:
+                first_seen = self.first_seen[node]
+                self.tids[node] = {tid: self.tids[node][tid] for tid in sorted(first_seen, key=first_seen.get)}
+        self.generation += 1
+        self.diff_rollup()
+
+    def diff_rollup(self) -> None:
+        """
+        Keeps the dominant TID of every node and tags the nodes whose count or dominant TID differs from the
+        previous rollup with the new generation
+        """
+        counts, rolled_counts, dominant_tids = self.counts, self.rolled_counts, self.dominant_tids
+        for node in range(len(self)):
+            tid = get_dominant_tid(self.tids[node])
+            if counts[node] != rolled_counts[node] or tid != dominant_tids[node]:
+                rolled_counts[node] = counts[node]
+                dominant_tids[node] = tid
+                self.changed_generations[node] = self.generation
+
+    def get_partial_tids(self) -> Dict[int, int]:
+        """
+        Returns the dominant TID of every node with logs so far, without a rollup - for the leaves of their own
+        logs, for the dies and quads of the logs of their clusters. The activity shown while a pass still links.
+        """
+        partial: Dict[int, Counter] = defaultdict(Counter)  # Node -> number of logs by TID
+        for node in self.leaf_nodes:
+            tids = self.tids[node]
+            if not tids:
+                continue
+            partial[node].update(tids)
+            if self.node_type[node] == HBM_NODE:
+                continue
+            parent = self.parent[node]
+            while parent != NO_NODE:
+                partial[parent].update(tids)
+                parent = self.parent[parent]
+        return {node: get_dominant_tid(tids) for node, tids in partial.items()}
+
+    def get_dominant_tids(self) -> Dict[int, int]:
+        """
+        Returns the dominant TID of every node with logs in the last rollup
+        """
+        return {node: tid for node, tid in enumerate(self.dominant_tids) if tid is not None}
+
+    def mark_changed(self, nodes: List[int]) -> None:
+        """
+        Starts a new generation in which the nodes changed, though their activity did not - like their is_enable
+        """
+        self.generation += 1
+        for node in nodes:
+            self.changed_generations[node] = self.generation
+
+    def get_changed_nodes(self, generation: int) -> List[int]:
+        """
+        Returns the nodes that changed after the generation
+        """
+        return [node for node, changed in enumerate(self.changed_generations) if changed > generation]
+
+    def reset(self) -> None:
+        """
+        Clears the activity of all the nodes and everything that waits for objects to be loaded.
+        """
+        self.counts = array('q', bytes(self.counts.itemsize * len(self)))
+        self.tids = [{} for _ in range(len(self))]
+        self.first_seen = [{} for _ in range(len(self))]
+        self.sequence = 0
+        self.pending_units.clear()
+        self.pending_logs.clear()
+
+    def get_summary(self, node: int) -> 'TopologySummary':
+        return TopologySummary(self, node)
+
+    def register(self, node: int, component: Component) -> None:
+        """
+        Registers the loaded object of a node, the object becomes a view of the node's activity.
+        """
+        self.loaded[node] = component
+        component.summary = self.get_summary(node)
+
+    def add_pending_unit(self, node: int, area: str, unit: str, tid: int) -> None:
+        self.pending_units[node][(area, unit, tid)] += 1
+
+    def add_pending_log(self, node: int, log) -> None:
+        self.pending_logs[node].append(log)
+
+    def drop_pending_logs(self) -> None:
+        """
+        Forgets the logs that wait for their objects, the unit activity is kept
+        """
+        self.pending_logs.clear()
+
+    def pop_pending(self, node: int) -> Tuple[Counter, List[Any]]:
+        """
+        Returns and forgets the unit activity and the logs that wait for the object of the node.
+        """
+        return self.pending_units.pop(node, Counter()), self.pending_logs.pop(node, [])
+
+
+class TopologySummary:
+    """
+    Activity summary of a node of the topology table, read from the table.
+    Has the same interface as NodeSummary, so a loaded die, quad, hbm or cluster is a view of its node.
+    """
+    __slots__ = ('topology', 'node')
+
+    def __init__(self, topology: Topology, node: int) -> None:
+        self.topology = topology
+        self.node = node
+
+    @property
+    def count(self) -> int:
+        return self.topology.counts[self.node]
+
+    @property
+    def tids(self) -> Dict[int, int]:
+        return self.topology.tids[self.node]
+
+    @property
+    def has_activity(self) -> bool:
+        return self.count > 0
+
+    @property
+    def first_tid(self) -> Optional[int]:
+        return next(iter(self.tids), None)
+
+    @property
+    def dominant_tid(self) -> Optional[int]:
+        return self.topology.dominant_tids[self.node]
+
+    def get_tids(self) -> List[int]:
+        return list(self.tids)
+
+    def clear(self) -> None:
+        # The table is reset as a whole by Topology.reset
+        pass
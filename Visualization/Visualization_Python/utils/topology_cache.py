@@ -0,0 +1,71 @@
+import hashlib
+import logging
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from utils.error_messages import WarningMessages
+from utils.paths import CACHE_DIR
+
+# Bump when the layout of the cached state changes, older caches are then rebuilt
+CACHE_VERSION = 3
+CACHE_FILE = "topology-{key}.bin"
+CHUNK_SIZE = 1 << 20
+
+logger = logging.getLogger(__name__)
+
+
+def get_content_key(*filenames: str) -> str:
+    """
+    Returns a hash of the content of the files, the files are read but not parsed.
+    """
+    digest = hashlib.sha256()
+    for filename in filenames:
+        with open(filename, 'rb') as file:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_cache_dir(input_file: str) -> str:
+    """
+    Returns the cache directory of an input file, next to the file - not in the working directory.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(input_file)), CACHE_DIR)
+
+
+def get_cache_path(key: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, CACHE_FILE.format(key=key[:32]))
+
+
+def load_topology_cache(key: str, cache_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached state for the content key, or None if there is no valid cache for it.
+    """
+    try:
+        with open(get_cache_path(key, cache_dir), 'rb') as file:
+            header = pickle.load(file)
+            if header != (CACHE_VERSION, key):
+                return None
+            return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+        return None
+
+
+def save_topology_cache(key: str, state: Dict[str, Any], cache_dir: str) -> None:
+    """
+    Writes the state to the cache of the content key. A failure to write only costs the next startup time.
+    """
+    path = get_cache_path(key, cache_dir)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, 'wb') as file:
+            pickle.dump((CACHE_VERSION, key), file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(state, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(WarningMessages.CACHE_NOT_SAVED.value.format(filename=path, error=e))
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
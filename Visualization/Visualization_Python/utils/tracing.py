@@ -0,0 +1,171 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+# Tracing is off unless the trace file is given, it is decided once when the module is imported
+TRACE_FILE_ENV = "VISUALIZATION_TRACE"
+AGGREGATED_LANE = "aggregated"  # The lane of the totals of the helpers called per log
+
+Function = TypeVar('Function', bound=Callable[..., Any])
+
+
+class Tracer:
+    """
+    Timing spans of the pipeline, saved as a Chrome trace - open it in chrome://tracing or ui.perfetto.dev.
+
+    A span is a complete event on the lane of its thread. The helpers that run once per log would make
+    millions of events, so their time and calls are summed instead, and every span that collects them
+    adds the totals since it started as events on a lane of their own.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self.lanes: Dict[Any, int] = {}  # Thread ident or lane name -> tid of the trace
+        self.totals: Dict[str, List[int]] = {}  # Name -> [nanoseconds, calls]
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def get_lane(self, key: Any, name: str) -> int:
+        lane = self.lanes.get(key)
+        if lane is None:
+            with self._lock:
+                lane = self.lanes.setdefault(key, len(self.lanes) + 1)
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': lane,
+                                    'args': {'name': name}})
+        return lane
+
+    def add_span(self, name: str, start_ns: int, end_ns: int, args: Optional[Dict[str, Any]] = None) -> None:
+        thread = threading.current_thread()
+        event = {'name': name, 'ph': 'X', 'pid': self.pid, 'tid': self.get_lane(thread.ident, thread.name),
+                 'ts': start_ns / 1000, 'dur': (end_ns - start_ns) / 1000}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def add_instant(self, name: str, args: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        self.events.append({'name': name, 'ph': 'i', 's': 't', 'pid': self.pid,
+                            'tid': self.get_lane(thread.ident, thread.name),
+                            'ts': time.perf_counter_ns() / 1000, 'args': args})
+
+    def add_total(self, name: str, elapsed_ns: int) -> None:
+        total = self.totals.get(name)
+        if total is None:
+            self.totals[name] = [elapsed_ns, 1]
+        else:
+            total[0] += elapsed_ns
+            total[1] += 1
+
+    def collect_totals(self, start_ns: int) -> None:
+        """
+        Adds the totals summed since the start of a span, from its start, and clears them
+        """
+        lane = self.get_lane(AGGREGATED_LANE, AGGREGATED_LANE)
+        for name, (elapsed_ns, calls) in self.totals.items():
+            self.events.append({'name': name, 'ph': 'X', 'pid': self.pid, 'tid': lane, 'ts': start_ns / 1000,
+                                'dur': elapsed_ns / 1000, 'args': {'calls': calls}})
+        self.totals = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file)
+
+
+class Span:
+    """
+    Times the block it is entered for, the totals of the helpers called in it are added when collect is set
+    """
+
+    __slots__ = ('tracer', 'name', 'args', 'collect', 'start_ns')
+
+    def __init__(self, tracer: Tracer, name: str, args: Dict[str, Any], collect: bool = False) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.collect = collect
+        self.start_ns = 0
+
+    def __enter__(self) -> 'Span':
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.tracer.add_span(self.name, self.start_ns, time.perf_counter_ns(), self.args)
+        if self.collect:
+            self.tracer.collect_totals(self.start_ns)
+
+
+def trace_span(name: str, **args: Any) -> Any:
+    """
+    Returns a context manager that times a block as a span, or one that does nothing when tracing is off
+    """
+    return Span(tracer, name, args) if tracer is not None else nullcontext()
+
+
+def trace_instant(name: str, get_args: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Marks a moment with the values get_args returns, it is not called when tracing is off
+    """
+    if tracer is not None:
+        tracer.add_instant(name, get_args())
+
+
+def traced(name: Optional[str] = None, collect: bool = False) -> Callable[[Function], Function]:
+    """
+    Times every call of the function as a span. When tracing is off the function is returned as it is.
+    """
+    def decorator(function: Function) -> Function:
+        if tracer is None:
+            return function
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with Span(tracer, span_name, {}, collect):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_total(name: Optional[str] = None) -> Callable[[Function], Function]:
+    """
+    Sums the time and calls of a function called per log, added to the trace by the span that collects them.
+    When tracing is off the function is returned as it is.
+    """
+    def decorator(function: Function) -> Function:
+        if tracer is None:
+            return function
+        total_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start_ns = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                tracer.add_total(total_name, time.perf_counter_ns() - start_ns)
+        return wrapper
+    return decorator
+
+
+def start_tracing(path: str) -> Tracer:
+    """
+    Turns tracing on for the functions decorated after it, the trace is saved to the file at exit
+    """
+    global tracer
+    tracer = Tracer()
+    atexit.register(tracer.save, path)
+    return tracer
+
+
+tracer: Optional[Tracer] = None
+if os.environ.get(TRACE_FILE_ENV):
+    start_tracing(os.environ[TRACE_FILE_ENV])
@@ -2,6 +2,7 @@ DIE = "die"
 DIE1 = "DIE 1"
 DIE2 = "DIE 2"
 QUAD = "quad"
+CLUSTER = "cluster"
 
 CBU = "Cbu"
 TCU = "Tcu"
@@ -0,0 +1,159 @@
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+import filter_factory_module
+
+from utils.filter_types import FILTER_TYPES_NAMES, TIMERANGE
+from utils.multi_query import MultiQueryScan, FilterSpec, normalize_filter_keys
+
+MAX_CACHED_SPANS = 4
+# The prefetch thread gives up the interpreter after this many logs, so the GUI thread runs first
+YIELD_EVERY_LOGS = 256
+
+# A time window - its first and last second, both included
+Window = Tuple[int, int]
+
+
+def get_filters_key(filters: FilterSpec) -> Hashable:
+    """
+    Returns the key of the filters, the same for equal filters in any shape
+    """
+    return tuple((filter_type, normalize_filter_keys(filter_type, values)) for filter_type, values in filters)
+
+
+def get_prefetch_span(window: Window) -> Window:
+    """
+    Returns the span prefetched around a window - a width of the window before it and after it. The windows
+    the timeline asks for next are in it: a step of the playback moves the window by a bucket, and a release
+    of the slider moves one of its handles.
+    """
+    start, end = window
+    width = end - start + 1
+    return start - width, end + width
+
+
+class PrefetchedSpan:
+    """
+    The logs of a span of time that passed the filters, ordered by their time, so the logs of any window in the
+    span are a slice of them.
+    """
+
+    __slots__ = ('span', 'filters_key', 'times', 'logs')
+
+    def __init__(self, span: Window, filters_key: Hashable, logs: List[Any]) -> None:
+        self.span = span
+        self.filters_key = filters_key
+        self.logs = sorted(logs, key=lambda log: log.timeStamp)
+        self.times = [log.timeStamp for log in self.logs]
+
+    def covers(self, window: Window, filters_key: Hashable) -> bool:
+        return filters_key == self.filters_key and self.span[0] <= window[0] and window[1] <= self.span[1]
+
+    def get_logs(self, window: Window) -> List[Any]:
+        return self.logs[bisect_left(self.times, window[0]):bisect_right(self.times, window[1])]
+
+
+class WindowPrefetcher:
+    """
+    Background scan of the time around the window shown, so the next window of the timeline is linked from
+    memory instead of the log file.
+
+    The logs that pass the filters are kept for the last few spans, and a window is served from any span
+    that covers it under the same filters. A prefetch runs on a daemon thread and is cancelled by the next
+    request of the user - its results are then dropped.
+    """
+
+    def __init__(self, log_file: str, accept_log: Callable[[Any], bool],
+                 create_factory: Callable[[str], Any] = filter_factory_module.FilterFactory) -> None:
+        self.log_file = log_file
+        self.accept_log = accept_log  # Logs that are not accepted are left out of the spans
+        self.create_factory = create_factory  # The filter chain that reads a span, apart from the one of the GUI
+        self.spans: "OrderedDict[Hashable, PrefetchedSpan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cancel_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, window: Window, filters: FilterSpec) -> Optional[List[Any]]:
+        """
+        Returns the logs of the window under the filters, or None if no prefetched span covers it
+        """
+        filters_key = get_filters_key(filters)
+        with self._lock:
+            for key, span in self.spans.items():
+                if span.covers(window, filters_key):
+                    self.spans.move_to_end(key)
+                    return span.get_logs(window)
+        return None
+
+    def prefetch(self, span: Window, filters: FilterSpec) -> None:
+        """
+        Starts the scan of the span if no span kept covers it, the previous scan is cancelled
+        """
+        self.cancel()
+        filters = list(filters)
+        filters_key = get_filters_key(filters)
+        with self._lock:
+            if any(kept.covers(span, filters_key) for kept in self.spans.values()):
+                return
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+        self._thread = threading.Thread(target=self._scan, args=(span, filters, cancel_event), daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    def clear(self) -> None:
+        self.cancel()
+        with self._lock:
+            self.spans.clear()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the scan that runs, if any
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _scan(self, span: Window, filters: FilterSpec, cancel_event: threading.Event) -> None:
+        scan = MultiQueryScan([filters + [(FILTER_TYPES_NAMES[TIMERANGE], span)]])
+        scan_factory = self.create_factory(self.log_file)
+        scanned = 0
+        try:
+            scan_factory.set_start_time(span[0])
+            scan_factory.set_end_time(span[1])
+            scan_factory.start_logs()
+            while not scan_factory.is_finished_process() or scan_factory.has_log():
+                if cancel_event.is_set():
+                    return
+                if not scan_factory.has_log():
+                    time.sleep(0)
+                    continue
+                log = scan_factory.get_log()
+                if self.accept_log(log):
+                    scan.feed(log)
+                scanned += 1
+                if scanned % YIELD_EVERY_LOGS == 0:
+                    time.sleep(0)
+        except ValueError:
+            return  # A failed prefetch only means the window is read from the file when it's requested
+        finally:
+            scan_factory.join_thread()
+
+        filters_key = get_filters_key(filters)
+        prefetched = PrefetchedSpan(span, filters_key, scan.results[0])
+        with self._lock:
+            if cancel_event.is_set():
+                return
+            self.spans[(span, filters_key)] = prefetched
+            while len(self.spans) > MAX_CACHED_SPANS:
+                self.spans.popitem(last=False)